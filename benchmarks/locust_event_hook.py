@@ -0,0 +1,89 @@
+"""
+Микробенчмарк накладных расходов HTTPX event hook'ов, репортящих метрики в Locust.
+
+Сравнивает прежнюю реализацию (time.time, raise_for_status на каждый ответ, len(response.read()))
+с текущей из clients.http.event_hooks.locust_event_hook на заранее созданных ответах, без сети.
+
+Запуск: python -m benchmarks.locust_event_hook --number 200000
+"""
+import argparse
+import time
+import timeit
+
+from httpx import HTTPError, HTTPStatusError, Request, Response
+from locust.env import Environment
+
+from clients.http.event_hooks.locust_event_hook import locust_request_event_hook, locust_response_event_hook
+
+
+def legacy_request_event_hook(request: Request) -> None:
+    request.extensions["start_time"] = time.time()
+
+
+def legacy_response_event_hook(environment: Environment):
+    def inner(response: Response) -> None:
+        exception: HTTPError | HTTPStatusError | None = None
+
+        try:
+            response = response.raise_for_status()
+        except (HTTPError, HTTPStatusError) as error:
+            exception = error
+
+        request = response.request
+        route = request.extensions.get("route", request.url.path)
+        start_time = request.extensions.get("start_time", time.time())
+        response_time = (time.time() - start_time) * 1000
+        response_length = len(response.read())
+
+        environment.events.request.fire(
+            name=f"{request.method} {route}",
+            context=None,
+            response=response,
+            exception=exception,
+            request_type="HTTP",
+            response_time=response_time,
+            response_length=response_length,
+        )
+
+    return inner
+
+
+def build_response(status_code: int, body: bytes) -> Response:
+    """
+    Создаёт уже прочитанный ответ с Content-Length, как его видит response hook.
+    """
+    request = Request("GET", "http://localhost:8003/api/v1/operations", extensions={"route": "/api/v1/operations"})
+    return Response(status_code, content=body, request=request)
+
+
+def measure(request_hook, response_hook, response: Response, number: int) -> float:
+    """
+    Возвращает среднее время пары хуков на один запрос, в микросекундах.
+    """
+    def run():
+        request_hook(response.request)
+        response_hook(response)
+
+    return min(timeit.repeat(run, number=number, repeat=5)) / number * 1_000_000
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Накладные расходы Locust event hook'ов на запрос")
+    parser.add_argument("--number", type=int, default=100_000, help="Количество вызовов в одном замере")
+    parser.add_argument("--size", type=int, default=16_384, help="Размер тела ответа в байтах")
+    arguments = parser.parse_args()
+
+    environment = Environment()
+    # Слушатель-заглушка: измеряем сами хуки, а не агрегацию статистики Locust
+    environment.events.request.add_listener(lambda **kwargs: None)
+
+    body = b"x" * arguments.size
+    for label, status_code in (("200 OK", 200), ("500 Error", 500)):
+        response = build_response(status_code, body)
+        legacy = measure(
+            legacy_request_event_hook, legacy_response_event_hook(environment), response, arguments.number
+        )
+        current = measure(
+            locust_request_event_hook, locust_response_event_hook(environment), response, arguments.number
+        )
+        print(f"{label:>10}: legacy {legacy:6.2f} us, current {current:6.2f} us ({legacy / current:.1f}x)")
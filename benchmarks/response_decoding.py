@@ -0,0 +1,77 @@
+"""
+Микробенчмарк разбора ответов HTTP gateway: model_validate_json по response.text и по response.content.
+
+response.text декодирует всё тело из bytes в str (с определением кодировки), после чего pydantic
+снова разбирает строку; response.content отдаёт pydantic исходные байты без промежуточной копии.
+Замер на GetOperationsResponseSchema с большим списком операций, без сети.
+
+Запуск: python -m benchmarks.response_decoding --operations 1000 5000
+"""
+import argparse
+import json
+import timeit
+import uuid
+
+from httpx import Request, Response
+
+from clients.http.gateway.operations.schema import GetOperationsResponseSchema, OperationStatus, OperationType
+
+
+def build_operations_payload(count: int) -> bytes:
+    """
+    Создаёт JSON-тело ответа GET /api/v1/operations с count операциями.
+    """
+    operations = [
+        {
+            "id": str(uuid.uuid4()),
+            "type": OperationType.PURCHASE,
+            "status": OperationStatus.COMPLETED,
+            "amount": 123.45,
+            "cardId": str(uuid.uuid4()),
+            "accountId": str(uuid.uuid4()),
+            "category": "supermarkets",
+            "createdAt": "2025-06-01T12:00:00.000000"
+        }
+        for _ in range(count)
+    ]
+    return json.dumps({"operations": operations}).encode()
+
+
+def build_response(body: bytes) -> Response:
+    """
+    Создаёт свежий ответ: у каждого ответа httpx декодирует text заново.
+    """
+    return Response(200, content=body, request=Request("GET", "http://localhost:8003/api/v1/operations"))
+
+
+def measure(parse, body: bytes, number: int, repeat: int = 5) -> float:
+    """
+    Возвращает среднее время разбора одного ответа (лучшее из repeat замеров), в микросекундах.
+    """
+    timings = []
+    for _ in range(repeat):
+        iterator = iter([build_response(body) for _ in range(number)])
+        timings.append(timeit.timeit(lambda: parse(next(iterator)), number=number))
+
+    return min(timings) / number * 1_000_000
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Разбор ответов gateway из text и из content")
+    parser.add_argument("--operations", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--number", type=int, default=200, help="Количество ответов в одном замере")
+    arguments = parser.parse_args()
+
+    for count in arguments.operations:
+        body = build_operations_payload(count)
+        decode = measure(lambda response: response.text, body, arguments.number)
+        text = measure(
+            lambda response: GetOperationsResponseSchema.model_validate_json(response.text), body, arguments.number
+        )
+        content = measure(
+            lambda response: GetOperationsResponseSchema.model_validate_json(response.content), body, arguments.number
+        )
+        print(
+            f"{count:>6} operations ({len(body) // 1024} KiB): decode {decode:8.1f} us, "
+            f"text {text:9.1f} us, content {content:9.1f} us ({text / content:.2f}x)"
+        )
@@ -2,7 +2,7 @@
 import grpc.experimental.gevent as grpc_gevent
 
 # Импортируем тип канала связи (channel), через который будем общаться с сервером
-from grpc import Channel
+from grpc import Channel, aio
 
 # Инициализируем поддержку gevent в gRPC.
 # Это обязательно, если вы используете gevent-базированный фреймворк (например, Locust).
@@ -29,3 +29,24 @@ class GRPCClient:
                         Обычно создаётся один раз и переиспользуется.
         """
         self.channel = channel  # Сохраняем канал внутри объекта для последующего использования
+
+
+class AsyncGRPCClient:
+    """
+    Базовый класс асинхронного gRPC-клиента на grpc.aio.
+
+    Используется асинхронным движком сидинга. grpc.aio работает только в процессе
+    без monkey-patching gevent, поэтому такие клиенты не применяются внутри Locust.
+    """
+
+    def __init__(self, channel: aio.Channel):
+        """
+        :param channel: Асинхронный gRPC-канал (grpc.aio.Channel).
+        """
+        self.channel = channel
+
+    async def close(self) -> None:
+        """
+        Закрывает gRPC-канал.
+        """
+        await self.channel.close()
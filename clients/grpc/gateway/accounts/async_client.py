@@ -0,0 +1,90 @@
+from grpc import aio
+
+from clients.grpc.client import AsyncGRPCClient
+from clients.grpc.gateway.client import build_gateway_async_grpc_client
+from contracts.services.gateway.accounts.accounts_gateway_service_pb2_grpc import AccountsGatewayServiceStub
+from contracts.services.gateway.accounts.rpc_open_credit_card_account_pb2 import (
+    OpenCreditCardAccountRequest,
+    OpenCreditCardAccountResponse
+)
+from contracts.services.gateway.accounts.rpc_open_debit_card_account_pb2 import (
+    OpenDebitCardAccountRequest,
+    OpenDebitCardAccountResponse
+)
+from contracts.services.gateway.accounts.rpc_open_deposit_account_pb2 import (
+    OpenDepositAccountRequest,
+    OpenDepositAccountResponse
+)
+from contracts.services.gateway.accounts.rpc_open_savings_account_pb2 import (
+    OpenSavingsAccountRequest,
+    OpenSavingsAccountResponse
+)
+
+
+class AsyncAccountsGatewayGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент для открытия счетов через AccountsGatewayService.
+    """
+
+    def __init__(self, channel: aio.Channel):
+        """
+        :param channel: Асинхронный gRPC-канал для подключения к AccountsGatewayService.
+        """
+        super().__init__(channel)
+
+        self.stub = AccountsGatewayServiceStub(channel)
+
+    async def open_deposit_account_api(self, request: OpenDepositAccountRequest) -> OpenDepositAccountResponse:
+        """
+        Низкоуровневый вызов метода OpenDepositAccount через gRPC.
+        """
+        return await self.stub.OpenDepositAccount(request)
+
+    async def open_savings_account_api(self, request: OpenSavingsAccountRequest) -> OpenSavingsAccountResponse:
+        """
+        Низкоуровневый вызов метода OpenSavingsAccount через gRPC.
+        """
+        return await self.stub.OpenSavingsAccount(request)
+
+    async def open_debit_card_account_api(
+        self,
+        request: OpenDebitCardAccountRequest
+    ) -> OpenDebitCardAccountResponse:
+        """
+        Низкоуровневый вызов метода OpenDebitCardAccount через gRPC.
+        """
+        return await self.stub.OpenDebitCardAccount(request)
+
+    async def open_credit_card_account_api(
+        self,
+        request: OpenCreditCardAccountRequest
+    ) -> OpenCreditCardAccountResponse:
+        """
+        Низкоуровневый вызов метода OpenCreditCardAccount через gRPC.
+        """
+        return await self.stub.OpenCreditCardAccount(request)
+
+    async def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponse:
+        request = OpenDepositAccountRequest(user_id=user_id)
+        return await self.open_deposit_account_api(request)
+
+    async def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponse:
+        request = OpenSavingsAccountRequest(user_id=user_id)
+        return await self.open_savings_account_api(request)
+
+    async def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponse:
+        request = OpenDebitCardAccountRequest(user_id=user_id)
+        return await self.open_debit_card_account_api(request)
+
+    async def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponse:
+        request = OpenCreditCardAccountRequest(user_id=user_id)
+        return await self.open_credit_card_account_api(request)
+
+
+def build_accounts_gateway_async_grpc_client() -> AsyncAccountsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AsyncAccountsGatewayGRPCClient.
+
+    :return: Инициализированный асинхронный клиент для AccountsGatewayService.
+    """
+    return AsyncAccountsGatewayGRPCClient(channel=build_gateway_async_grpc_client())
@@ -0,0 +1,56 @@
+from grpc import aio
+
+from clients.grpc.client import AsyncGRPCClient
+from clients.grpc.gateway.client import build_gateway_async_grpc_client
+from contracts.services.gateway.cards.cards_gateway_service_pb2_grpc import CardsGatewayServiceStub
+from contracts.services.gateway.cards.rpc_issue_physical_card_pb2 import (
+    IssuePhysicalCardRequest,
+    IssuePhysicalCardResponse
+)
+from contracts.services.gateway.cards.rpc_issue_virtual_card_pb2 import (
+    IssueVirtualCardRequest,
+    IssueVirtualCardResponse
+)
+
+
+class AsyncCardsGatewayGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент для выпуска карт через CardsGatewayService.
+    """
+
+    def __init__(self, channel: aio.Channel):
+        """
+        :param channel: Асинхронный gRPC-канал для подключения к CardsGatewayService.
+        """
+        super().__init__(channel)
+
+        self.stub = CardsGatewayServiceStub(channel)
+
+    async def issue_virtual_card_api(self, request: IssueVirtualCardRequest) -> IssueVirtualCardResponse:
+        """
+        Низкоуровневый вызов метода IssueVirtualCard через gRPC.
+        """
+        return await self.stub.IssueVirtualCard(request)
+
+    async def issue_physical_card_api(self, request: IssuePhysicalCardRequest) -> IssuePhysicalCardResponse:
+        """
+        Низкоуровневый вызов метода IssuePhysicalCard через gRPC.
+        """
+        return await self.stub.IssuePhysicalCard(request)
+
+    async def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponse:
+        request = IssueVirtualCardRequest(user_id=user_id, account_id=account_id)
+        return await self.issue_virtual_card_api(request)
+
+    async def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponse:
+        request = IssuePhysicalCardRequest(user_id=user_id, account_id=account_id)
+        return await self.issue_physical_card_api(request)
+
+
+def build_cards_gateway_async_grpc_client() -> AsyncCardsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AsyncCardsGatewayGRPCClient.
+
+    :return: Инициализированный асинхронный клиент для CardsGatewayService.
+    """
+    return AsyncCardsGatewayGRPCClient(channel=build_gateway_async_grpc_client())
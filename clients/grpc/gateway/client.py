@@ -1,4 +1,4 @@
-from grpc import Channel, insecure_channel, intercept_channel
+from grpc import Channel, aio, insecure_channel, intercept_channel
 from locust.env import Environment
 
 from clients.grpc.interceptors.locust_interceptor import LocustInterceptor
@@ -15,6 +15,16 @@ def build_gateway_grpc_client() -> Channel:
     return insecure_channel(settings.gateway_grpc_client.client_url)
 
 
+def build_gateway_async_grpc_client() -> aio.Channel:
+    """
+    Фабричная функция для создания асинхронного gRPC-канала (grpc.aio) к сервису grpc-gateway.
+    Вызывается внутри запущенного event loop — канал привязывается к нему.
+
+    :return: Асинхронный gRPC-канал.
+    """
+    return aio.insecure_channel(settings.gateway_grpc_client.client_url)
+
+
 def build_gateway_locust_grpc_client(environment: Environment) -> Channel:
     """
     Фабричная функция для создания gRPC-канала, адаптированного для Locust.
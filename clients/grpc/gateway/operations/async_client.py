@@ -0,0 +1,120 @@
+from grpc import aio
+
+from clients.grpc.client import AsyncGRPCClient
+from clients.grpc.gateway.client import build_gateway_async_grpc_client
+from contracts.services.gateway.operations.operations_gateway_service_pb2_grpc import OperationsGatewayServiceStub
+from contracts.services.gateway.operations.rpc_make_cash_withdrawal_operation_pb2 import (
+    MakeCashWithdrawalOperationRequest,
+    MakeCashWithdrawalOperationResponse
+)
+from contracts.services.gateway.operations.rpc_make_purchase_operation_pb2 import (
+    MakePurchaseOperationRequest,
+    MakePurchaseOperationResponse
+)
+from contracts.services.gateway.operations.rpc_make_top_up_operation_pb2 import (
+    MakeTopUpOperationRequest,
+    MakeTopUpOperationResponse
+)
+from contracts.services.gateway.operations.rpc_make_transfer_operation_pb2 import (
+    MakeTransferOperationRequest,
+    MakeTransferOperationResponse
+)
+from contracts.services.operations.operation_pb2 import OperationStatus
+from tools.fakers import fake
+
+
+class AsyncOperationsGatewayGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент для создания операций через OperationsGatewayService.
+    """
+
+    def __init__(self, channel: aio.Channel):
+        """
+        :param channel: Асинхронный gRPC-канал для подключения к OperationsGatewayService.
+        """
+        super().__init__(channel)
+
+        self.stub = OperationsGatewayServiceStub(channel)
+
+    async def make_top_up_operation_api(self, request: MakeTopUpOperationRequest) -> MakeTopUpOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeTopUpOperation через gRPC.
+        """
+        return await self.stub.MakeTopUpOperation(request)
+
+    async def make_transfer_operation_api(
+        self,
+        request: MakeTransferOperationRequest
+    ) -> MakeTransferOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeTransferOperation через gRPC.
+        """
+        return await self.stub.MakeTransferOperation(request)
+
+    async def make_purchase_operation_api(
+        self,
+        request: MakePurchaseOperationRequest
+    ) -> MakePurchaseOperationResponse:
+        """
+        Низкоуровневый вызов метода MakePurchaseOperation через gRPC.
+        """
+        return await self.stub.MakePurchaseOperation(request)
+
+    async def make_cash_withdrawal_operation_api(
+        self,
+        request: MakeCashWithdrawalOperationRequest
+    ) -> MakeCashWithdrawalOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeCashWithdrawalOperation через gRPC.
+        """
+        return await self.stub.MakeCashWithdrawalOperation(request)
+
+    async def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponse:
+        request = MakeTopUpOperationRequest(
+            card_id=card_id,
+            account_id=account_id,
+            amount=fake.amount(),
+            status=fake.proto_enum(OperationStatus),
+        )
+        return await self.make_top_up_operation_api(request)
+
+    async def make_transfer_operation(self, card_id: str, account_id: str) -> MakeTransferOperationResponse:
+        request = MakeTransferOperationRequest(
+            card_id=card_id,
+            account_id=account_id,
+            amount=fake.amount(),
+            status=fake.proto_enum(OperationStatus),
+        )
+        return await self.make_transfer_operation_api(request)
+
+    async def make_purchase_operation(self, card_id: str, account_id: str) -> MakePurchaseOperationResponse:
+        request = MakePurchaseOperationRequest(
+            card_id=card_id,
+            account_id=account_id,
+            amount=fake.amount(),
+            status=fake.proto_enum(OperationStatus),
+            category=fake.category(),
+        )
+        return await self.make_purchase_operation_api(request)
+
+    async def make_cash_withdrawal_operation(
+        self,
+        card_id: str,
+        account_id: str
+    ) -> MakeCashWithdrawalOperationResponse:
+        request = MakeCashWithdrawalOperationRequest(
+            card_id=card_id,
+            account_id=account_id,
+            amount=fake.amount(),
+            status=fake.proto_enum(OperationStatus),
+        )
+        return await self.make_cash_withdrawal_operation_api(request)
+
+
+def build_operations_gateway_async_grpc_client() -> AsyncOperationsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AsyncOperationsGatewayGRPCClient.
+
+    :return: Инициализированный асинхронный клиент для OperationsGatewayService.
+    """
+    return AsyncOperationsGatewayGRPCClient(channel=build_gateway_async_grpc_client())
@@ -0,0 +1,74 @@
+from grpc import aio
+
+from clients.grpc.client import AsyncGRPCClient
+from clients.grpc.gateway.client import build_gateway_async_grpc_client
+from contracts.services.gateway.users.rpc_create_user_pb2 import CreateUserRequest, CreateUserResponse
+from contracts.services.gateway.users.rpc_get_user_pb2 import GetUserRequest, GetUserResponse
+from contracts.services.gateway.users.users_gateway_service_pb2_grpc import UsersGatewayServiceStub
+from tools.fakers import fake
+
+
+class AsyncUsersGatewayGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент для взаимодействия с UsersGatewayService.
+    """
+
+    def __init__(self, channel: aio.Channel):
+        """
+        :param channel: Асинхронный gRPC-канал для подключения к UsersGatewayService.
+        """
+        super().__init__(channel)
+
+        self.stub = UsersGatewayServiceStub(channel)
+
+    async def get_user_api(self, request: GetUserRequest) -> GetUserResponse:
+        """
+        Низкоуровневый вызов метода GetUser через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя.
+        :return: Ответ от сервиса с данными пользователя.
+        """
+        return await self.stub.GetUser(request)
+
+    async def create_user_api(self, request: CreateUserRequest) -> CreateUserResponse:
+        """
+        Низкоуровневый вызов метода CreateUser через gRPC.
+
+        :param request: gRPC-запрос с данными нового пользователя.
+        :return: Ответ от сервиса с данными созданного пользователя.
+        """
+        return await self.stub.CreateUser(request)
+
+    async def get_user(self, user_id: str) -> GetUserResponse:
+        """
+        Получение данных пользователя по его ID.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Ответ с информацией о пользователе.
+        """
+        request = GetUserRequest(id=user_id)
+        return await self.get_user_api(request)
+
+    async def create_user(self) -> CreateUserResponse:
+        """
+        Создание нового пользователя с фейковыми данными.
+
+        :return: Ответ с информацией о созданном пользователе.
+        """
+        request = CreateUserRequest(
+            email=fake.email(),
+            last_name=fake.last_name(),
+            first_name=fake.first_name(),
+            middle_name=fake.middle_name(),
+            phone_number=fake.phone_number()
+        )
+        return await self.create_user_api(request)
+
+
+def build_users_gateway_async_grpc_client() -> AsyncUsersGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AsyncUsersGatewayGRPCClient.
+
+    :return: Инициализированный асинхронный клиент для UsersGatewayService.
+    """
+    return AsyncUsersGatewayGRPCClient(channel=build_gateway_async_grpc_client())
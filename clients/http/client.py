@@ -1,6 +1,9 @@
-from typing import Any, TypedDict
+from typing import TYPE_CHECKING, Any, TypedDict
 
-from httpx import Client, Response, QueryParams, URL
+from httpx import AsyncClient, Client, Response, QueryParams, URL
+
+if TYPE_CHECKING:
+    from clients.http.fast_client import FastHTTPSession
 
 
 class HTTPClientExtensions(TypedDict, total=False):
@@ -11,10 +14,10 @@ class HTTPClient:
     """
     Базовый HTTP API клиент, принимающий объект httpx.Client.
 
-    :param client: экземпляр httpx.Client для выполнения HTTP-запросов
+    :param client: экземпляр httpx.Client (или FastHTTPSession на geventhttpclient) для выполнения HTTP-запросов
     """
 
-    def __init__(self, client: Client) -> None:
+    def __init__(self, client: "Client | FastHTTPSession") -> None:
         self.client = client
 
     def get(
@@ -48,3 +51,55 @@ class HTTPClient:
         :return: Объект Response с данными ответа.
         """
         return self.client.post(url=url, json=json, extensions=extensions)
+
+
+class AsyncHTTPClient:
+    """
+    Базовый асинхронный HTTP API клиент, принимающий объект httpx.AsyncClient.
+
+    Повторяет интерфейс HTTPClient, но методы являются корутинами.
+    Используется асинхронным движком сидинга.
+
+    :param client: экземпляр httpx.AsyncClient для выполнения HTTP-запросов
+    """
+
+    def __init__(self, client: AsyncClient) -> None:
+        self.client = client
+
+    async def get(
+        self,
+        url: str | URL,
+        params: QueryParams | None = None,
+        extensions: HTTPClientExtensions | None = None
+    ) -> Response:
+        """
+        Выполняет асинхронный GET-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param params: GET-параметры запроса (например, ?key=value).
+        :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
+        :return: Объект Response с данными ответа.
+        """
+        return await self.client.get(url=url, params=params, extensions=extensions)
+
+    async def post(
+        self,
+        url: str | URL,
+        json: Any | None = None,
+        extensions: HTTPClientExtensions | None = None
+    ) -> Response:
+        """
+        Выполняет асинхронный POST-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param json: Данные в формате JSON.
+        :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
+        :return: Объект Response с данными ответа.
+        """
+        return await self.client.post(url=url, json=json, extensions=extensions)
+
+    async def close(self) -> None:
+        """
+        Закрывает соединения httpx.AsyncClient.
+        """
+        await self.client.aclose()
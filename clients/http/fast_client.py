@@ -0,0 +1,125 @@
+import json as jsonlib
+import time
+from typing import Any
+
+from geventhttpclient import HTTPClient as GeventHTTPClient
+from httpx import HTTPStatusError, QueryParams, Request, Response, URL
+from locust.env import Environment
+
+from clients.http.client import HTTPClientExtensions
+
+
+class FastHTTPSession:
+    """
+    Сессия на geventhttpclient (парсер HTTP на C, используемый FastHttpUser в Locust)
+    с тем же интерфейсом get/post, что и httpx.Client, поэтому её можно передать в HTTPClient
+    вместо httpx.Client без изменений в клиентах gateway и сценариях.
+
+    Ответы возвращаются как httpx.Response (с запросом, заголовками и телом), так что
+    raise_for_status, text, json и model_validate_json работают как прежде.
+    Если передано окружение Locust, каждый ответ репортится в environment.events.request
+    с тем же именем "<METHOD> <route>", что и у locust_response_event_hook.
+
+    Ограничения: только HTTP/1.1, тело ответа не распаковывается (Accept-Encoding не отправляется).
+
+    :param client: Пул соединений geventhttpclient к gateway (общий для процесса).
+    :param base_url: Базовый URL gateway; его путь добавляется перед путём запроса.
+    :param environment: Окружение Locust для отправки метрик; None — без метрик.
+    """
+
+    def __init__(self, client: GeventHTTPClient, base_url: str, environment: Environment | None = None) -> None:
+        self.client = client
+        self.base_url = URL(base_url)
+        self.base_path = self.base_url.path.rstrip("/")
+        self.fire = environment.events.request.fire if environment is not None else None
+
+    def request(
+            self,
+            method: str,
+            url: str | URL,
+            params: QueryParams | None = None,
+            json: Any | None = None,
+            extensions: HTTPClientExtensions | None = None
+    ) -> Response:
+        """
+        Выполняет запрос и возвращает ответ в виде httpx.Response.
+
+        :param method: HTTP-метод.
+        :param url: Путь эндпоинта относительно базового URL.
+        :param params: GET-параметры запроса.
+        :param json: Данные для тела запроса в формате JSON.
+        :param extensions: Дополнительные данные запроса (route для имени метрики).
+        :return: Объект Response с данными ответа.
+        """
+        path = f"{self.base_path}{url}"
+        if params:
+            path = f"{path}?{QueryParams(params)}"
+
+        headers = None
+        body = b""
+        if json is not None:
+            # Так же, как сериализует JSON httpx
+            body = jsonlib.dumps(json, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode()
+            headers = {"Content-Type": "application/json"}
+
+        start_time = time.perf_counter_ns()
+        raw = self.client.request(method, path, body=body, headers=headers)
+        # Время до получения заголовков ответа — как и в locust_response_event_hook
+        response_time = (time.perf_counter_ns() - start_time) / 1_000_000
+        try:
+            content = raw.read()
+        finally:
+            raw.release()
+
+        response = Response(
+            raw.status_code,
+            headers=raw.items(),
+            content=content,
+            request=Request(method, self.base_url.copy_with(raw_path=path.encode()), extensions=extensions or {})
+        )
+        if self.fire is not None:
+            self.report(response=response, response_time=response_time)
+
+        return response
+
+    def report(self, response: Response, response_time: float) -> None:
+        """
+        Отправляет метрики ответа в Locust.
+        """
+        exception: HTTPStatusError | None = None
+        if response.status_code >= 400:
+            try:
+                response.raise_for_status()
+            except HTTPStatusError as error:
+                exception = error
+
+        request = response.request
+        route = request.extensions.get("route")
+        if route is None:
+            route = request.url.path
+
+        self.fire(
+            name=f"{request.method} {route}",
+            context=None,
+            response=response,
+            exception=exception,
+            request_type="HTTP",
+            response_time=response_time,
+            response_length=len(response.content),
+        )
+
+    def get(
+            self,
+            url: str | URL,
+            params: QueryParams | None = None,
+            extensions: HTTPClientExtensions | None = None
+    ) -> Response:
+        return self.request("GET", url, params=params, extensions=extensions)
+
+    def post(
+            self,
+            url: str | URL,
+            json: Any | None = None,
+            extensions: HTTPClientExtensions | None = None
+    ) -> Response:
+        return self.request("POST", url, json=json, extensions=extensions)
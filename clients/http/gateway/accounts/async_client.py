@@ -0,0 +1,92 @@
+from httpx import Response
+
+from clients.http.client import AsyncHTTPClient
+from clients.http.gateway.accounts.schema import (
+    OpenDepositAccountRequestSchema,
+    OpenDepositAccountResponseSchema,
+    OpenSavingsAccountRequestSchema,
+    OpenSavingsAccountResponseSchema,
+    OpenDebitCardAccountRequestSchema,
+    OpenDebitCardAccountResponseSchema,
+    OpenCreditCardAccountRequestSchema,
+    OpenCreditCardAccountResponseSchema
+)
+from clients.http.gateway.client import build_gateway_async_http_client
+from tools.routes import APIRoutes
+
+
+class AsyncAccountsGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для открытия счетов через /api/v1/accounts сервиса http-gateway.
+    """
+
+    async def open_deposit_account_api(self, request: OpenDepositAccountRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для открытия депозитного счёта.
+
+        :param request: Pydantic-модель с userId.
+        :return: Объект httpx.Response с результатом операции.
+        """
+        return await self.post(f"{APIRoutes.ACCOUNTS}/open-deposit-account", json=request.model_dump(by_alias=True))
+
+    async def open_savings_account_api(self, request: OpenSavingsAccountRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для открытия сберегательного счёта.
+
+        :param request: Pydantic-модель с userId.
+        :return: Объект httpx.Response.
+        """
+        return await self.post(f"{APIRoutes.ACCOUNTS}/open-savings-account", json=request.model_dump(by_alias=True))
+
+    async def open_debit_card_account_api(self, request: OpenDebitCardAccountRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для открытия дебетовой карты.
+
+        :param request: Pydantic-модель с userId.
+        :return: Объект httpx.Response.
+        """
+        return await self.post(
+            f"{APIRoutes.ACCOUNTS}/open-debit-card-account",
+            json=request.model_dump(by_alias=True)
+        )
+
+    async def open_credit_card_account_api(self, request: OpenCreditCardAccountRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для открытия кредитной карты.
+
+        :param request: Pydantic-модель с userId.
+        :return: Объект httpx.Response.
+        """
+        return await self.post(
+            f"{APIRoutes.ACCOUNTS}/open-credit-card-account",
+            json=request.model_dump(by_alias=True)
+        )
+
+    async def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponseSchema:
+        request = OpenDepositAccountRequestSchema(user_id=user_id)
+        response = await self.open_deposit_account_api(request)
+        return OpenDepositAccountResponseSchema.model_validate_json(response.content)
+
+    async def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponseSchema:
+        request = OpenSavingsAccountRequestSchema(user_id=user_id)
+        response = await self.open_savings_account_api(request)
+        return OpenSavingsAccountResponseSchema.model_validate_json(response.content)
+
+    async def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponseSchema:
+        request = OpenDebitCardAccountRequestSchema(user_id=user_id)
+        response = await self.open_debit_card_account_api(request)
+        return OpenDebitCardAccountResponseSchema.model_validate_json(response.content)
+
+    async def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponseSchema:
+        request = OpenCreditCardAccountRequestSchema(user_id=user_id)
+        response = await self.open_credit_card_account_api(request)
+        return OpenCreditCardAccountResponseSchema.model_validate_json(response.content)
+
+
+def build_accounts_gateway_async_http_client() -> AsyncAccountsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncAccountsGatewayHTTPClient с уже настроенным HTTP-клиентом.
+
+    :return: Готовый к использованию AsyncAccountsGatewayHTTPClient.
+    """
+    return AsyncAccountsGatewayHTTPClient(client=build_gateway_async_http_client())
@@ -87,27 +87,27 @@ class AccountsGatewayHTTPClient(HTTPClient):
     def get_accounts(self, user_id: str) -> GetAccountsResponseSchema:
         query = GetAccountsQuerySchema(user_id=user_id)
         response = self.get_accounts_api(query)
-        return GetAccountsResponseSchema.model_validate_json(response.text)
+        return GetAccountsResponseSchema.model_validate_json(response.content)
 
     def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponseSchema:
         request = OpenDepositAccountRequestSchema(user_id=user_id)
         response = self.open_deposit_account_api(request)
-        return OpenDepositAccountResponseSchema.model_validate_json(response.text)
+        return OpenDepositAccountResponseSchema.model_validate_json(response.content)
 
     def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponseSchema:
         request = OpenSavingsAccountRequestSchema(user_id=user_id)
         response = self.open_savings_account_api(request)
-        return OpenSavingsAccountResponseSchema.model_validate_json(response.text)
+        return OpenSavingsAccountResponseSchema.model_validate_json(response.content)
 
     def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponseSchema:
         request = OpenDebitCardAccountRequestSchema(user_id=user_id)
         response = self.open_debit_card_account_api(request)
-        return OpenDebitCardAccountResponseSchema.model_validate_json(response.text)
+        return OpenDebitCardAccountResponseSchema.model_validate_json(response.content)
 
     def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponseSchema:
         request = OpenCreditCardAccountRequestSchema(user_id=user_id)
         response = self.open_credit_card_account_api(request)
-        return OpenCreditCardAccountResponseSchema.model_validate_json(response.text)
+        return OpenCreditCardAccountResponseSchema.model_validate_json(response.content)
 
 
 def build_accounts_gateway_http_client() -> AccountsGatewayHTTPClient:
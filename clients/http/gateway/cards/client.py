@@ -44,12 +44,12 @@ class CardsGatewayHTTPClient(HTTPClient):
     def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponseSchema:
         request = IssueVirtualCardRequestSchema(user_id=user_id, account_id=account_id)
         response = self.issue_virtual_card_api(request)
-        return IssueVirtualCardResponseSchema.model_validate_json(response.text)
+        return IssueVirtualCardResponseSchema.model_validate_json(response.content)
 
     def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponseSchema:
         request = IssuePhysicalCardRequestSchema(user_id=user_id, account_id=account_id)
         response = self.issue_physical_card_api(request)
-        return IssuePhysicalCardResponseSchema.model_validate_json(response.text)
+        return IssuePhysicalCardResponseSchema.model_validate_json(response.content)
 
 
 def build_cards_gateway_http_client() -> CardsGatewayHTTPClient:
@@ -1,25 +1,107 @@
 import logging
+import os
+from functools import cache
 
-from httpx import Client
+from geventhttpclient import HTTPClient as GeventHTTPClient
+from httpx import AsyncClient, Client, HTTPTransport, Limits, URL
 from locust.env import Environment  # Импорт окружения Locust для передачи в хуки
 
 from clients.http.event_hooks.locust_event_hook import (
     locust_request_event_hook,  # Хук для отслеживания начала запроса
     locust_response_event_hook  # Хук для сбора метрик по завершении запроса
 )
+from clients.http.fast_client import FastHTTPSession
 from config import settings
+from tools.config.http import HTTPClientBackend, MAX_GEVENT_CONNECTIONS
 
 
-def build_gateway_http_client() -> Client:
+def build_gateway_http_client() -> Client | FastHTTPSession:
     """
     Функция создаёт экземпляр httpx.Client с базовыми настройками для сервиса http-gateway.
+    С настройкой GATEWAY_HTTP_CLIENT.BACKEND=geventhttpclient вместо него создаётся FastHTTPSession.
 
-    :return: Готовый к использованию объект httpx.Client.
+    :return: Готовый к использованию объект httpx.Client или FastHTTPSession.
     """
-    return Client(timeout=settings.gateway_http_client.timeout, base_url=settings.gateway_http_client.client_url)
+    if settings.gateway_http_client.backend == HTTPClientBackend.GEVENT:
+        return FastHTTPSession(
+            client=build_gateway_gevent_http_pool(),
+            base_url=settings.gateway_http_client.client_url
+        )
 
+    return Client(
+        timeout=settings.gateway_http_client.timeout,
+        base_url=settings.gateway_http_client.client_url,
+        limits=settings.gateway_http_client.limits,
+        http1=settings.gateway_http_client.http1,
+        http2=settings.gateway_http_client.http2
+    )
+
+
+def build_gateway_async_http_client() -> AsyncClient:
+    """
+    Функция создаёт экземпляр httpx.AsyncClient для сервиса http-gateway.
+
+    Ограничение на количество соединений снято: число одновременных запросов
+    контролирует вызывающая сторона (например, семафор асинхронного сидера).
+
+    :return: Готовый к использованию объект httpx.AsyncClient.
+    """
+    return AsyncClient(
+        timeout=settings.gateway_http_client.timeout,
+        base_url=settings.gateway_http_client.client_url,
+        limits=Limits(max_connections=None, max_keepalive_connections=None),
+        http1=settings.gateway_http_client.http1,
+        http2=settings.gateway_http_client.http2
+    )
+
+
+@cache
+def build_gateway_http_transport() -> HTTPTransport:
+    """
+    Возвращает общий для процесса транспорт (пул соединений) к сервису http-gateway.
 
-def build_gateway_locust_http_client(environment: Environment) -> Client:
+    Его используют все Locust-клиенты всех виртуальных пользователей процесса,
+    поэтому количество сокетов определяется числом одновременных запросов, а не числом пользователей.
+    Лимиты пула задаются настройками GATEWAY_HTTP_CLIENT.MAX_CONNECTIONS, MAX_KEEPALIVE_CONNECTIONS и KEEPALIVE_EXPIRY,
+    а с GATEWAY_HTTP_CLIENT.HTTP2 запросы мультиплексируются по HTTP/2.
+
+    :return: Транспорт httpx.HTTPTransport.
+    """
+    return HTTPTransport(
+        limits=settings.gateway_http_client.limits,
+        http1=settings.gateway_http_client.http1,
+        http2=settings.gateway_http_client.http2
+    )
+
+
+@cache
+def build_gateway_gevent_http_pool() -> GeventHTTPClient:
+    """
+    Возвращает общий для процесса пул соединений geventhttpclient к сервису http-gateway
+    (для GATEWAY_HTTP_CLIENT.BACKEND=geventhttpclient).
+
+    Размер пула задаётся GATEWAY_HTTP_CLIENT.MAX_CONNECTIONS, таймауты — GATEWAY_HTTP_CLIENT.TIMEOUT.
+
+    :return: Клиент geventhttpclient.HTTPClient.
+    """
+    config = settings.gateway_http_client
+    url = URL(config.client_url)
+    return GeventHTTPClient(
+        host=url.host,
+        port=url.port,
+        ssl=url.scheme == "https",
+        connection_timeout=config.timeout,
+        network_timeout=config.timeout,
+        concurrency=config.max_connections or MAX_GEVENT_CONNECTIONS
+    )
+
+
+# Дочерний процесс (воркеры Locust с --processes) не должен делить сокеты родителя
+os.register_at_fork(after_in_child=build_gateway_http_transport.cache_clear)
+os.register_at_fork(after_in_child=build_gateway_gevent_http_pool.cache_clear)
+
+
+def build_gateway_locust_http_client(environment: Environment) -> Client | FastHTTPSession:
     """
     HTTP-клиент, предназначенный специально для нагрузочного тестирования с помощью Locust.
 
@@ -27,13 +109,24 @@ def build_gateway_locust_http_client(environment: Environment) -> Client:
     - добавляет хук `locust_request_event_hook` для фиксации времени начала запроса,
     - добавляет хук `locust_response_event_hook`, который вычисляет метрики
     (время ответа, длину ответа и т.д.) и отправляет их в Locust через `environment.events.request`.
+    - работает через общий транспорт процесса (build_gateway_http_transport), а не через собственный пул соединений.
 
     Таким образом, данный клиент автоматически репортит статистику в Locust
     при каждом выполненном HTTP-запросе.
 
+    С настройкой GATEWAY_HTTP_CLIENT.BACKEND=geventhttpclient возвращается FastHTTPSession,
+    который репортит те же метрики сам, без хуков httpx.
+
     :param environment: Объект окружения Locust, необходим для генерации событий метрик.
-    :return: httpx.Client с подключёнными хуками под нагрузочное тестирование.
+    :return: httpx.Client с подключёнными хуками под нагрузочное тестирование или FastHTTPSession.
     """
+    if settings.gateway_http_client.backend == HTTPClientBackend.GEVENT:
+        return FastHTTPSession(
+            client=build_gateway_gevent_http_pool(),
+            base_url=settings.gateway_http_client.client_url,
+            environment=environment
+        )
+
     # Подавляем INFO-логи httpx (например: "HTTP Request: GET ... 200 OK")
     # Это избавляет консоль от лишнего вывода при высоконагруженных тестах
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -41,6 +134,7 @@ def build_gateway_locust_http_client(environment: Environment) -> Client:
     return Client(
         timeout=settings.gateway_http_client.timeout,
         base_url=settings.gateway_http_client.client_url,
+        transport=build_gateway_http_transport(),
         event_hooks={
             "request": [locust_request_event_hook],  # Отмечаем время начала запроса
             "response": [locust_response_event_hook(environment)]  # Собираем метрики и передаём их в Locust
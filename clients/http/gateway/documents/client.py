@@ -41,11 +41,11 @@ class DocumentsGatewayHTTPClient(HTTPClient):
 
     def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponseSchema:
         response = self.get_tariff_document_api(account_id)
-        return GetTariffDocumentResponseSchema.model_validate_json(response.text)
+        return GetTariffDocumentResponseSchema.model_validate_json(response.content)
 
     def get_contract_document(self, account_id: str) -> GetContractDocumentResponseSchema:
         response = self.get_contract_document_api(account_id)
-        return GetContractDocumentResponseSchema.model_validate_json(response.text)
+        return GetContractDocumentResponseSchema.model_validate_json(response.content)
 
 
 def build_documents_gateway_http_client() -> DocumentsGatewayHTTPClient:
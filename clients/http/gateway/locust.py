@@ -40,6 +40,16 @@ class GatewayHTTPTaskSet(TaskSet):
         self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment)
         self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment)
 
+    def get_next_task(self):
+        """
+        Выбирает следующую задачу генератором виртуального пользователя (LocustBaseUser.random),
+        чтобы при заданном RUN_SEED последовательность задач была воспроизводимой.
+        """
+        if not self.tasks:
+            return super().get_next_task()
+
+        return self.user.random.choice(self.tasks)
+
 
 class GatewayHTTPSequentialTaskSet(SequentialTaskSet):
     """
@@ -0,0 +1,102 @@
+from httpx import Response
+
+from clients.http.client import AsyncHTTPClient
+from clients.http.gateway.client import build_gateway_async_http_client
+from clients.http.gateway.operations.schema import (
+    MakeTopUpOperationRequestSchema,
+    MakeTopUpOperationResponseSchema,
+    MakePurchaseOperationRequestSchema,
+    MakePurchaseOperationResponseSchema,
+    MakeTransferOperationRequestSchema,
+    MakeTransferOperationResponseSchema,
+    MakeCashWithdrawalOperationRequestSchema,
+    MakeCashWithdrawalOperationResponseSchema
+)
+from tools.routes import APIRoutes
+
+
+class AsyncOperationsGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для создания операций через /api/v1/operations сервиса http-gateway.
+    """
+
+    async def make_top_up_operation_api(self, request: MakeTopUpOperationRequestSchema) -> Response:
+        """
+        Создание операции пополнения.
+
+        :param request: Pydantic-модель с данными операции.
+        :return: Объект httpx.Response с данными по операции пополнения
+        """
+        return await self.post(
+            f"{APIRoutes.OPERATIONS}/make-top-up-operation",
+            json=request.model_dump(by_alias=True)
+        )
+
+    async def make_transfer_operation_api(self, request: MakeTransferOperationRequestSchema) -> Response:
+        """
+        Создание операции перевода.
+
+        :param request: Pydantic-модель с данными операции.
+        :return: Объект httpx.Response с данными по операции перевода
+        """
+        return await self.post(
+            f"{APIRoutes.OPERATIONS}/make-transfer-operation",
+            json=request.model_dump(by_alias=True)
+        )
+
+    async def make_purchase_operation_api(self, request: MakePurchaseOperationRequestSchema) -> Response:
+        """
+        Создание операции покупки.
+
+        :param request: Pydantic-модель с данными операции и категорией покупки.
+        :return: Объект httpx.Response с данными по операции покупки
+        """
+        return await self.post(
+            f"{APIRoutes.OPERATIONS}/make-purchase-operation",
+            json=request.model_dump(by_alias=True)
+        )
+
+    async def make_cash_withdrawal_operation_api(self, request: MakeCashWithdrawalOperationRequestSchema) -> Response:
+        """
+        Создание операции снятия наличных денег.
+
+        :param request: Pydantic-модель с данными операции.
+        :return: Объект httpx.Response с данными по созданной операции снятия наличных
+        """
+        return await self.post(
+            f"{APIRoutes.OPERATIONS}/make-cash-withdrawal-operation",
+            json=request.model_dump(by_alias=True)
+        )
+
+    async def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponseSchema:
+        request = MakeTopUpOperationRequestSchema(card_id=card_id, account_id=account_id)
+        response = await self.make_top_up_operation_api(request)
+        return MakeTopUpOperationResponseSchema.model_validate_json(response.content)
+
+    async def make_transfer_operation(self, card_id: str, account_id: str) -> MakeTransferOperationResponseSchema:
+        request = MakeTransferOperationRequestSchema(card_id=card_id, account_id=account_id)
+        response = await self.make_transfer_operation_api(request)
+        return MakeTransferOperationResponseSchema.model_validate_json(response.content)
+
+    async def make_purchase_operation(self, card_id: str, account_id: str) -> MakePurchaseOperationResponseSchema:
+        request = MakePurchaseOperationRequestSchema(card_id=card_id, account_id=account_id)
+        response = await self.make_purchase_operation_api(request)
+        return MakePurchaseOperationResponseSchema.model_validate_json(response.content)
+
+    async def make_cash_withdrawal_operation(
+        self,
+        card_id: str,
+        account_id: str
+    ) -> MakeCashWithdrawalOperationResponseSchema:
+        request = MakeCashWithdrawalOperationRequestSchema(card_id=card_id, account_id=account_id)
+        response = await self.make_cash_withdrawal_operation_api(request)
+        return MakeCashWithdrawalOperationResponseSchema.model_validate_json(response.content)
+
+
+def build_operations_gateway_async_http_client() -> AsyncOperationsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncOperationsGatewayHTTPClient с уже настроенным HTTP-клиентом.
+
+    :return: Готовый к использованию AsyncOperationsGatewayHTTPClient.
+    """
+    return AsyncOperationsGatewayHTTPClient(client=build_gateway_async_http_client())
@@ -182,21 +182,21 @@ class OperationsGatewayHTTPClient(HTTPClient):
 
     def get_operation(self, operation_id: str) -> GetOperationResponseSchema:
         response = self.get_operation_api(operation_id)
-        return GetOperationResponseSchema.model_validate_json(response.text)
+        return GetOperationResponseSchema.model_validate_json(response.content)
 
     def get_operation_receipt(self, operation_id: str) -> OperationReceiptResponseSchema:
         response = self.get_operation_receipt_api(operation_id)
-        return OperationReceiptResponseSchema.model_validate_json(response.text)
+        return OperationReceiptResponseSchema.model_validate_json(response.content)
 
     def get_operations(self, account_id: str) -> GetOperationsResponseSchema:
         query = GetOperationsQuerySchema(accountId=account_id)
         response = self.get_operations_api(query)
-        return GetOperationsResponseSchema.model_validate_json(response.text)
+        return GetOperationsResponseSchema.model_validate_json(response.content)
 
     def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponseSchema:
         query = GetOperationsSummaryQuerySchema(accountId=account_id)
         response = self.get_operations_summary_api(query)
-        return GetOperationsSummaryResponseSchema.model_validate_json(response.text)
+        return GetOperationsSummaryResponseSchema.model_validate_json(response.content)
 
     def make_fee_operation(self, card_id: str, account_id: str) -> MakeTransferOperationResponseSchema:
         request = MakeFeeOperationRequestSchema(
@@ -204,7 +204,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
             account_id=account_id
         )
         response = self.make_fee_operation_api(request)
-        return MakeTransferOperationResponseSchema.model_validate_json(response.text)
+        return MakeTransferOperationResponseSchema.model_validate_json(response.content)
 
     def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponseSchema:
         request = MakeTopUpOperationRequestSchema(
@@ -212,7 +212,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
             account_id=account_id
         )
         response = self.make_top_up_operation_api(request)
-        return MakeTopUpOperationResponseSchema.model_validate_json(response.text)
+        return MakeTopUpOperationResponseSchema.model_validate_json(response.content)
 
     def make_cashback_operation(self, card_id: str, account_id: str) -> MakeCashbackOperationResponseSchema:
         request = MakeCashbackOperationRequestSchema(
@@ -220,7 +220,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
             account_id=account_id
         )
         response = self.make_cashback_operation_api(request)
-        return MakeCashbackOperationResponseSchema.model_validate_json(response.text)
+        return MakeCashbackOperationResponseSchema.model_validate_json(response.content)
 
     def make_transfer_operation(self, card_id: str, account_id: str) -> MakeTransferOperationResponseSchema:
         request = MakeTransferOperationRequestSchema(
@@ -228,7 +228,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
             accountId=account_id
         )
         response = self.make_transfer_operation_api(request)
-        return MakeTransferOperationResponseSchema.model_validate_json(response.text)
+        return MakeTransferOperationResponseSchema.model_validate_json(response.content)
 
     def make_purchase_operation(self, card_id: str, account_id: str) -> MakePurchaseOperationResponseSchema:
         request = MakePurchaseOperationRequestSchema(
@@ -236,7 +236,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
             account_id=account_id,
         )
         response = self.make_purchase_operation_api(request)
-        return MakePurchaseOperationResponseSchema.model_validate_json(response.text)
+        return MakePurchaseOperationResponseSchema.model_validate_json(response.content)
 
     def make_bill_payment_operation(self, card_id: str, account_id: str) -> MakeBillPaymentOperationResponseSchema:
         request = MakeBillPaymentOperationRequestSchema(
@@ -244,7 +244,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
             account_id=account_id
         )
         response = self.make_bill_payment_operation_api(request)
-        return MakeBillPaymentOperationResponseSchema.model_validate_json(response.text)
+        return MakeBillPaymentOperationResponseSchema.model_validate_json(response.content)
 
     def make_cash_withdrawal_operation(
         self,
@@ -256,7 +256,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
             account_id=account_id
         )
         response = self.make_cash_withdrawal_operation_api(request)
-        return MakeCashWithdrawalOperationResponseSchema.model_validate_json(response.text)
+        return MakeCashWithdrawalOperationResponseSchema.model_validate_json(response.content)
 
 
 def build_operations_gateway_http_client() -> OperationsGatewayHTTPClient:
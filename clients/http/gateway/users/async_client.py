@@ -0,0 +1,51 @@
+from httpx import Response
+
+from clients.http.client import AsyncHTTPClient, HTTPClientExtensions
+from clients.http.gateway.client import build_gateway_async_http_client
+from clients.http.gateway.users.schema import CreateUserRequestSchema, GetUserResponseSchema, CreateUserResponseSchema
+from tools.routes import APIRoutes
+
+
+class AsyncUsersGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/users сервиса http-gateway.
+    """
+
+    async def get_user_api(self, user_id: str) -> Response:
+        """
+        Получить данные пользователя по его user_id.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(
+            f"{APIRoutes.USERS}/{user_id}",
+            extensions=HTTPClientExtensions(route=f"{APIRoutes.USERS}/{{user_id}}")
+        )
+
+    async def create_user_api(self, request: CreateUserRequestSchema) -> Response:
+        """
+        Создание нового пользователя.
+
+        :param request: Pydantic-модель с данными нового пользователя.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post(APIRoutes.USERS, json=request.model_dump(by_alias=True))
+
+    async def get_user(self, user_id: str) -> GetUserResponseSchema:
+        response = await self.get_user_api(user_id)
+        return GetUserResponseSchema.model_validate_json(response.content)
+
+    async def create_user(self) -> CreateUserResponseSchema:
+        request = CreateUserRequestSchema()
+        response = await self.create_user_api(request)
+        return CreateUserResponseSchema.model_validate_json(response.content)
+
+
+def build_users_gateway_async_http_client() -> AsyncUsersGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncUsersGatewayHTTPClient с уже настроенным HTTP-клиентом.
+
+    :return: Готовый к использованию AsyncUsersGatewayHTTPClient.
+    """
+    return AsyncUsersGatewayHTTPClient(client=build_gateway_async_http_client())
@@ -38,13 +38,13 @@ class UsersGatewayHTTPClient(HTTPClient):
 
     def get_user(self, user_id: str) -> GetUserResponseSchema:
         response = self.get_user_api(user_id)
-        return GetUserResponseSchema.model_validate_json(response.text)
+        return GetUserResponseSchema.model_validate_json(response.content)
 
     # Теперь используем pydantic-модель для аннотации
     def create_user(self) -> CreateUserResponseSchema:
         request = CreateUserRequestSchema()
         response = self.create_user_api(request)
-        return CreateUserResponseSchema.model_validate_json(response.text)
+        return CreateUserResponseSchema.model_validate_json(response.content)
 
 def build_users_gateway_http_client() -> UsersGatewayHTTPClient:
     """
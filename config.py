@@ -1,9 +1,12 @@
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # Импортируем вложенные модели
+from tools.config.fakers import FakerConfig
 from tools.config.grpc import GRPCClientConfig
 from tools.config.http import HTTPClientConfig
 from tools.config.locust import LocustUserConfig
+from tools.config.seeds import SeedsConfig
 
 
 class Settings(BaseSettings):
@@ -19,6 +22,9 @@ class Settings(BaseSettings):
     locust_user: LocustUserConfig  # Настройки виртуального пользователя
     gateway_http_client: HTTPClientConfig  # Настройки HTTP-клиента
     gateway_grpc_client: GRPCClientConfig  # Настройки gRPC-клиента
+    seeds: SeedsConfig = Field(default_factory=SeedsConfig)  # Настройки сидинга (необязательные)
+    faker: FakerConfig = Field(default_factory=FakerConfig)  # Настройки генерации тестовых данных (необязательные)
+    run_seed: int | None = None  # Зерно прогона: делает тестовые данные и выбор задач воспроизводимыми
 
 
 # Глобальный объект настроек — его можно импортировать в любом месте проекта
@@ -2,6 +2,7 @@ from locust import task, events
 from locust.env import Environment
 
 from clients.grpc.gateway.locust import GatewayGRPCTaskSet
+from seeds.locust import init_seeds
 from seeds.scenarios.existing_user_get_documents import ExistingUserGetDocumentsSeedsScenario
 from seeds.schema.result import SeedUserResult
 from tools.locust.user import LocustBaseUser
@@ -14,11 +15,9 @@ def init(environment: Environment, **kwargs):
     # Создаем экземпляр сидинг-сценария
     seeds_scenario = ExistingUserGetDocumentsSeedsScenario()
 
-    # Выполняем генерацию данных, если они ещё не созданы
-    seeds_scenario.build()
-
-    # Загружаем сгенерированных пользователей в окружение Locust
-    environment.seeds = seeds_scenario.load()
+    # Выполняем сидинг (если нужно) и загружаем пользователей;
+    # в распределённом запуске каждый воркер получает только свою часть пользователей
+    init_seeds(environment=environment, seeds_scenario=seeds_scenario)
 
 
 # Набор задач (TaskSet), который будет выполняться виртуальными пользователями.
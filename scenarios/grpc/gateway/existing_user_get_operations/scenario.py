@@ -4,6 +4,8 @@ from locust import events, task
 from locust.env import Environment
 
 from clients.grpc.gateway.locust import GatewayGRPCTaskSet
+from seeds.locust import init_seeds
+from seeds.samplers import SeedsSampler, build_seeds_sampler
 from seeds.scenarios.existing_user_get_operations import ExistingUserGetOperationsSeedsScenario
 from seeds.schema.result import SeedUserResult
 from tools.locust.user import LocustBaseUser
@@ -12,17 +14,19 @@ from tools.locust.user import LocustBaseUser
 @events.init.add_listener
 def on_init(environment: Environment, **kwargs: Any) -> None:
     seeds_scenario = ExistingUserGetOperationsSeedsScenario()
-    seeds_scenario.build()
-
-    environment.seeds = seeds_scenario.load()
+    init_seeds(environment=environment, seeds_scenario=seeds_scenario)
 
 
 class GetOperationsTaskSet(GatewayGRPCTaskSet):
     seed_user: SeedUserResult
+    seeds_sampler: SeedsSampler = build_seeds_sampler()
 
     def on_start(self) -> None:
         super().on_start()
-        self.seed_user = self.user.environment.seeds.get_random_user()
+        self.seed_user = self.user.environment.seeds.get_random_user(
+            sampler=self.seeds_sampler,
+            rng=self.user.random
+        )
 
     @task(1)
     def get_accounts(self):
@@ -2,6 +2,8 @@ from locust import task, events
 from locust.env import Environment
 
 from clients.grpc.gateway.locust import GatewayGRPCTaskSet
+from seeds.locust import init_seeds
+from seeds.samplers import SeedsSampler, build_seeds_sampler
 from seeds.scenarios.existing_user_make_purchase_operation import ExistingUserMakePurchaseOperationSeedsScenario
 from seeds.schema.result import SeedUserResult
 from tools.locust.user import LocustBaseUser
@@ -12,20 +14,23 @@ from tools.locust.user import LocustBaseUser
 def init(environment: Environment, **kwargs):
     # Выполняем сидинг
     seeds_scenario = ExistingUserMakePurchaseOperationSeedsScenario()
-    seeds_scenario.build()  # создаём пользователей, счета, карты и операции
-
-    # Загружаем результат сидинга (из файла JSON)
-    environment.seeds = seeds_scenario.load()
+    # Создаём пользователей, счета, карты и операции и загружаем результат сидинга;
+    # воркеры распределённого запуска получают только свою часть пользователей
+    init_seeds(environment=environment, seeds_scenario=seeds_scenario)
 
 
 # TaskSet — сценарий пользователя. Каждый виртуальный пользователь выполняет эти задачи
 class MakePurchaseOperationTaskSet(GatewayGRPCTaskSet):
     seed_user: SeedUserResult  # Типизированная ссылка на данные из сидинга
+    seeds_sampler: SeedsSampler = build_seeds_sampler()  # Распределение выбора пользователей (SEEDS.SAMPLER.*)
 
     def on_start(self) -> None:
         super().on_start()
         # Получаем случайного пользователя из подготовленного списка
-        self.seed_user = self.user.environment.seeds.get_random_user()
+        self.seed_user = self.user.environment.seeds.get_random_user(
+            sampler=self.seeds_sampler,
+            rng=self.user.random
+        )
 
     @task(1)
     def make_purchase_operation(self):
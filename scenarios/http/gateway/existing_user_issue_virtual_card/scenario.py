@@ -2,6 +2,8 @@ from locust import task, events
 from locust.env import Environment
 
 from clients.http.gateway.locust import GatewayHTTPTaskSet
+from seeds.locust import init_seeds
+from seeds.samplers import SeedsSampler, build_seeds_sampler
 from seeds.scenarios.existing_user_issue_virtual_card import ExistingUserIssueVirtualCardSeedsScenario
 from seeds.schema.result import SeedUserResult
 from tools.locust.user import LocustBaseUser
@@ -11,13 +13,12 @@ from tools.locust.user import LocustBaseUser
 def init(environment: Environment, **kwargs):
     seeds_scenario = ExistingUserIssueVirtualCardSeedsScenario()
 
-    seeds_scenario.build()
-
-    environment.seeds = seeds_scenario.load()
+    init_seeds(environment=environment, seeds_scenario=seeds_scenario)
 
 
 class IssueVirtualCardTaskSet(GatewayHTTPTaskSet):
     seed_user: SeedUserResult
+    seeds_sampler: SeedsSampler = build_seeds_sampler()
 
     def on_start(self) -> None:
         """
@@ -25,7 +26,10 @@ class IssueVirtualCardTaskSet(GatewayHTTPTaskSet):
         :return:
         """
         super().on_start()
-        self.seed_user = self.user.environment.seeds.get_random_user()
+        self.seed_user = self.user.environment.seeds.get_random_user(
+            sampler=self.seeds_sampler,
+            rng=self.user.random
+        )
 
     @task(4)
     def get_accounts(self):
@@ -0,0 +1,364 @@
+import asyncio
+import time
+from functools import partial
+from typing import Any, Awaitable, Callable, TypeVar
+
+from clients.grpc.gateway.accounts.async_client import (
+    AsyncAccountsGatewayGRPCClient,
+    build_accounts_gateway_async_grpc_client
+)
+from clients.grpc.gateway.cards.async_client import AsyncCardsGatewayGRPCClient, build_cards_gateway_async_grpc_client
+from clients.grpc.gateway.operations.async_client import (
+    AsyncOperationsGatewayGRPCClient,
+    build_operations_gateway_async_grpc_client
+)
+from clients.grpc.gateway.users.async_client import AsyncUsersGatewayGRPCClient, build_users_gateway_async_grpc_client
+from clients.http.gateway.accounts.async_client import (
+    AsyncAccountsGatewayHTTPClient,
+    build_accounts_gateway_async_http_client
+)
+from clients.http.gateway.cards.async_client import AsyncCardsGatewayHTTPClient, build_cards_gateway_async_http_client
+from clients.http.gateway.operations.async_client import (
+    AsyncOperationsGatewayHTTPClient,
+    build_operations_gateway_async_http_client
+)
+from clients.http.gateway.users.async_client import AsyncUsersGatewayHTTPClient, build_users_gateway_async_http_client
+from seeds.journal import SeedsJournal
+from seeds.schema.plan import SeedsPlan, SeedUsersPlan, SeedAccountsPlan
+from seeds.schema.result import (
+    SeedsResult,
+    SeedUserResult,
+    SeedCardResult,
+    SeedAccountResult,
+    SeedOperationResult
+)
+from seeds.stats import SeedsStats
+from tools.config.seeds import SeedsProtocol
+
+T = TypeVar("T")
+
+
+class AsyncSeedsBuilder:
+    """
+    Асинхронный сидер на asyncio, повторяющий логику SeedsBuilder.
+
+    Все запросы к gateway проходят через call и ограничены семафором, поэтому один процесс
+    держит тысячи запросов «в полёте» без тысяч потоков или greenlet'ов.
+
+    Важно: grpc.aio не работает в процессе с monkey-patching gevent (его делает импорт locust),
+    поэтому билдер запускается в отдельном процессе-воркере (см. seeds.worker).
+
+    Attributes:
+        users_gateway_client: Асинхронный клиент для работы с пользователями (HTTP или gRPC)
+        cards_gateway_client: Асинхронный клиент для выпуска карт
+        accounts_gateway_client: Асинхронный клиент для открытия счетов
+        operations_gateway_client: Асинхронный клиент для операций
+        concurrency: Максимальное количество одновременных запросов к gateway
+        stats: Телеметрия вызовов gateway
+    """
+
+    def __init__(
+            self,
+            users_gateway_client: AsyncUsersGatewayGRPCClient | AsyncUsersGatewayHTTPClient,
+            cards_gateway_client: AsyncCardsGatewayGRPCClient | AsyncCardsGatewayHTTPClient,
+            accounts_gateway_client: AsyncAccountsGatewayGRPCClient | AsyncAccountsGatewayHTTPClient,
+            operations_gateway_client: AsyncOperationsGatewayGRPCClient | AsyncOperationsGatewayHTTPClient,
+            concurrency: int
+    ):
+        self.users_gateway_client = users_gateway_client
+        self.cards_gateway_client = cards_gateway_client
+        self.accounts_gateway_client = accounts_gateway_client
+        self.operations_gateway_client = operations_gateway_client
+        self.concurrency = concurrency
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.stats = SeedsStats()
+
+    async def call(self, method: Callable[..., Awaitable[T]], **kwargs: Any) -> T:
+        """
+        Выполняет вызов метода gateway-клиента, удерживая слот семафора только на время запроса,
+        и учитывает его в телеметрии.
+        """
+        async with self.semaphore:
+            started = time.perf_counter()
+            try:
+                response = await method(**kwargs)
+            except Exception:
+                self.stats.record(method.__name__, (time.perf_counter() - started) * 1000, error=True)
+                raise
+
+            self.stats.record(method.__name__, (time.perf_counter() - started) * 1000)
+            return response
+
+    @staticmethod
+    async def gather(*tasks: tuple[Callable[[], Awaitable[Any]], int]) -> list[list[Any]]:
+        """
+        Одновременно выполняет все задачи и группирует результаты в порядке передачи.
+
+        Args:
+            *tasks: Пары (фабрика корутины результата, количество повторов)
+
+        Returns:
+            list[list[Any]]: Результаты, сгруппированные по задачам
+        """
+        results = await asyncio.gather(*(factory() for factory, count in tasks for _ in range(count)))
+
+        groups, offset = [], 0
+        for _, count in tasks:
+            groups.append(list(results[offset:offset + count]))
+            offset += count
+        return groups
+
+    async def build_physical_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
+        response = await self.call(
+            self.cards_gateway_client.issue_physical_card,
+            user_id=user_id,
+            account_id=account_id
+        )
+        return SeedCardResult(card_id=response.card.id)
+
+    async def build_virtual_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
+        response = await self.call(
+            self.cards_gateway_client.issue_virtual_card,
+            user_id=user_id,
+            account_id=account_id
+        )
+        return SeedCardResult(card_id=response.card.id)
+
+    async def build_top_up_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        response = await self.call(
+            self.operations_gateway_client.make_top_up_operation,
+            card_id=card_id,
+            account_id=account_id
+        )
+        return SeedOperationResult(operation_id=response.operation.id)
+
+    async def build_purchase_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        response = await self.call(
+            self.operations_gateway_client.make_purchase_operation,
+            card_id=card_id,
+            account_id=account_id
+        )
+        return SeedOperationResult(operation_id=response.operation.id)
+
+    async def build_transfer_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        response = await self.call(
+            self.operations_gateway_client.make_transfer_operation,
+            card_id=card_id,
+            account_id=account_id
+        )
+        return SeedOperationResult(operation_id=response.operation.id)
+
+    async def build_cash_withdrawal_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        response = await self.call(
+            self.operations_gateway_client.make_cash_withdrawal_operation,
+            card_id=card_id,
+            account_id=account_id
+        )
+        return SeedOperationResult(operation_id=response.operation.id)
+
+    async def build_savings_account_result(self, user_id: str) -> SeedAccountResult:
+        response = await self.call(self.accounts_gateway_client.open_savings_account, user_id=user_id)
+        return SeedAccountResult(account_id=response.account.id)
+
+    async def build_deposit_account_result(self, user_id: str) -> SeedAccountResult:
+        response = await self.call(self.accounts_gateway_client.open_deposit_account, user_id=user_id)
+        return SeedAccountResult(account_id=response.account.id)
+
+    async def build_card_account_result(
+            self,
+            plan: SeedAccountsPlan,
+            user_id: str,
+            card_id: str,
+            account_id: str
+    ) -> SeedAccountResult:
+        """
+        Наполняет открытый карточный счёт картами и операциями согласно плану.
+        """
+        (
+            physical_cards,
+            top_up_operations,
+            purchase_operations,
+            virtual_cards,
+            cash_withdrawal_operations,
+            transfer_operations
+        ) = await self.gather(
+            (
+                partial(self.build_physical_card_result, user_id=user_id, account_id=account_id),
+                plan.physical_cards.count
+            ),
+            (
+                partial(self.build_top_up_operation_result, card_id=card_id, account_id=account_id),
+                plan.top_up_operations.count
+            ),
+            (
+                partial(self.build_purchase_operation_result, card_id=card_id, account_id=account_id),
+                plan.purchase_operations.count
+            ),
+            (
+                partial(self.build_virtual_card_result, user_id=user_id, account_id=account_id),
+                plan.virtual_cards.count
+            ),
+            (
+                partial(self.build_cash_withdrawal_operation_result, card_id=card_id, account_id=account_id),
+                plan.cash_withdrawal_operations.count
+            ),
+            (
+                partial(self.build_transfer_operation_result, card_id=card_id, account_id=account_id),
+                plan.transfer_operations.count
+            )
+        )
+
+        return SeedAccountResult(
+            account_id=account_id,
+            physical_cards=physical_cards,
+            top_up_operations=top_up_operations,
+            purchase_operations=purchase_operations,
+            virtual_cards=virtual_cards,
+            cash_withdrawal_operations=cash_withdrawal_operations,
+            transfer_operations=transfer_operations
+        )
+
+    async def build_debit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
+        response = await self.call(self.accounts_gateway_client.open_debit_card_account, user_id=user_id)
+        return await self.build_card_account_result(
+            plan=plan,
+            user_id=user_id,
+            card_id=response.account.cards[0].id,
+            account_id=response.account.id
+        )
+
+    async def build_credit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
+        response = await self.call(self.accounts_gateway_client.open_credit_card_account, user_id=user_id)
+        return await self.build_card_account_result(
+            plan=plan,
+            user_id=user_id,
+            card_id=response.account.cards[0].id,
+            account_id=response.account.id
+        )
+
+    async def build_user(self, plan: SeedUsersPlan) -> SeedUserResult:
+        """
+        Создаёт пользователя и параллельно открывает все его счета согласно плану.
+        """
+        response = await self.call(self.users_gateway_client.create_user)
+        user_id = response.user.id
+
+        savings_accounts, deposit_accounts, debit_card_accounts, credit_card_accounts = await self.gather(
+            (partial(self.build_savings_account_result, user_id=user_id), plan.savings_accounts.count),
+            (partial(self.build_deposit_account_result, user_id=user_id), plan.deposit_accounts.count),
+            (
+                partial(self.build_debit_card_account_result, plan=plan.debit_card_accounts, user_id=user_id),
+                plan.debit_card_accounts.count
+            ),
+            (
+                partial(self.build_credit_card_account_result, plan=plan.credit_card_accounts, user_id=user_id),
+                plan.credit_card_accounts.count
+            )
+        )
+
+        return SeedUserResult(
+            user_id=user_id,
+            savings_accounts=savings_accounts,
+            deposit_accounts=deposit_accounts,
+            debit_card_accounts=debit_card_accounts,
+            credit_card_accounts=credit_card_accounts
+        )
+
+    async def build(self, plan: SeedsPlan, journal: SeedsJournal | None = None) -> SeedsResult:
+        """
+        Генерирует пользователей пулом из concurrency корутин-воркеров.
+
+        Воркеры забирают номера пользователей из общего итератора, поэтому одновременно
+        существует не больше concurrency незавершённых пользователей — память не растёт
+        вместе с размером плана.
+
+        Args:
+            plan: Полный план генерации данных
+            journal: Журнал, в который дописывается каждый готовый пользователь
+
+        Returns:
+            SeedsResult: Результат с данными всех созданных пользователей (в порядке номеров)
+        """
+        users: list[SeedUserResult | None] = [None] * plan.users.count
+        indexes = iter(range(plan.users.count))
+
+        async def worker() -> None:
+            for index in indexes:
+                users[index] = await self.build_user(plan=plan.users)
+                if journal is not None:
+                    journal.append(users[index])
+
+        await asyncio.gather(*(worker() for _ in range(min(self.concurrency, plan.users.count))))
+        return SeedsResult(users=users)
+
+    async def close(self) -> None:
+        """
+        Закрывает соединения всех клиентов.
+        """
+        await self.users_gateway_client.close()
+        await self.cards_gateway_client.close()
+        await self.accounts_gateway_client.close()
+        await self.operations_gateway_client.close()
+
+
+def build_async_grpc_seeds_builder(concurrency: int) -> AsyncSeedsBuilder:
+    """
+    Фабрика для создания асинхронного сидера с grpc.aio-клиентами.
+    Должна вызываться внутри запущенного event loop.
+
+    Args:
+        concurrency: Максимальное количество одновременных запросов к gateway
+
+    Returns:
+        AsyncSeedsBuilder: Инициализированный сидер с gRPC-клиентами
+    """
+    return AsyncSeedsBuilder(
+        users_gateway_client=build_users_gateway_async_grpc_client(),
+        cards_gateway_client=build_cards_gateway_async_grpc_client(),
+        accounts_gateway_client=build_accounts_gateway_async_grpc_client(),
+        operations_gateway_client=build_operations_gateway_async_grpc_client(),
+        concurrency=concurrency
+    )
+
+
+def build_async_http_seeds_builder(concurrency: int) -> AsyncSeedsBuilder:
+    """
+    Фабрика для создания асинхронного сидера с httpx.AsyncClient-клиентами.
+
+    Args:
+        concurrency: Максимальное количество одновременных запросов к gateway
+
+    Returns:
+        AsyncSeedsBuilder: Инициализированный сидер с HTTP-клиентами
+    """
+    return AsyncSeedsBuilder(
+        users_gateway_client=build_users_gateway_async_http_client(),
+        cards_gateway_client=build_cards_gateway_async_http_client(),
+        accounts_gateway_client=build_accounts_gateway_async_http_client(),
+        operations_gateway_client=build_operations_gateway_async_http_client(),
+        concurrency=concurrency
+    )
+
+
+async def build_async(
+        plan: SeedsPlan,
+        protocol: SeedsProtocol,
+        concurrency: int,
+        journal: SeedsJournal | None = None,
+        stats: SeedsStats | None = None
+) -> SeedsResult:
+    """
+    Создаёт асинхронный сидер выбранного протокола, выполняет план и закрывает соединения.
+    Если передан stats, телеметрия вызовов пишется в него.
+    """
+    if protocol == SeedsProtocol.HTTP:
+        builder = build_async_http_seeds_builder(concurrency)
+    else:
+        builder = build_async_grpc_seeds_builder(concurrency)
+    if stats is not None:
+        builder.stats = stats
+
+    try:
+        return await builder.build(plan, journal=journal)
+    finally:
+        await builder.close()
@@ -1,3 +1,14 @@
+import time
+from functools import partial
+from typing import Any, Callable, TypeVar
+
+import gevent
+from gevent.event import Event
+from gevent.lock import BoundedSemaphore
+from gevent.pool import Pool
+from gevent.queue import Queue
+from pydantic import BaseModel
+
 from clients.grpc.gateway.accounts.client import build_accounts_gateway_grpc_client, AccountsGatewayGRPCClient
 from clients.grpc.gateway.cards.client import build_cards_gateway_grpc_client, CardsGatewayGRPCClient
 from clients.grpc.gateway.operations.client import build_operations_gateway_grpc_client, OperationsGatewayGRPCClient
@@ -6,6 +17,8 @@ from clients.http.gateway.accounts.client import build_accounts_gateway_http_cli
 from clients.http.gateway.cards.client import build_cards_gateway_http_client, CardsGatewayHTTPClient
 from clients.http.gateway.operations.client import build_operations_gateway_http_client, OperationsGatewayHTTPClient
 from clients.http.gateway.users.client import build_users_gateway_http_client, UsersGatewayHTTPClient
+from config import settings
+from seeds.journal import SeedsJournal
 from seeds.schema.plan import (
     SeedsPlan,
     SeedUsersPlan,
@@ -18,6 +31,14 @@ from seeds.schema.result import (
     SeedAccountResult,
     SeedOperationResult
 )
+from seeds.sharding import merge_seeds_results, shard_seeds_plan
+from seeds.stats import SeedsStats
+from tools.config.seeds import SeedsEngine, SeedsPipelineConfig, SeedsProtocol
+from tools.logger import get_logger
+
+T = TypeVar("T")
+
+logger = get_logger("SEEDS_BUILDER")
 
 
 class SeedsBuilder:
@@ -30,6 +51,7 @@ class SeedsBuilder:
         cards_gateway_client: Клиент для выпуска карт
         accounts_gateway_client: Клиент для открытия счетов
         operations_gateway_client: Клиент для операций (топ-ап, покупки и т.д.)
+        stats: Телеметрия вызовов gateway (количество, ошибки, гистограммы времени ответа)
     """
 
     def __init__(
@@ -43,6 +65,45 @@ class SeedsBuilder:
         self.cards_gateway_client = cards_gateway_client
         self.accounts_gateway_client = accounts_gateway_client
         self.operations_gateway_client = operations_gateway_client
+        self.stats = SeedsStats()
+
+    def call(self, method: Callable[..., T], **kwargs: Any) -> T:
+        """
+        Выполняет вызов метода gateway-клиента и учитывает его в телеметрии.
+
+        Все обращения билдера к gateway проходят через этот метод, что позволяет
+        наследникам ограничивать количество одновременных запросов.
+
+        Args:
+            method: Высокоуровневый метод клиента (например, users_gateway_client.create_user)
+            **kwargs: Аргументы вызова
+
+        Returns:
+            Ответ gateway-клиента
+        """
+        started = time.perf_counter()
+        try:
+            response = method(**kwargs)
+        except Exception:
+            self.stats.record(method.__name__, (time.perf_counter() - started) * 1000, error=True)
+            raise
+
+        self.stats.record(method.__name__, (time.perf_counter() - started) * 1000)
+        return response
+
+    def gather(self, *tasks: tuple[Callable[[], Any], int]) -> list[list[Any]]:
+        """
+        Выполняет набор независимых задач, каждая из которых повторяется заданное количество раз.
+
+        Базовая реализация выполняет задачи последовательно, в порядке передачи.
+
+        Args:
+            *tasks: Пары (фабрика результата, количество повторов)
+
+        Returns:
+            list[list[Any]]: Результаты, сгруппированные в порядке передачи задач
+        """
+        return [[factory() for _ in range(count)] for factory, count in tasks]
 
     def build_physical_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
         """
@@ -55,7 +116,8 @@ class SeedsBuilder:
         Returns:
             SeedCardResult: Результат с ID выпущенной карты
         """
-        response = self.cards_gateway_client.issue_physical_card(
+        response = self.call(
+            self.cards_gateway_client.issue_physical_card,
             user_id=user_id,
             account_id=account_id
         )
@@ -72,7 +134,8 @@ class SeedsBuilder:
         Returns:
             SeedOperationResult: Результат с ID выполненной операции
         """
-        response = self.operations_gateway_client.make_top_up_operation(
+        response = self.call(
+            self.operations_gateway_client.make_top_up_operation,
             card_id=card_id,
             account_id=account_id
         )
@@ -89,7 +152,8 @@ class SeedsBuilder:
         Returns:
             SeedOperationResult: Результат с ID выполненной операции
         """
-        response = self.operations_gateway_client.make_purchase_operation(
+        response = self.call(
+            self.operations_gateway_client.make_purchase_operation,
             card_id=card_id,
             account_id=account_id
         )
@@ -105,7 +169,7 @@ class SeedsBuilder:
         Returns:
             SeedAccountResult: Результат с ID созданного счёта
         """
-        response = self.accounts_gateway_client.open_savings_account(user_id=user_id)
+        response = self.call(self.accounts_gateway_client.open_savings_account, user_id=user_id)
         return SeedAccountResult(account_id=response.account.id)
 
     def build_deposit_account_result(self, user_id: str) -> SeedAccountResult:
@@ -118,9 +182,68 @@ class SeedsBuilder:
         Returns:
             SeedAccountResult: Результат с ID созданного счёта
         """
-        response = self.accounts_gateway_client.open_deposit_account(user_id=user_id)
+        response = self.call(self.accounts_gateway_client.open_deposit_account, user_id=user_id)
         return SeedAccountResult(account_id=response.account.id)
 
+    def build_card_account_result(
+            self,
+            plan: SeedAccountsPlan,
+            user_id: str,
+            card_id: str,
+            account_id: str
+    ) -> SeedAccountResult:
+        """
+        Наполняет уже открытый карточный счёт картами и операциями согласно плану.
+
+        Все карты и операции счёта независимы друг от друга, поэтому передаются в gather
+        одним набором задач.
+
+        Args:
+            plan: План наполнения счёта (кол-во карт, операций и т.п.)
+            user_id: Идентификатор пользователя
+            card_id: Идентификатор карты, выпущенной вместе со счётом
+            account_id: Идентификатор счёта
+
+        Returns:
+            SeedAccountResult: Результат с ID счёта, картами и операциями
+        """
+        card = partial(self.build_physical_card_result, user_id=user_id, account_id=account_id)
+        virtual_card = partial(self.build_virtual_card_result, user_id=user_id, account_id=account_id)
+        top_up = partial(self.build_top_up_operation_result, card_id=card_id, account_id=account_id)
+        purchase = partial(self.build_purchase_operation_result, card_id=card_id, account_id=account_id)
+        transfer = partial(self.build_transfer_operation_result, card_id=card_id, account_id=account_id)
+        cash_withdrawal = partial(
+            self.build_cash_withdrawal_operation_result,
+            card_id=card_id,
+            account_id=account_id
+        )
+
+        (
+            physical_cards,
+            top_up_operations,
+            purchase_operations,
+            virtual_cards,
+            cash_withdrawal_operations,
+            transfer_operations
+        ) = self.gather(
+            (card, plan.physical_cards.count),
+            (top_up, plan.top_up_operations.count),
+            (purchase, plan.purchase_operations.count),
+            (virtual_card, plan.virtual_cards.count),
+            (cash_withdrawal, plan.cash_withdrawal_operations.count),
+            (transfer, plan.transfer_operations.count)
+        )
+
+        return SeedAccountResult(
+            account_id=account_id,
+            physical_cards=physical_cards,
+            top_up_operations=top_up_operations,
+            purchase_operations=purchase_operations,
+            virtual_cards=virtual_cards,
+            cash_withdrawal_operations=cash_withdrawal_operations,
+            transfer_operations=transfer_operations
+        )
+
     def build_debit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
         """
         Открывает дебетовый счёт для пользователя и при необходимости:
@@ -135,36 +258,12 @@ class SeedsBuilder:
         Returns:
             SeedAccountResult: Результат с ID счёта и дополнительными действиями (карты, операции)
         """
-        response = self.accounts_gateway_client.open_debit_card_account(user_id=user_id)
-        card_id = response.account.cards[0].id
-        account_id = response.account.id
-
-        return SeedAccountResult(
-            account_id=response.account.id,
-            physical_cards=[
-                self.build_physical_card_result(user_id=user_id, account_id=response.account.id)
-                for _ in range(plan.physical_cards.count)
-            ],
-            top_up_operations=[
-                self.build_top_up_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.top_up_operations.count)
-            ],
-            purchase_operations=[
-                self.build_purchase_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.purchase_operations.count)
-            ],
-            virtual_cards=[
-                self.build_virtual_card_result(user_id=user_id, account_id=account_id)
-                for _ in range(plan.virtual_cards.count)
-            ],
-            cash_withdrawal_operations=[
-                self.build_cash_withdrawal_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.cash_withdrawal_operations.count)
-            ],
-            transfer_operations=[
-                self.build_transfer_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.transfer_operations.count)
-            ]
+        response = self.call(self.accounts_gateway_client.open_debit_card_account, user_id=user_id)
+        return self.build_card_account_result(
+            plan=plan,
+            user_id=user_id,
+            card_id=response.account.cards[0].id,
+            account_id=response.account.id
         )
 
     def build_credit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
@@ -181,36 +280,12 @@ class SeedsBuilder:
         Returns:
             SeedAccountResult: Результат с ID счёта и деталями операций
         """
-        response = self.accounts_gateway_client.open_credit_card_account(user_id=user_id)
-        card_id = response.account.cards[0].id
-        account_id = response.account.id
-
-        return SeedAccountResult(
-            account_id=response.account.id,
-            physical_cards=[
-                self.build_physical_card_result(user_id=user_id, account_id=account_id)
-                for _ in range(plan.physical_cards.count)
-            ],
-            top_up_operations=[
-                self.build_top_up_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.top_up_operations.count)
-            ],
-            purchase_operations=[
-                self.build_purchase_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.purchase_operations.count)
-            ],
-            virtual_cards=[
-                self.build_virtual_card_result(user_id=user_id, account_id=account_id)
-                for _ in range(plan.virtual_cards.count)
-            ],
-            cash_withdrawal_operations=[
-                self.build_cash_withdrawal_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.cash_withdrawal_operations.count)
-            ],
-            transfer_operations=[
-                self.build_transfer_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.transfer_operations.count)
-            ],
+        response = self.call(self.accounts_gateway_client.open_credit_card_account, user_id=user_id)
+        return self.build_card_account_result(
+            plan=plan,
+            user_id=user_id,
+            card_id=response.account.cards[0].id,
+            account_id=response.account.id
         )
 
     def build_virtual_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
@@ -224,7 +299,11 @@ class SeedsBuilder:
         Returns:
             SeedCardResult: Результат с ID выпущенной карты
         """
-        response = self.cards_gateway_client.issue_virtual_card(user_id=user_id, account_id=account_id)
+        response = self.call(
+            self.cards_gateway_client.issue_virtual_card,
+            user_id=user_id,
+            account_id=account_id
+        )
         return SeedCardResult(card_id=response.card.id)
 
     def build_transfer_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
@@ -234,7 +313,11 @@ class SeedsBuilder:
         :param account_id: Идентификатор счета
         :return: Результат SeedOperationResult
         """
-        response = self.operations_gateway_client.make_transfer_operation(card_id=card_id, account_id=account_id)
+        response = self.call(
+            self.operations_gateway_client.make_transfer_operation,
+            card_id=card_id,
+            account_id=account_id
+        )
         return SeedOperationResult(operation_id=response.operation.id)
 
     def build_cash_withdrawal_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
@@ -244,7 +327,11 @@ class SeedsBuilder:
         :param account_id: Идентификатор счета
         :return: Результат SeedOperationResult
         """
-        response = self.operations_gateway_client.make_cash_withdrawal_operation(card_id=card_id, account_id=account_id)
+        response = self.call(
+            self.operations_gateway_client.make_cash_withdrawal_operation,
+            card_id=card_id,
+            account_id=account_id
+        )
         return SeedOperationResult(operation_id=response.operation.id)
 
     def build_user(self, plan: SeedUsersPlan) -> SeedUserResult:
@@ -259,29 +346,47 @@ class SeedsBuilder:
         Returns:
             SeedUserResult: Результат с ID пользователя и всеми созданными сущностями
         """
-        response = self.users_gateway_client.create_user()
+        response = self.call(self.users_gateway_client.create_user)
+        user_id = response.user.id
+
+        savings_accounts, deposit_accounts, debit_card_accounts, credit_card_accounts = self.gather(
+            (partial(self.build_savings_account_result, user_id=user_id), plan.savings_accounts.count),
+            (partial(self.build_deposit_account_result, user_id=user_id), plan.deposit_accounts.count),
+            (
+                partial(self.build_debit_card_account_result, plan=plan.debit_card_accounts, user_id=user_id),
+                plan.debit_card_accounts.count
+            ),
+            (
+                partial(self.build_credit_card_account_result, plan=plan.credit_card_accounts, user_id=user_id),
+                plan.credit_card_accounts.count
+            )
+        )
 
         return SeedUserResult(
-            user_id=response.user.id,
-            savings_accounts=[
-                self.build_savings_account_result(user_id=response.user.id)
-                for _ in range(plan.savings_accounts.count)
-            ],
-            deposit_accounts=[
-                self.build_deposit_account_result(user_id=response.user.id)
-                for _ in range(plan.deposit_accounts.count)
-            ],
-            debit_card_accounts=[
-                self.build_debit_card_account_result(plan=plan.debit_card_accounts, user_id=response.user.id)
-                for _ in range(plan.debit_card_accounts.count)
-            ],
-            credit_card_accounts=[
-                self.build_credit_card_account_result(plan=plan.credit_card_accounts, user_id=response.user.id)
-                for _ in range(plan.credit_card_accounts.count)
-            ]
+            user_id=user_id,
+            savings_accounts=savings_accounts,
+            deposit_accounts=deposit_accounts,
+            debit_card_accounts=debit_card_accounts,
+            credit_card_accounts=credit_card_accounts
         )
 
-    def build(self, plan: SeedsPlan) -> SeedsResult:
+    def build_journaled_user(self, plan: SeedUsersPlan, journal: SeedsJournal | None) -> SeedUserResult:
+        """
+        Создаёт пользователя и сразу дописывает его в журнал сидинга, если журнал передан.
+
+        Args:
+            plan: План генерации пользователя
+            journal: Журнал сидинга или None
+
+        Returns:
+            SeedUserResult: Созданный пользователь
+        """
+        user = self.build_user(plan=plan)
+        if journal is not None:
+            journal.append(user)
+        return user
+
+    def build(self, plan: SeedsPlan, journal: SeedsJournal | None = None) -> SeedsResult:
         """
         Генерирует полную структуру данных на основе плана:
         - создаёт указанное количество пользователей
@@ -289,38 +394,523 @@ class SeedsBuilder:
 
         Args:
             plan: Полный план генерации данных
+            journal: Журнал, в который дописывается каждый готовый пользователь
 
         Returns:
             SeedsResult: Результат с данными всех созданных пользователей
         """
-        return SeedsResult(users=[self.build_user(plan=plan.users) for _ in range(plan.users.count)])
+        return SeedsResult(
+            users=[self.build_journaled_user(plan=plan.users, journal=journal) for _ in range(plan.users.count)]
+        )
+
+
+class ConcurrentSeedsBuilder(SeedsBuilder):
+    """
+    Конкурентный сидер на gevent.
+
+    Пользователи строятся параллельно пулом greenlet'ов, а независимые счета, карты и операции
+    внутри пользователя — параллельно через gather. Количество одновременных запросов к gateway
+    ограничено семафором, поэтому нагрузка на стенд не превышает concurrency при любом плане.
+
+    Attributes:
+        concurrency: Максимальное количество одновременных запросов к gateway
+    """
+
+    def __init__(
+            self,
+            users_gateway_client: UsersGatewayGRPCClient | UsersGatewayHTTPClient,
+            cards_gateway_client: CardsGatewayGRPCClient | CardsGatewayHTTPClient,
+            accounts_gateway_client: AccountsGatewayGRPCClient | AccountsGatewayHTTPClient,
+            operations_gateway_client: OperationsGatewayGRPCClient | OperationsGatewayHTTPClient,
+            concurrency: int
+    ):
+        super().__init__(
+            users_gateway_client=users_gateway_client,
+            cards_gateway_client=cards_gateway_client,
+            accounts_gateway_client=accounts_gateway_client,
+            operations_gateway_client=operations_gateway_client
+        )
+        self.concurrency = concurrency
+        self.semaphore = BoundedSemaphore(concurrency)
+
+    def call(self, method: Callable[..., T], **kwargs: Any) -> T:
+        """
+        Выполняет вызов метода gateway-клиента, удерживая слот семафора только на время запроса.
+        Ожидание слота не входит во время ответа в телеметрии.
+        """
+        with self.semaphore:
+            return super().call(method, **kwargs)
+
+    def gather(self, *tasks: tuple[Callable[[], Any], int]) -> list[list[Any]]:
+        """
+        Запускает все задачи одновременно в отдельных greenlet'ах и дожидается их завершения.
+        Порядок результатов внутри групп совпадает с последовательной реализацией.
+        """
+        groups = [[gevent.spawn(factory) for _ in range(count)] for factory, count in tasks]
+        gevent.joinall([greenlet for group in groups for greenlet in group], raise_error=True)
+        return [[greenlet.value for greenlet in group] for group in groups]
+
+    def build(self, plan: SeedsPlan, journal: SeedsJournal | None = None) -> SeedsResult:
+        """
+        Генерирует пользователей пулом из concurrency greenlet'ов.
+
+        Args:
+            plan: Полный план генерации данных
+            journal: Журнал, в который дописывается каждый готовый пользователь
+
+        Returns:
+            SeedsResult: Результат с данными всех созданных пользователей (в порядке генерации)
+        """
+        pool = Pool(self.concurrency)
+        users = pool.map(
+            lambda _: self.build_journaled_user(plan=plan.users, journal=journal),
+            range(plan.users.count)
+        )
+        return SeedsResult(users=users)
+
+
+class SeedsStageMetrics(BaseModel):
+    """
+    Счётчики одной стадии конвейерного сидинга.
+
+    Attributes:
+        name (str): Название стадии.
+        concurrency (int): Количество greenlet'ов стадии.
+        processed (int): Количество успешно обработанных задач.
+        errors (int): Количество задач, завершившихся ошибкой.
+        busy_time (float): Суммарное время выполнения задач, в секундах.
+        max_queue_size (int): Максимальная длина входной очереди стадии.
+    """
+    name: str
+    concurrency: int
+    processed: int = 0
+    errors: int = 0
+    busy_time: float = 0.0
+    max_queue_size: int = 0
+
+    def summary(self, elapsed: float) -> str:
+        """
+        Формирует строку для лога: пропускная способность, средняя задержка и загрузка стадии.
+        Стадия с загрузкой около 100% и длинной очередью — узкое место сидинга.
+
+        Args:
+            elapsed: Общее время работы конвейера, в секундах
+
+        Returns:
+            str: Сводка по стадии
+        """
+        throughput = self.processed / elapsed if elapsed else 0.0
+        latency = self.busy_time / self.processed * 1000 if self.processed else 0.0
+        utilization = self.busy_time / (self.concurrency * elapsed) * 100 if elapsed else 0.0
+        return (
+            f"[{self.name}] processed={self.processed} errors={self.errors} "
+            f"throughput={throughput:.1f}/s latency={latency:.1f}ms "
+            f"utilization={utilization:.0f}% max_queue={self.max_queue_size}"
+        )
+
+
+class SeedsPipeline:
+    """
+    Один прогон конвейерного сидинга.
+
+    Стадии (пользователи → счета → карты и операции) работают одновременно: каждая читает задачи
+    из своей очереди пулом greenlet'ов и кладёт зависимые задачи в очереди следующих стадий.
+    Для каждого пользователя считается число незавершённых задач; когда оно доходит до нуля,
+    пользователь готов и дописывается в результат и журнал.
+
+    Attributes:
+        builder: Сидер, методы которого выполняют запросы к gateway
+        plan: План генерации пользователей
+        journal: Журнал сидинга или None
+        metrics: Счётчики по стадиям
+    """
+
+    def __init__(
+            self,
+            builder: "PipelinedSeedsBuilder",
+            plan: SeedUsersPlan,
+            journal: SeedsJournal | None
+    ):
+        self.builder = builder
+        self.plan = plan
+        self.journal = journal
+
+        self.handlers: dict[str, Callable[..., None]] = {
+            "users": self.create_user,
+            "accounts": self.open_account,
+            "cards": self.issue_card,
+            "operations": self.make_operation
+        }
+        limits = builder.stages.model_dump()
+        self.queues = {name: Queue() for name in self.handlers}
+        self.metrics = {
+            name: SeedsStageMetrics(name=name, concurrency=limits[name])
+            for name in self.handlers
+        }
+
+        self.users: list[SeedUserResult] = []
+        self.pending: dict[int, int] = {}
+        self.finished = Event()
+        self.error: Exception | None = None
+
+    def enqueue(self, stage: str, *task: Any) -> None:
+        queue = self.queues[stage]
+        queue.put(task)
+        metrics = self.metrics[stage]
+        metrics.max_queue_size = max(metrics.max_queue_size, queue.qsize())
+
+    def track(self, index: int, tasks: int) -> None:
+        """
+        Добавляет пользователю незавершённые задачи.
+        """
+        self.pending[index] = self.pending.get(index, 0) + tasks
+
+    def complete(self, index: int, user: SeedUserResult) -> None:
+        """
+        Отмечает завершение одной задачи пользователя; завершает пользователя, если задач не осталось.
+        """
+        self.pending[index] -= 1
+        if self.pending[index]:
+            return
+
+        del self.pending[index]
+        self.users.append(user)
+        if self.journal is not None:
+            self.journal.append(user)
+        if len(self.users) == self.plan.count:
+            self.finished.set()
+
+    def create_user(self, index: int) -> None:
+        response = self.builder.call(self.builder.users_gateway_client.create_user)
+        user = SeedUserResult(user_id=response.user.id)
+
+        kinds = ("savings_accounts", "deposit_accounts", "debit_card_accounts", "credit_card_accounts")
+        # +1 — сама задача создания пользователя, она завершается ниже
+        self.track(index, sum(getattr(self.plan, kind).count for kind in kinds) + 1)
+        for kind in kinds:
+            for _ in range(getattr(self.plan, kind).count):
+                self.enqueue("accounts", index, user, kind)
+
+        self.complete(index, user)
+
+    def open_account(self, index: int, user: SeedUserResult, kind: str) -> None:
+        if kind == "savings_accounts":
+            user.savings_accounts.append(self.builder.build_savings_account_result(user_id=user.user_id))
+        elif kind == "deposit_accounts":
+            user.deposit_accounts.append(self.builder.build_deposit_account_result(user_id=user.user_id))
+        else:
+            method = (
+                self.builder.accounts_gateway_client.open_debit_card_account
+                if kind == "debit_card_accounts"
+                else self.builder.accounts_gateway_client.open_credit_card_account
+            )
+            response = self.builder.call(method, user_id=user.user_id)
+            account = SeedAccountResult(account_id=response.account.id)
+            getattr(user, kind).append(account)
+
+            plan: SeedAccountsPlan = getattr(self.plan, kind)
+            card_kinds = ("physical_cards", "virtual_cards")
+            operation_kinds = (
+                "top_up_operations",
+                "purchase_operations",
+                "transfer_operations",
+                "cash_withdrawal_operations"
+            )
+            self.track(index, sum(getattr(plan, name).count for name in card_kinds + operation_kinds))
+            for name in card_kinds:
+                for _ in range(getattr(plan, name).count):
+                    self.enqueue("cards", index, user, account, name)
+            for name in operation_kinds:
+                for _ in range(getattr(plan, name).count):
+                    self.enqueue("operations", index, user, account, response.account.cards[0].id, name)
+
+        self.complete(index, user)
+
+    def issue_card(self, index: int, user: SeedUserResult, account: SeedAccountResult, kind: str) -> None:
+        method = (
+            self.builder.build_physical_card_result
+            if kind == "physical_cards"
+            else self.builder.build_virtual_card_result
+        )
+        getattr(account, kind).append(method(user_id=user.user_id, account_id=account.account_id))
+        self.complete(index, user)
+
+    def make_operation(
+            self,
+            index: int,
+            user: SeedUserResult,
+            account: SeedAccountResult,
+            card_id: str,
+            kind: str
+    ) -> None:
+        method = {
+            "top_up_operations": self.builder.build_top_up_operation_result,
+            "purchase_operations": self.builder.build_purchase_operation_result,
+            "transfer_operations": self.builder.build_transfer_operation_result,
+            "cash_withdrawal_operations": self.builder.build_cash_withdrawal_operation_result
+        }[kind]
+        getattr(account, kind).append(method(card_id=card_id, account_id=account.account_id))
+        self.complete(index, user)
+
+    def work(self, stage: str) -> None:
+        """
+        Цикл одного greenlet'а стадии: берёт задачу из очереди, выполняет и обновляет счётчики.
+        Первая ошибка останавливает весь конвейер.
+        """
+        queue, handler, metrics = self.queues[stage], self.handlers[stage], self.metrics[stage]
+        while True:
+            task = queue.get()
+            started = time.perf_counter()
+            try:
+                handler(*task)
+            except Exception as error:
+                metrics.errors += 1
+                self.error = error
+                self.finished.set()
+                return
+            finally:
+                metrics.busy_time += time.perf_counter() - started
+            metrics.processed += 1
+
+    def run(self) -> list[SeedUserResult]:
+        """
+        Запускает стадии и дожидается готовности всех пользователей.
+
+        Returns:
+            list[SeedUserResult]: Пользователи в порядке готовности
+        """
+        if self.plan.count == 0:
+            return []
+
+        for index in range(self.plan.count):
+            self.enqueue("users", index)
+
+        started = time.perf_counter()
+        workers = [
+            gevent.spawn(self.work, stage)
+            for stage, metrics in self.metrics.items()
+            for _ in range(metrics.concurrency)
+        ]
+        try:
+            self.finished.wait()
+        finally:
+            gevent.killall(workers)
+
+        elapsed = time.perf_counter() - started
+        for metrics in self.metrics.values():
+            logger.info(metrics.summary(elapsed))
+
+        if self.error is not None:
+            raise self.error
+
+        return self.users
+
+
+class PipelinedSeedsBuilder(SeedsBuilder):
+    """
+    Конвейерный сидер: строит данные «в ширину» по всем пользователям, а не пользователя за пользователем.
+
+    Создание пользователей, открытие счетов, выпуск карт и операции выполняются независимыми стадиями
+    со своими лимитами одновременных запросов, поэтому время сидинга определяется пропускной
+    способностью самой медленной стадии, а не длиной цепочки зависимостей одного пользователя.
+    После прогона в лог выводятся счётчики стадий, а последние значения доступны в metrics.
+
+    Attributes:
+        stages: Лимиты одновременных запросов по стадиям
+        metrics: Счётчики стадий последнего прогона
+    """
+
+    def __init__(
+            self,
+            users_gateway_client: UsersGatewayGRPCClient | UsersGatewayHTTPClient,
+            cards_gateway_client: CardsGatewayGRPCClient | CardsGatewayHTTPClient,
+            accounts_gateway_client: AccountsGatewayGRPCClient | AccountsGatewayHTTPClient,
+            operations_gateway_client: OperationsGatewayGRPCClient | OperationsGatewayHTTPClient,
+            stages: SeedsPipelineConfig
+    ):
+        super().__init__(
+            users_gateway_client=users_gateway_client,
+            cards_gateway_client=cards_gateway_client,
+            accounts_gateway_client=accounts_gateway_client,
+            operations_gateway_client=operations_gateway_client
+        )
+        self.stages = stages
+        self.metrics: dict[str, SeedsStageMetrics] = {}
+
+    def build(self, plan: SeedsPlan, journal: SeedsJournal | None = None) -> SeedsResult:
+        """
+        Генерирует пользователей конвейером стадий.
+
+        Args:
+            plan: Полный план генерации данных
+            journal: Журнал, в который дописывается каждый готовый пользователь
+
+        Returns:
+            SeedsResult: Результат с данными всех созданных пользователей (в порядке готовности)
+        """
+        pipeline = SeedsPipeline(builder=self, plan=plan.users, journal=journal)
+        self.metrics = pipeline.metrics
+        return SeedsResult(users=pipeline.run())
+
+
+class SplitSeedsBuilder:
+    """
+    Сидер, делящий план между несколькими сидерами (например, gRPC и HTTP gateway) поровну.
+
+    Части строятся одновременно, поэтому нагрузка сидинга распределяется по обоим gateway,
+    а в дампе оказываются пользователи, созданные через разные протоколы.
+
+    Attributes:
+        builders (list[SeedsBuilder]): Сидеры, между которыми делится план.
+    """
+
+    def __init__(self, builders: list[SeedsBuilder]):
+        self.builders = builders
+        self.stats = SeedsStats()
+
+    @property
+    def stats(self) -> SeedsStats:
+        return self._stats
+
+    @stats.setter
+    def stats(self, stats: SeedsStats) -> None:
+        # Все сидеры пишут телеметрию в один общий объект
+        self._stats = stats
+        for builder in self.builders:
+            builder.stats = stats
+
+    def build(self, plan: SeedsPlan, journal: SeedsJournal | None = None) -> SeedsResult:
+        """
+        Делит план по количеству пользователей и строит части параллельно.
+
+        Args:
+            plan: Полный план генерации данных
+            journal: Журнал, в который дописывается каждый готовый пользователь
+
+        Returns:
+            SeedsResult: Объединённый результат всех сидеров
+        """
+        greenlets = [
+            gevent.spawn(builder.build, shard, journal=journal)
+            for builder, shard in zip(self.builders, shard_seeds_plan(plan, len(self.builders)))
+        ]
+        gevent.joinall(greenlets, raise_error=True)
+
+        return merge_seeds_results(greenlet.value for greenlet in greenlets)
+
+
+def build_seeds_builder(
+        users_gateway_client: UsersGatewayGRPCClient | UsersGatewayHTTPClient,
+        cards_gateway_client: CardsGatewayGRPCClient | CardsGatewayHTTPClient,
+        accounts_gateway_client: AccountsGatewayGRPCClient | AccountsGatewayHTTPClient,
+        operations_gateway_client: OperationsGatewayGRPCClient | OperationsGatewayHTTPClient,
+        concurrency: int,
+        engine: SeedsEngine = SeedsEngine.GEVENT
+) -> SeedsBuilder:
+    """
+    Выбирает реализацию сидера по движку и уровню конкурентности.
 
+    Returns:
+        SeedsBuilder: PipelinedSeedsBuilder для движка pipeline, последовательный сидер при concurrency <= 1,
+            иначе ConcurrentSeedsBuilder
+    """
+    if engine == SeedsEngine.PIPELINE:
+        return PipelinedSeedsBuilder(
+            users_gateway_client=users_gateway_client,
+            cards_gateway_client=cards_gateway_client,
+            accounts_gateway_client=accounts_gateway_client,
+            operations_gateway_client=operations_gateway_client,
+            stages=settings.seeds.pipeline
+        )
+
+    if concurrency <= 1:
+        return SeedsBuilder(
+            users_gateway_client=users_gateway_client,
+            cards_gateway_client=cards_gateway_client,
+            accounts_gateway_client=accounts_gateway_client,
+            operations_gateway_client=operations_gateway_client
+        )
+
+    return ConcurrentSeedsBuilder(
+        users_gateway_client=users_gateway_client,
+        cards_gateway_client=cards_gateway_client,
+        accounts_gateway_client=accounts_gateway_client,
+        operations_gateway_client=operations_gateway_client,
+        concurrency=concurrency
+    )
 
-def build_grpc_seeds_builder() -> SeedsBuilder:
+
+def build_grpc_seeds_builder(
+        concurrency: int = settings.seeds.concurrency,
+        engine: SeedsEngine = settings.seeds.engine
+) -> SeedsBuilder:
     """
     Фабрика для создания сидера с использованием gRPC-клиентов.
 
+    Args:
+        concurrency: Максимальное количество одновременных запросов к gateway
+        engine: Движок сидинга (pipeline выбирает конвейерный сидер)
+
     Returns:
         SeedsBuilder: Инициализированный сидер с gRPC-клиентами
     """
-    return SeedsBuilder(
+    return build_seeds_builder(
         users_gateway_client=build_users_gateway_grpc_client(),
         cards_gateway_client=build_cards_gateway_grpc_client(),
         accounts_gateway_client=build_accounts_gateway_grpc_client(),
-        operations_gateway_client=build_operations_gateway_grpc_client()
+        operations_gateway_client=build_operations_gateway_grpc_client(),
+        concurrency=concurrency,
+        engine=engine
     )
 
 
-def build_http_seeds_builder():
+def build_http_seeds_builder(
+        concurrency: int = settings.seeds.concurrency,
+        engine: SeedsEngine = settings.seeds.engine
+) -> SeedsBuilder:
     """
     Фабрика для создания сидера с использованием HTTP-клиентов.
 
+    Args:
+        concurrency: Максимальное количество одновременных запросов к gateway
+        engine: Движок сидинга (pipeline выбирает конвейерный сидер)
+
     Returns:
         SeedsBuilder: Инициализированный сидер с HTTP-клиентами
     """
-    return SeedsBuilder(
+    return build_seeds_builder(
         users_gateway_client=build_users_gateway_http_client(),
         cards_gateway_client=build_cards_gateway_http_client(),
         accounts_gateway_client=build_accounts_gateway_http_client(),
-        operations_gateway_client=build_operations_gateway_http_client()
+        operations_gateway_client=build_operations_gateway_http_client(),
+        concurrency=concurrency,
+        engine=engine
     )
+
+
+def build_gateway_seeds_builder(
+        protocol: SeedsProtocol = settings.seeds.protocol,
+        concurrency: int = settings.seeds.concurrency,
+        engine: SeedsEngine = settings.seeds.engine
+) -> SeedsBuilder | SplitSeedsBuilder:
+    """
+    Фабрика для создания сидера по протоколу gateway.
+
+    Args:
+        protocol: Протокол gateway; split делит план между gRPC и HTTP gateway
+        concurrency: Максимальное количество одновременных запросов к каждому gateway
+        engine: Движок сидинга (pipeline выбирает конвейерный сидер)
+
+    Returns:
+        SeedsBuilder | SplitSeedsBuilder: Сидер с клиентами выбранного протокола
+    """
+    if protocol == SeedsProtocol.SPLIT:
+        return SplitSeedsBuilder(builders=[
+            build_grpc_seeds_builder(concurrency=concurrency, engine=engine),
+            build_http_seeds_builder(concurrency=concurrency, engine=engine)
+        ])
+
+    if protocol == SeedsProtocol.HTTP:
+        return build_http_seeds_builder(concurrency=concurrency, engine=engine)
+
+    return build_grpc_seeds_builder(concurrency=concurrency, engine=engine)
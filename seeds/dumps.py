@@ -1,37 +1,197 @@
+import hashlib
 import os
 
+from pydantic import BaseModel, ValidationError
+
+from config import settings
+from seeds.formats.binary import save_binary_seeds_users, load_binary_seeds_users
+from seeds.formats.jsonl import save_jsonl_seeds_users, load_jsonl_seeds_users
+from seeds.schema.plan import SeedsPlan
 from seeds.schema.result import SeedsResult
+from seeds.stats import SeedsStats
+from tools.config.seeds import SeedsDumpFormat
 from tools.logger import get_logger
 
 logger = get_logger("SEEDS_DUMPS")
 
 
-def save_seeds_result(result: SeedsResult, scenario: str):
+def get_seeds_file(scenario: str, dump_format: SeedsDumpFormat) -> str:
+    """
+    Возвращает путь к файлу дампа сценария в заданном формате.
+
+    :param scenario: Название сценария нагрузки.
+    :param dump_format: Формат дампа.
+    :return: Путь вида ./dumps/<scenario>_seeds.<format>.
+    """
+    return f"./dumps/{scenario}_seeds.{dump_format}"
+
+
+def save_seeds_result(
+        result: SeedsResult,
+        scenario: str,
+        dump_format: SeedsDumpFormat = settings.seeds.dump_format
+):
     """
-    Сохраняет результат сидинга (SeedsResult) в JSON-файл.
+    Сохраняет результат сидинга (SeedsResult) в файл.
 
     :param result: Результат сидинга, сгенерированный билдером.
     :param scenario: Название сценария нагрузки, для которого создаются данные.
                      Используется для генерации имени файла (например, "credit_card_test").
+    :param dump_format: Формат дампа: JSON-документ, JSONL с индексом смещений или бинарный колоночный.
     """
     # Убедимся, что папка dumps существует
     if not os.path.exists("dumps"):
         os.mkdir("dumps")
 
-    seeds_file = f"./dumps/{scenario}_seeds.json"
-    with open(seeds_file, 'w+', encoding="utf-8") as file:
-        file.write(result.model_dump_json())
+    seeds_file = get_seeds_file(scenario, dump_format)
+    if dump_format == SeedsDumpFormat.JSONL:
+        save_jsonl_seeds_users(users=result.users, seeds_file=seeds_file, index_file=f"{seeds_file}.idx")
+    elif dump_format == SeedsDumpFormat.BINARY:
+        save_binary_seeds_users(users=result.users, seeds_file=seeds_file)
+    else:
+        with open(seeds_file, 'w+', encoding="utf-8") as file:
+            file.write(result.model_dump_json())
     logger.debug(f"Seeding result saved to file: {seeds_file}")
 
-def load_seeds_result(scenario: str) -> SeedsResult:
+
+def load_seeds_result(
+        scenario: str,
+        dump_format: SeedsDumpFormat = settings.seeds.dump_format
+) -> SeedsResult:
     """
-    Загружает результат сидинга из JSON-файла.
+    Загружает результат сидинга из файла.
+
+    JSON-дамп читается и валидируется целиком. JSONL- и бинарный дампы только открываются через mmap:
+    пользователи разбираются по одному в момент выдачи, память не растёт с размером дампа.
 
     :param scenario: Название сценария нагрузки, данные которого нужно загрузить.
+    :param dump_format: Формат дампа.
     :return: Объект SeedsResult, восстановленный из файла.
     """
-    # Открываем файл и валидируем его как объект SeedsResult
-    seeds_file = f"./dumps/{scenario}_seeds.json"
+    seeds_file = get_seeds_file(scenario, dump_format)
     logger.debug(f"Seeding result loaded from file: {seeds_file}")
+    if dump_format == SeedsDumpFormat.JSONL:
+        users = load_jsonl_seeds_users(seeds_file=seeds_file, index_file=f"{seeds_file}.idx")
+        # Ленивый список уже содержит провалидированные при записи данные
+        return SeedsResult.model_construct(users=users)
+    if dump_format == SeedsDumpFormat.BINARY:
+        return SeedsResult.model_construct(users=load_binary_seeds_users(seeds_file=seeds_file))
+
+    # Открываем файл и валидируем его как объект SeedsResult
     with open(seeds_file, 'r', encoding="utf-8") as file:
         return SeedsResult.model_validate_json(file.read())
+
+
+class SeedsDumpMeta(BaseModel):
+    """
+    Метаданные дампа сидинга, по которым определяется, можно ли его переиспользовать.
+
+    Attributes:
+        plan_hash (str): sha256 от JSON плана сидинга, по которому построен дамп.
+        target (str): Адрес gateway, в котором были созданы данные.
+        dump_format (SeedsDumpFormat): Формат, в котором сохранён дамп.
+    """
+    plan_hash: str
+    target: str
+    dump_format: SeedsDumpFormat
+
+
+def build_seeds_plan_hash(plan: SeedsPlan) -> str:
+    """
+    Считает хэш плана сидинга. Любое изменение плана (включая значения по умолчанию) меняет хэш.
+
+    :param plan: План сидинга.
+    :return: sha256 в hex-представлении.
+    """
+    return hashlib.sha256(plan.model_dump_json().encode("utf-8")).hexdigest()
+
+
+def save_seeds_meta(meta: SeedsDumpMeta, scenario: str):
+    """
+    Сохраняет метаданные дампа рядом с ним в ./dumps/<scenario>_seeds.meta.json.
+
+    :param meta: Метаданные дампа.
+    :param scenario: Название сценария нагрузки.
+    """
+    if not os.path.exists("dumps"):
+        os.mkdir("dumps")
+
+    meta_file = f"./dumps/{scenario}_seeds.meta.json"
+    with open(meta_file, 'w+', encoding="utf-8") as file:
+        file.write(meta.model_dump_json())
+    logger.debug(f"Seeding dump meta saved to file: {meta_file}")
+
+
+def load_seeds_meta(scenario: str) -> SeedsDumpMeta | None:
+    """
+    Загружает метаданные дампа сидинга.
+
+    :param scenario: Название сценария нагрузки.
+    :return: SeedsDumpMeta или None, если метаданных нет или они повреждены.
+    """
+    meta_file = f"./dumps/{scenario}_seeds.meta.json"
+    if not os.path.exists(meta_file):
+        return None
+
+    with open(meta_file, 'r', encoding="utf-8") as file:
+        try:
+            return SeedsDumpMeta.model_validate_json(file.read())
+        except ValidationError:
+            logger.warning(f"Seeding dump meta {meta_file} is corrupted and will be ignored")
+            return None
+
+
+def remove_seeds_meta(scenario: str):
+    """
+    Удаляет метаданные дампа, чтобы дамп перестал считаться актуальным.
+
+    :param scenario: Название сценария нагрузки.
+    """
+    meta_file = f"./dumps/{scenario}_seeds.meta.json"
+    if os.path.exists(meta_file):
+        os.remove(meta_file)
+
+
+def is_seeds_result_actual(meta: SeedsDumpMeta, scenario: str) -> bool:
+    """
+    Проверяет, что для сценария есть дамп, построенный по тому же плану для того же gateway.
+
+    :param meta: Ожидаемые метаданные дампа.
+    :param scenario: Название сценария нагрузки.
+    :return: True, если дамп можно переиспользовать без повторного сидинга.
+    """
+    if not os.path.exists(get_seeds_file(scenario, meta.dump_format)):
+        return False
+
+    return load_seeds_meta(scenario) == meta
+
+
+def save_seeds_stats(stats: SeedsStats, scenario: str):
+    """
+    Сохраняет телеметрию сидинга рядом с дампом в ./dumps/<scenario>_seeds.stats.json.
+
+    :param stats: Телеметрия сидинга.
+    :param scenario: Название сценария нагрузки.
+    """
+    if not os.path.exists("dumps"):
+        os.mkdir("dumps")
+
+    stats_file = f"./dumps/{scenario}_seeds.stats.json"
+    with open(stats_file, 'w+', encoding="utf-8") as file:
+        file.write(stats.model_dump_json(indent=2))
+    logger.debug(f"Seeding stats saved to file: {stats_file}")
+
+
+def load_seeds_stats(scenario: str) -> SeedsStats | None:
+    """
+    Загружает телеметрию предыдущего сидинга сценария.
+
+    :param scenario: Название сценария нагрузки.
+    :return: SeedsStats или None, если сидинг ещё не выполнялся.
+    """
+    stats_file = f"./dumps/{scenario}_seeds.stats.json"
+    if not os.path.exists(stats_file):
+        return None
+
+    with open(stats_file, 'r', encoding="utf-8") as file:
+        return SeedsStats.model_validate_json(file.read())
@@ -0,0 +1,260 @@
+import argparse
+import importlib
+import inspect
+
+from pydantic import BaseModel, Field
+
+from config import settings
+from seeds.dumps import load_seeds_stats
+from seeds.scenario import SeedsScenario
+from seeds.schema.plan import SeedsPlan, SeedAccountsPlan
+from seeds.stats import SeedsStats
+from tools.config.seeds import SeedsConfig, SeedsEngine, SeedsProtocol
+
+# Время ответа по умолчанию для методов, которых нет в телеметрии прошлых запусков, в миллисекундах
+DEFAULT_LATENCY = 50.0
+
+# Уровни конкурентности, для которых по умолчанию печатается оценка длительности
+DEFAULT_CONCURRENCY_LEVELS = (1, 5, 10, 20, 50, 100, 200)
+
+# Стадии конвейерного сидинга (движок pipeline) по префиксу метода gateway
+PIPELINE_STAGES = {
+    "create_": "users",
+    "open_": "accounts",
+    "issue_": "cards",
+    "make_": "operations"
+}
+
+# Методы gateway, открывающие счёт каждого вида
+ACCOUNT_METHODS = {
+    "savings_accounts": "open_savings_account",
+    "deposit_accounts": "open_deposit_account",
+    "debit_card_accounts": "open_debit_card_account",
+    "credit_card_accounts": "open_credit_card_account"
+}
+
+# Методы gateway, наполняющие карточный счёт
+CARD_ACCOUNT_METHODS = {
+    "physical_cards": "issue_physical_card",
+    "virtual_cards": "issue_virtual_card",
+    "top_up_operations": "make_top_up_operation",
+    "purchase_operations": "make_purchase_operation",
+    "transfer_operations": "make_transfer_operation",
+    "cash_withdrawal_operations": "make_cash_withdrawal_operation"
+}
+
+
+class SeedsEstimate(BaseModel):
+    """
+    Оценка стоимости плана сидинга до его запуска.
+
+    Attributes:
+        calls (dict[str, int]): Количество вызовов по методам gateway.
+        latencies (dict[str, float]): Время ответа по методам, в миллисекундах.
+        measured (list[str]): Методы, время ответа которых взято из телеметрии прошлого запуска.
+        critical_path (float): Цепочка зависимых вызовов одного пользователя, в миллисекундах.
+    """
+    calls: dict[str, int] = Field(default_factory=dict)
+    latencies: dict[str, float] = Field(default_factory=dict)
+    measured: list[str] = Field(default_factory=list)
+    critical_path: float = 0.0
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+    @property
+    def total_work(self) -> float:
+        """
+        Суммарное время всех вызовов, если выполнять их последовательно, в миллисекундах.
+        """
+        return sum(count * self.latencies[method] for method, count in self.calls.items())
+
+    def duration(self, concurrency: int) -> float:
+        """
+        Оценивает длительность сидинга при заданном лимите одновременных запросов.
+
+        Работа делится между concurrency слотами, но не может завершиться быстрее,
+        чем цепочка зависимых вызовов одного пользователя.
+
+        :param concurrency: Лимит одновременных запросов к gateway.
+        :return: Ожидаемая длительность, в секундах.
+        """
+        return max(self.total_work / concurrency, self.critical_path) / 1000
+
+    def pipeline_duration(self, stages: dict[str, int]) -> float:
+        """
+        Оценивает длительность конвейерного сидинга: стадии работают одновременно,
+        поэтому сидинг длится столько, сколько самая загруженная стадия со своим лимитом.
+
+        :param stages: Лимит одновременных запросов каждой стадии (см. PIPELINE_STAGES).
+        :return: Ожидаемая длительность, в секундах.
+        """
+        work = dict.fromkeys(stages, 0.0)
+        for method, count in self.calls.items():
+            stage = next(stage for prefix, stage in PIPELINE_STAGES.items() if method.startswith(prefix))
+            work[stage] += count * self.latencies[method]
+
+        return max(max(work[stage] / stages[stage] for stage in stages), self.critical_path) / 1000
+
+    def summary(self, config: SeedsConfig, levels: tuple[int, ...] = DEFAULT_CONCURRENCY_LEVELS) -> str:
+        """
+        Формирует таблицу вызовов по методам и ожидаемой длительности так, как её запустит SeedsScenario.build:
+        с учётом движка, количества процессов и протокола из настроек SEEDS.*.
+
+        :param config: Настройки сидинга.
+        :param levels: Значения SEEDS.CONCURRENCY, для которых печатается оценка.
+        """
+        lines = [f"{'Method':<36}{'Calls':>10}{'Latency, ms':>14}", "-" * 60]
+        for method, count in self.calls.items():
+            source = "" if method in self.measured else " (default)"
+            lines.append(f"{method:<36}{count:>10}{self.latencies[method]:>14.1f}{source}")
+
+        lines += [
+            "-" * 60,
+            f"Total: {self.total_calls} calls",
+            "",
+            f"Engine: {config.engine}, processes: {config.processes}, protocol: {config.protocol}"
+        ]
+        if config.engine == SeedsEngine.PIPELINE:
+            stages = get_pipeline_stage_limits(config)
+            limits = ", ".join(f"{stage}={limit}" for stage, limit in stages.items())
+            lines.append(f"Pipeline stages ({limits}): {self.pipeline_duration(stages):.1f}s")
+            return "\n".join(lines)
+
+        lines.append(f"{'Concurrency':>12}{'Effective':>12}{'Duration':>14}")
+        for concurrency in levels:
+            effective = get_effective_concurrency(config.model_copy(update={"concurrency": concurrency}))
+            lines.append(f"{concurrency:>12}{effective:>12}{self.duration(effective):>13.1f}s")
+
+        return "\n".join(lines)
+
+
+def get_seeds_builders_count(config: SeedsConfig) -> int:
+    """
+    Количество билдеров, которые SeedsScenario.build запускает одновременно.
+
+    Процессы-воркеры запускаются при SEEDS.PROCESSES > 1 и всегда для движка asyncio;
+    в режиме split их не меньше двух. В одном процессе режим split строит через два билдера.
+    """
+    if config.processes > 1 or config.engine == SeedsEngine.ASYNCIO:
+        return max(config.processes, 2) if config.protocol == SeedsProtocol.SPLIT else config.processes
+
+    return 2 if config.protocol == SeedsProtocol.SPLIT else 1
+
+
+def get_effective_concurrency(config: SeedsConfig) -> int:
+    """
+    Общее количество одновременных запросов к gateway, с которым SeedsScenario.build выполнит план.
+
+    Между процессами-воркерами лимит делится (каждому не меньше одного запроса),
+    а в одном процессе в режиме split каждый из двух билдеров получает его целиком.
+    """
+    builders = get_seeds_builders_count(config)
+    if config.processes > 1 or config.engine == SeedsEngine.ASYNCIO:
+        return max(config.concurrency, builders)
+
+    return config.concurrency * builders
+
+
+def get_pipeline_stage_limits(config: SeedsConfig) -> dict[str, int]:
+    """
+    Общие лимиты стадий конвейерного сидинга: каждый билдер запускает свой конвейер с лимитами SEEDS.PIPELINE.*.
+    """
+    builders = get_seeds_builders_count(config)
+    return {stage: limit * builders for stage, limit in config.pipeline.model_dump().items()}
+
+
+def count_card_account_calls(plan: SeedAccountsPlan, calls: dict[str, int], accounts: int) -> None:
+    """
+    Добавляет вызовы наполнения карточных счетов: карты и операции каждого из accounts счетов.
+    """
+    for field, method in CARD_ACCOUNT_METHODS.items():
+        count = accounts * getattr(plan, field).count
+        if count:
+            calls[method] = calls.get(method, 0) + count
+
+
+def estimate_seeds_plan(
+        plan: SeedsPlan,
+        stats: SeedsStats | None = None,
+        default_latency: float = DEFAULT_LATENCY
+) -> SeedsEstimate:
+    """
+    Считает вызовы gateway, которые сделает план, и оценивает их время по телеметрии прошлого запуска.
+
+    :param plan: План сидинга.
+    :param stats: Телеметрия прошлого сидинга (см. SeedsScenario.build) или None.
+    :param default_latency: Время ответа для методов без телеметрии, в миллисекундах.
+    :return: SeedsEstimate.
+    """
+    users = plan.users
+    calls = {"create_user": users.count} if users.count else {}
+    for field, method in ACCOUNT_METHODS.items():
+        accounts_plan: SeedAccountsPlan = getattr(users, field)
+        accounts = users.count * accounts_plan.count
+        if accounts:
+            calls[method] = calls.get(method, 0) + accounts
+            if field in ("debit_card_accounts", "credit_card_accounts"):
+                count_card_account_calls(accounts_plan, calls, accounts)
+
+    measured = {
+        method: stats.methods[method].avg_time
+        for method in calls
+        if stats is not None and method in stats.methods and stats.methods[method].calls
+    }
+    latencies = {method: measured.get(method, default_latency) for method in calls}
+
+    # Счета пользователя и наполнение счёта строятся параллельно, поэтому цепочка — это
+    # создание пользователя + самый долгий счёт (открытие + самый долгий вызов наполнения)
+    chains = [0.0]
+    for field, method in ACCOUNT_METHODS.items():
+        accounts_plan = getattr(users, field)
+        if not accounts_plan.count:
+            continue
+
+        children = [
+            latencies.get(child, default_latency)
+            for name, child in CARD_ACCOUNT_METHODS.items()
+            if field in ("debit_card_accounts", "credit_card_accounts") and getattr(accounts_plan, name).count
+        ]
+        chains.append(latencies[method] + max(children, default=0.0))
+
+    return SeedsEstimate(
+        calls=calls,
+        latencies=latencies,
+        measured=list(measured),
+        critical_path=(latencies.get("create_user", 0.0) + max(chains)) if users.count else 0.0
+    )
+
+
+def find_seeds_scenario(name: str) -> SeedsScenario:
+    """
+    Находит сценарий сидинга по имени модуля в seeds.scenarios (например, existing_user_get_operations).
+
+    Экземпляр создаётся без вызова __init__: билдер и клиенты gateway не создаются,
+    доступны только plan и scenario, которые от них не зависят.
+    """
+    module = importlib.import_module(f"seeds.scenarios.{name}")
+    for _, value in inspect.getmembers(module, inspect.isclass):
+        if issubclass(value, SeedsScenario) and value is not SeedsScenario and not inspect.isabstract(value):
+            return value.__new__(value)
+
+    raise ValueError(f"Seeds scenario not found in module seeds.scenarios.{name}")
+
+
+if __name__ == '__main__':
+    # Пробный прогон без обращений к gateway: python -m seeds.estimator existing_user_get_operations
+    parser = argparse.ArgumentParser(description="Оценка количества вызовов и длительности плана сидинга")
+    parser.add_argument("scenario", help="Имя сценария сидинга (модуль в seeds/scenarios)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=list(DEFAULT_CONCURRENCY_LEVELS))
+    parser.add_argument("--latency", type=float, default=DEFAULT_LATENCY, help="Время ответа по умолчанию, мс")
+    arguments = parser.parse_args()
+
+    seeds_scenario = find_seeds_scenario(arguments.scenario)
+    estimate = estimate_seeds_plan(
+        plan=seeds_scenario.plan,
+        stats=load_seeds_stats(seeds_scenario.scenario),
+        default_latency=arguments.latency
+    )
+    print(estimate.summary(config=settings.seeds, levels=tuple(arguments.concurrency)))
@@ -0,0 +1,214 @@
+import mmap
+import struct
+import uuid
+from array import array
+from typing import Any, BinaryIO, Iterable, Self
+
+from seeds.formats.lazy import LazySeedUsers
+from seeds.schema.result import SeedUserResult
+
+# Сигнатура и версия бинарного дампа
+MAGIC = b"SEEDSBIN"
+VERSION = 1
+
+# Заголовок: сигнатура, версия, количество пользователей, счетов, карт и операций
+HEADER = struct.Struct("<8sI4xQQQQ")
+
+# Размер идентификатора (UUID) в байтах
+ID_SIZE = 16
+# Размер смещения (uint64) в байтах
+OFFSET_SIZE = 8
+
+# Порядок вложенных списков в колонках дампа
+ACCOUNT_KINDS = ("deposit_accounts", "savings_accounts", "debit_card_accounts", "credit_card_accounts")
+CARD_KINDS = ("physical_cards", "virtual_cards")
+OPERATION_KINDS = ("top_up_operations", "purchase_operations", "transfer_operations", "cash_withdrawal_operations")
+
+
+def encode_id(value: str) -> bytes:
+    """
+    Кодирует идентификатор в 16 байт.
+
+    :param value: Идентификатор в текстовом виде (UUID).
+    :return: Байтовое представление UUID.
+    :raises ValueError: Если идентификатор не является UUID.
+    """
+    try:
+        return uuid.UUID(value).bytes
+    except ValueError:
+        raise ValueError(f"Binary seeds dump supports only UUID identifiers, got: {value!r}")
+
+
+def decode_id(data: bytes) -> str:
+    """
+    Декодирует 16-байтовый идентификатор обратно в текстовый UUID.
+    Формирует строку напрямую из hex, без создания объекта uuid.UUID.
+    """
+    value = data.hex()
+    return f"{value[:8]}-{value[8:12]}-{value[12:16]}-{value[16:20]}-{value[20:]}"
+
+
+class BinarySeedUsers(LazySeedUsers):
+    """
+    Пользователи из бинарного колоночного дампа.
+
+    Дамп состоит из колонок фиксированной ширины (после заголовка, в порядке записи):
+    - идентификаторы пользователей;
+    - для каждого вида счёта — смещения (uint64, N + 1 значение) в таблице счетов;
+    - идентификаторы счетов;
+    - для каждого вида карт и операций — смещения в таблицах карт и операций;
+    - идентификаторы карт и идентификаторы операций.
+
+    Таблицы упорядочены сначала по виду сущности, затем по владельцу, поэтому сущности одного вида
+    у одного владельца лежат подряд и описываются двумя соседними смещениями. Пользователь собирается
+    из колонок только при обращении по индексу.
+
+    Attributes:
+        data (memoryview): Байты дампа: отображение файла или разделяемой памяти.
+        source (Any): Объект, владеющий памятью дампа (mmap или SharedMemory); держится, пока жив список.
+    """
+
+    def __init__(self, data: memoryview, source: Any = None, start: int = 0, stop: int | None = None):
+        self.data = data
+        self.source = source
+
+        magic, version, users, accounts, cards, operations = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Unsupported binary seeds dump: {magic!r} v{version}")
+
+        position = HEADER.size
+        self.user_ids, position = self.section(position, users * ID_SIZE)
+        self.user_accounts = {}
+        for kind in ACCOUNT_KINDS:
+            self.user_accounts[kind], position = self.offsets(position, users + 1)
+
+        self.account_ids, position = self.section(position, accounts * ID_SIZE)
+        self.account_cards = {}
+        for kind in CARD_KINDS:
+            self.account_cards[kind], position = self.offsets(position, accounts + 1)
+        self.account_operations = {}
+        for kind in OPERATION_KINDS:
+            self.account_operations[kind], position = self.offsets(position, accounts + 1)
+
+        self.card_ids, position = self.section(position, cards * ID_SIZE)
+        self.operation_ids, position = self.section(position, operations * ID_SIZE)
+
+        self.users = users
+        super().__init__(start=start, stop=stop)
+
+    def section(self, position: int, size: int) -> tuple[memoryview, int]:
+        return self.data[position:position + size], position + size
+
+    def offsets(self, position: int, count: int) -> tuple[memoryview, int]:
+        section, position = self.section(position, count * OFFSET_SIZE)
+        return section.cast("Q"), position
+
+    @property
+    def size(self) -> int:
+        return self.users
+
+    @staticmethod
+    def decode_ids(ids: memoryview, begin: int, end: int) -> list[str]:
+        return [decode_id(ids[index * ID_SIZE:(index + 1) * ID_SIZE]) for index in range(begin, end)]
+
+    def decode_account(self, index: int) -> dict:
+        account = {"account_id": decode_id(self.account_ids[index * ID_SIZE:(index + 1) * ID_SIZE])}
+        for kind in CARD_KINDS:
+            offsets = self.account_cards[kind]
+            account[kind] = [
+                {"card_id": card_id}
+                for card_id in self.decode_ids(self.card_ids, offsets[index], offsets[index + 1])
+            ]
+        for kind in OPERATION_KINDS:
+            offsets = self.account_operations[kind]
+            account[kind] = [
+                {"operation_id": operation_id}
+                for operation_id in self.decode_ids(self.operation_ids, offsets[index], offsets[index + 1])
+            ]
+
+        return account
+
+    def decode(self, index: int) -> SeedUserResult:
+        # Собираем словарь и валидируем его одним вызовом: это быстрее, чем model_construct на каждую сущность
+        user = {"user_id": decode_id(self.user_ids[index * ID_SIZE:(index + 1) * ID_SIZE])}
+        for kind in ACCOUNT_KINDS:
+            offsets = self.user_accounts[kind]
+            user[kind] = [self.decode_account(account) for account in range(offsets[index], offsets[index + 1])]
+
+        return SeedUserResult.model_validate(user)
+
+    def view(self, start: int, stop: int) -> Self:
+        return BinarySeedUsers(data=self.data, source=self.source, start=start, stop=stop)
+
+
+def build_offsets(owners: list, kinds: Iterable[str]) -> tuple[list, dict[str, array]]:
+    """
+    Раскладывает вложенные списки владельцев в общую таблицу, упорядоченную по виду и владельцу.
+
+    :param owners: Владельцы вложенных списков (пользователи или счета).
+    :param kinds: Имена полей со вложенными списками.
+    :return: Общая таблица сущностей и смещения (N + 1 значение) для каждого вида.
+    """
+    table, offsets = [], {}
+    for kind in kinds:
+        offsets[kind] = array("Q", [len(table)])
+        for owner in owners:
+            table.extend(getattr(owner, kind))
+            offsets[kind].append(len(table))
+
+    return table, offsets
+
+
+def write_binary_seeds_users(users: Iterable[SeedUserResult], file: BinaryIO):
+    """
+    Записывает пользователей в бинарный колоночный формат в открытый поток.
+
+    Идентификаторы хранятся как 16-байтовые UUID, смещения — как uint64 в порядке байтов платформы.
+
+    :param users: Пользователи для записи.
+    :param file: Бинарный поток (файл или io.BytesIO).
+    :raises ValueError: Если среди идентификаторов есть не-UUID значения.
+    """
+    users = list(users)
+    accounts, user_accounts = build_offsets(users, ACCOUNT_KINDS)
+    cards, account_cards = build_offsets(accounts, CARD_KINDS)
+    operations, account_operations = build_offsets(accounts, OPERATION_KINDS)
+
+    file.write(HEADER.pack(MAGIC, VERSION, len(users), len(accounts), len(cards), len(operations)))
+    file.write(b"".join(encode_id(user.user_id) for user in users))
+    for kind in ACCOUNT_KINDS:
+        user_accounts[kind].tofile(file)
+
+    file.write(b"".join(encode_id(account.account_id) for account in accounts))
+    for kind in CARD_KINDS:
+        account_cards[kind].tofile(file)
+    for kind in OPERATION_KINDS:
+        account_operations[kind].tofile(file)
+
+    file.write(b"".join(encode_id(card.card_id) for card in cards))
+    file.write(b"".join(encode_id(operation.operation_id) for operation in operations))
+
+
+def save_binary_seeds_users(users: Iterable[SeedUserResult], seeds_file: str):
+    """
+    Записывает пользователей в бинарный колоночный дамп.
+
+    :param users: Пользователи для записи.
+    :param seeds_file: Путь к файлу дампа.
+    :raises ValueError: Если среди идентификаторов есть не-UUID значения.
+    """
+    with open(seeds_file, "wb") as file:
+        write_binary_seeds_users(users=users, file=file)
+
+
+def load_binary_seeds_users(seeds_file: str) -> BinarySeedUsers:
+    """
+    Открывает бинарный дамп через mmap без декодирования пользователей.
+
+    :param seeds_file: Путь к файлу дампа.
+    :return: Ленивый список пользователей.
+    """
+    with open(seeds_file, "rb") as file:
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    return BinarySeedUsers(data=memoryview(data), source=data)
@@ -0,0 +1,72 @@
+import mmap
+from array import array
+from typing import Iterable, Self
+
+from seeds.formats.lazy import LazySeedUsers
+from seeds.schema.result import SeedUserResult
+
+
+class JSONLSeedUsers(LazySeedUsers):
+    """
+    Пользователи из JSONL-дампа: одна строка на пользователя + индекс смещений строк.
+
+    Дамп и индекс открываются через mmap, строка разбирается в SeedUserResult только при обращении.
+
+    Attributes:
+        data (mmap.mmap | bytes): Отображение файла дампа (пустые байты для пустого дампа).
+        offsets (memoryview): Смещения начала строк (uint64), последнее значение — конец файла.
+    """
+
+    def __init__(self, data: mmap.mmap | bytes, offsets: memoryview, start: int = 0, stop: int | None = None):
+        self.data = data
+        self.offsets = offsets
+        super().__init__(start=start, stop=stop)
+
+    @property
+    def size(self) -> int:
+        return len(self.offsets) - 1
+
+    def decode(self, index: int) -> SeedUserResult:
+        return SeedUserResult.model_validate_json(self.data[self.offsets[index]:self.offsets[index + 1]])
+
+    def view(self, start: int, stop: int) -> Self:
+        return JSONLSeedUsers(data=self.data, offsets=self.offsets, start=start, stop=stop)
+
+
+def save_jsonl_seeds_users(users: Iterable[SeedUserResult], seeds_file: str, index_file: str):
+    """
+    Записывает пользователей построчно и сохраняет индекс смещений строк.
+
+    Индекс — массив uint64 в порядке байтов текущей платформы: N + 1 смещение для N пользователей.
+
+    :param users: Пользователи для записи.
+    :param seeds_file: Путь к файлу дампа.
+    :param index_file: Путь к файлу индекса.
+    """
+    offsets = array("Q", [0])
+    with open(seeds_file, "wb") as file:
+        for user in users:
+            line = user.model_dump_json().encode("utf-8") + b"\n"
+            file.write(line)
+            offsets.append(offsets[-1] + len(line))
+
+    with open(index_file, "wb") as file:
+        offsets.tofile(file)
+
+
+def load_jsonl_seeds_users(seeds_file: str, index_file: str) -> JSONLSeedUsers:
+    """
+    Открывает JSONL-дамп без чтения пользователей в память.
+
+    :param seeds_file: Путь к файлу дампа.
+    :param index_file: Путь к файлу индекса.
+    :return: Ленивый список пользователей.
+    """
+    with open(index_file, "rb") as file:
+        offsets = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)).cast("Q")
+
+    with open(seeds_file, "rb") as file:
+        # mmap нельзя создать для пустого файла
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if offsets[-1] else b""
+
+    return JSONLSeedUsers(data=data, offsets=offsets)
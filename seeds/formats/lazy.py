@@ -0,0 +1,74 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Self, overload
+
+from seeds.schema.result import SeedUserResult
+
+
+class LazySeedUsers(Sequence[SeedUserResult], ABC):
+    """
+    Ленивый список пользователей из дампа сидинга.
+
+    Пользователь декодируется из хранилища только при обращении по индексу и нигде не кэшируется,
+    поэтому потребление памяти не зависит от размера дампа. Срез с шагом 1 возвращает представление
+    над тем же хранилищем, а не копию.
+
+    Attributes:
+        start (int): Индекс первого пользователя представления в хранилище.
+        stop (int): Индекс, следующий за последним пользователем представления.
+    """
+
+    def __init__(self, start: int = 0, stop: int | None = None):
+        self.start = start
+        self.stop = self.size if stop is None else stop
+
+    @property
+    @abstractmethod
+    def size(self) -> int:
+        """
+        Общее количество пользователей в хранилище.
+        """
+        ...
+
+    @abstractmethod
+    def decode(self, index: int) -> SeedUserResult:
+        """
+        Декодирует пользователя по абсолютному индексу в хранилище.
+        """
+        ...
+
+    @abstractmethod
+    def view(self, start: int, stop: int) -> Self:
+        """
+        Создаёт представление над тем же хранилищем в абсолютных индексах [start, stop).
+        """
+        ...
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    @overload
+    def __getitem__(self, index: int) -> SeedUserResult:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[SeedUserResult]:
+        ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return self.view(self.start + start, self.start + max(start, stop))
+
+            return [self.decode(self.start + position) for position in range(start, stop, step)]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("seed users index out of range")
+
+        return self.decode(self.start + index)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(start={self.start}, stop={self.stop})"
@@ -0,0 +1,139 @@
+import os
+
+from pydantic import ValidationError
+
+from seeds.schema.plan import SeedsPlan
+from seeds.schema.result import SeedUserResult
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_JOURNAL")
+
+
+class SeedsJournal:
+    """
+    Журнал сидинга — append-only файл, в который каждый готовый пользователь дописывается сразу
+    после создания. Позволяет продолжить прерванный сидинг (падение, Ctrl-C) без повторного
+    создания уже записанных пользователей.
+
+    Формат: первая строка — план сидинга в JSON, далее по одной строке SeedUserResult на пользователя.
+    Журнал может дописываться одновременно несколькими процессами-воркерами: каждая строка
+    пишется одним системным вызовом write в дескриптор, открытый с O_APPEND, без буферов Python,
+    поэтому строки разных процессов не перемешиваются при любой длине записи.
+
+    Attributes:
+        path: Путь к файлу журнала
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.descriptor: int | None = None
+
+    def start(self, plan: SeedsPlan) -> None:
+        """
+        Начинает новый журнал для плана, удаляя предыдущие записи.
+
+        :param plan: План сидинга, записываемый в заголовок журнала.
+        """
+        self.close()
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write(plan.model_dump_json() + "\n")
+
+    def append(self, user: SeedUserResult) -> None:
+        """
+        Дописывает пользователя в журнал одним вызовом write.
+
+        :param user: Полностью созданный пользователь.
+        """
+        if self.descriptor is None:
+            self.descriptor = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+        record = (user.model_dump_json() + "\n").encode("utf-8")
+        written = os.write(self.descriptor, record)
+        if written != len(record):
+            raise OSError(f"Short write to seeding journal {self.path}: {written} of {len(record)} bytes")
+
+    def load(self, plan: SeedsPlan) -> list[SeedUserResult]:
+        """
+        Читает пользователей из журнала, если он был начат для того же плана.
+
+        Недописанная последняя строка (процесс убит во время записи) отрезается от файла,
+        чтобы следующая запись append не склеилась с ней.
+
+        :param plan: Текущий план сидинга.
+        :return: Список ранее созданных пользователей или пустой список.
+        """
+        if not os.path.exists(self.path):
+            return []
+
+        self.truncate_incomplete_tail()
+
+        with open(self.path, "r", encoding="utf-8") as file:
+            try:
+                journal_plan = SeedsPlan.model_validate_json(file.readline())
+            except ValidationError:
+                journal_plan = None
+
+            if journal_plan != plan:
+                logger.warning(f"Seeding journal {self.path} was written for another plan and will be ignored")
+                return []
+
+            users = []
+            for line in file:
+                try:
+                    users.append(SeedUserResult.model_validate_json(line))
+                except ValidationError:
+                    logger.warning(f"Skipping incomplete record in seeding journal {self.path}")
+            return users
+
+    def truncate_incomplete_tail(self, chunk_size: int = 64 * 1024) -> None:
+        """
+        Отрезает недописанную последнюю строку — всё после последнего перевода строки.
+
+        Файл читается с конца блоками, поэтому размер журнала не важен.
+
+        :param chunk_size: Размер блока чтения, в байтах.
+        """
+        with open(self.path, "rb+") as file:
+            end = file.seek(0, os.SEEK_END)
+            position = end
+            while position > 0:
+                start = max(0, position - chunk_size)
+                file.seek(start)
+                newline = file.read(position - start).rfind(b"\n")
+                if newline != -1:
+                    position = start + newline + 1
+                    break
+                position = start
+
+            if position != end:
+                logger.warning(f"Truncating incomplete last record in seeding journal {self.path}")
+                file.truncate(position)
+
+    def close(self) -> None:
+        """
+        Закрывает файл журнала, если он был открыт для записи.
+        """
+        if self.descriptor is not None:
+            os.close(self.descriptor)
+            self.descriptor = None
+
+    def remove(self) -> None:
+        """
+        Удаляет журнал после успешного сохранения итогового результата.
+        """
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def build_seeds_journal(scenario: str) -> SeedsJournal:
+    """
+    Создаёт журнал сидинга для сценария рядом с его дампом.
+
+    :param scenario: Название сценария нагрузки.
+    :return: Экземпляр SeedsJournal.
+    """
+    if not os.path.exists("dumps"):
+        os.mkdir("dumps")
+
+    return SeedsJournal(path=f"./dumps/{scenario}_seeds.journal.jsonl")
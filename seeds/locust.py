@@ -0,0 +1,223 @@
+from locust import events
+from locust.argument_parser import LocustArgumentParser
+from locust.env import Environment
+from locust.rpc import Message
+from locust.runners import STATE_RUNNING, STATE_SPAWNING, MasterRunner, WorkerRunner
+
+from config import settings
+from seeds.scenario import SeedsScenario
+from seeds.shared import publish_seeds_result, release_seeds_result
+from seeds.sharding import SeedsShardAllocator
+from tools.config.seeds import SeedsProtocol
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_LOCUST")
+
+# Сообщение мастера воркеру с диапазоном его пользователей
+SEEDS_SHARD_MESSAGE = "seeds_shard"
+
+
+@events.init_command_line_parser.add_listener
+def add_seeds_arguments(parser: LocustArgumentParser) -> None:
+    """
+    Добавляет опции сидинга в командную строку Locust.
+    """
+    parser.add_argument(
+        "--seeds-protocol",
+        type=SeedsProtocol,
+        choices=list(SeedsProtocol),
+        default=None,
+        help="Протокол gateway для сидинга: grpc, http или split. По умолчанию — настройка SEEDS.PROTOCOL",
+        env_var="LOCUST_SEEDS_PROTOCOL"
+    )
+
+
+def get_connected_workers(runner: MasterRunner) -> list[str]:
+    """
+    Возвращает идентификаторы подключённых воркеров в порядке их номеров.
+
+    :param runner: Раннер мастера Locust.
+    """
+    workers = runner.clients.ready + runner.clients.running + runner.clients.spawning
+    return sorted((worker.id for worker in workers), key=runner.get_worker_index)
+
+
+def send_seeds_shard(runner: MasterRunner, worker_id: str, users: range, shared_memory: str | None) -> None:
+    """
+    Отправляет воркеру диапазон его пользователей.
+
+    :param runner: Раннер мастера Locust.
+    :param worker_id: Идентификатор воркера.
+    :param users: Диапазон индексов пользователей воркера.
+    :param shared_memory: Имя сегмента разделяемой памяти с результатом сидинга, если он опубликован.
+    """
+    runner.send_message(
+        SEEDS_SHARD_MESSAGE,
+        {"start": users.start, "stop": users.stop, "shared_memory": shared_memory},
+        client_id=worker_id
+    )
+
+
+def send_seeds_shards(
+        environment: Environment,
+        allocator: SeedsShardAllocator,
+        shared_memory: str | None = None,
+        **kwargs
+) -> None:
+    """
+    Делит пользователей между подключёнными воркерами и рассылает им диапазоны.
+
+    Вызывается на мастере при старте теста: сообщения уходят раньше заданий на запуск пользователей,
+    поэтому к on_start каждый воркер уже держит только свою часть.
+
+    :param environment: Окружение Locust мастера.
+    :param allocator: Распределитель диапазонов пользователей мастера.
+    :param shared_memory: Имя сегмента разделяемой памяти с результатом сидинга, если он опубликован.
+    """
+    runner: MasterRunner = environment.runner
+    shards = allocator.partition(get_connected_workers(runner))
+    for worker_id, users in shards.items():
+        send_seeds_shard(runner=runner, worker_id=worker_id, users=users, shared_memory=shared_memory)
+
+    logger.info(f"Seeded users are partitioned across {len(shards)} workers")
+
+
+def send_joined_seeds_shard(
+        environment: Environment,
+        allocator: SeedsShardAllocator,
+        client_id: str,
+        shared_memory: str | None = None
+) -> None:
+    """
+    Выделяет диапазон пользователей воркеру, подключившемуся во время теста.
+
+    Locust перераспределяет пользователей и на такой воркер, поэтому он должен получить свою часть
+    раньше заданий на запуск. Диапазоны остальных воркеров не меняются (см. SeedsShardAllocator).
+    До старта теста ничего не рассылается: это сделает send_seeds_shards при test_start.
+
+    :param environment: Окружение Locust мастера.
+    :param allocator: Распределитель диапазонов пользователей мастера.
+    :param client_id: Идентификатор подключившегося воркера; в runner.clients он появится позже.
+    :param shared_memory: Имя сегмента разделяемой памяти с результатом сидинга, если он опубликован.
+    """
+    runner: MasterRunner = environment.runner
+    if runner.state not in (STATE_SPAWNING, STATE_RUNNING):
+        return
+
+    users = allocator.assign(client_id, connected=get_connected_workers(runner))
+    if not users:
+        logger.warning(f"No unassigned seeded users left for worker {client_id}")
+
+    send_seeds_shard(runner=runner, worker_id=client_id, users=users, shared_memory=shared_memory)
+    logger.info(f"Worker {client_id} joined the test and got {len(users)} seeded users")
+
+
+def stop_seeds_replenisher(environment: Environment, **kwargs) -> None:
+    """
+    Останавливает фоновое пополнение пользователей процесса, если оно запущено.
+
+    :param environment: Окружение Locust.
+    """
+    if environment.seeds_replenisher is not None:
+        environment.seeds_replenisher.stop()
+        environment.seeds_replenisher = None
+
+
+def start_seeds_replenisher(environment: Environment, seeds_scenario: SeedsScenario) -> None:
+    """
+    Запускает фоновое пополнение загруженных пользователей, если включена настройка SEEDS.REPLENISH.ENABLED.
+
+    Предыдущее пополнение процесса (например, при повторном старте теста) останавливается.
+
+    :param environment: Окружение Locust с загруженными пользователями в environment.seeds.
+    :param seeds_scenario: Сценарий сидинга нагрузочного теста.
+    """
+    stop_seeds_replenisher(environment=environment)
+    if not settings.seeds.replenish.enabled:
+        return
+
+    environment.seeds_replenisher = seeds_scenario.replenisher(environment.seeds)
+    environment.seeds_replenisher.start()
+
+
+def init_seeds(environment: Environment, seeds_scenario: SeedsScenario) -> None:
+    """
+    Готовит данные сидинга для теста с учётом режима запуска Locust.
+
+    - Локальный запуск: сидинг и загрузка всех пользователей в текущем процессе.
+    - Мастер: только сидинг; при старте теста раздаёт воркерам непересекающиеся диапазоны пользователей,
+      а воркерам, подключившимся во время теста, — диапазоны из резерва SEEDS.SHARD_RESERVE.
+    - Воркер: сидинг не запускает, загружает только свою часть пользователей по сообщению мастера,
+      поэтому воркеры не держат весь дамп в памяти и не выдают одних и тех же пользователей.
+
+    Если включена настройка SEEDS.SHARED_MEMORY, мастер публикует дамп в разделяемую память,
+    и воркеры на той же машине (--processes) читают пользователей из неё без собственной копии.
+    Остальные воркеры читают дамп из своей папки ./dumps: на разных машинах она должна быть общей.
+
+    Если включена настройка SEEDS.REPLENISH.ENABLED, процессы, раздающие пользователей (воркеры или
+    локальный запуск), досоздают их в фоне по мере расходования (см. seeds.replenisher).
+
+    Протокол gateway для сидинга задаётся настройкой SEEDS.PROTOCOL или опцией --seeds-protocol.
+
+    :param environment: Окружение Locust.
+    :param seeds_scenario: Сценарий сидинга нагрузочного теста.
+    """
+    protocol = getattr(environment.parsed_options, "seeds_protocol", None)
+    if protocol is not None:
+        seeds_scenario.use_protocol(protocol)
+
+    environment.seeds_replenisher = None
+    environment.events.quitting.add_listener(stop_seeds_replenisher)
+
+    if isinstance(environment.runner, WorkerRunner):
+        def load_seeds_shard(environment: Environment, msg: Message, **kwargs):
+            environment.seeds = seeds_scenario.load(
+                users=range(msg.data["start"], msg.data["stop"]),
+                shared_memory=msg.data["shared_memory"]
+            )
+            start_seeds_replenisher(environment=environment, seeds_scenario=seeds_scenario)
+
+        def ensure_seeds_loaded(environment: Environment, **kwargs):
+            # Часть от мастера так и не пришла (например, сообщение опередило регистрацию обработчика):
+            # раздаём весь дамп, чтобы пользователи воркера не остались без данных
+            if environment.seeds is None:
+                logger.warning("No seeds shard received from master, loading all seeded users")
+                environment.seeds = seeds_scenario.load()
+                start_seeds_replenisher(environment=environment, seeds_scenario=seeds_scenario)
+
+        environment.seeds = None
+        environment.runner.register_message(SEEDS_SHARD_MESSAGE, load_seeds_shard)
+        environment.events.test_start.add_listener(ensure_seeds_loaded)
+        return
+
+    # Выполняем генерацию данных, если они ещё не созданы
+    seeds_scenario.build()
+
+    if isinstance(environment.runner, MasterRunner):
+        result = seeds_scenario.load()
+        allocator = SeedsShardAllocator(total=len(result.users), reserve=settings.seeds.shard_reserve)
+        memory = publish_seeds_result(result) if settings.seeds.shared_memory else None
+        if memory is not None:
+            environment.events.quitting.add_listener(lambda **kwargs: release_seeds_result(memory))
+
+        shared_memory = memory.name if memory is not None else None
+        environment.events.test_start.add_listener(
+            lambda environment, **kwargs: send_seeds_shards(
+                environment=environment,
+                allocator=allocator,
+                shared_memory=shared_memory
+            )
+        )
+        environment.events.worker_connect.add_listener(
+            lambda client_id, **kwargs: send_joined_seeds_shard(
+                environment=environment,
+                allocator=allocator,
+                client_id=client_id,
+                shared_memory=shared_memory
+            )
+        )
+        return
+
+    # Загружаем сгенерированных пользователей в окружение Locust
+    environment.seeds = seeds_scenario.load()
+    start_seeds_replenisher(environment=environment, seeds_scenario=seeds_scenario)
@@ -0,0 +1,82 @@
+from typing import Callable, Sequence
+
+import gevent
+from gevent import Greenlet
+
+from seeds.schema.result import SeedsResult, SeedUserResult
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_REPLENISHER")
+
+
+class SeedsReplenisher:
+    """
+    Фоновое пополнение пользователей для сценариев, которые расходуют их через get_next_user.
+
+    Раз в interval секунд проверяет остаток невыданных пользователей и, если он опустился ниже
+    low_water, досоздаёт партию из batch_size пользователей и дописывает её в конец раздачи.
+    Партии создаются последовательно с паузой interval между ними, а билдер получает
+    небольшой лимит конкурентности — так сидинг не искажает измеряемую нагрузку.
+
+    Attributes:
+        result: Раздаваемый результат сидинга.
+        build: Функция, создающая заданное количество новых пользователей.
+        low_water: Порог остатка пользователей, ниже которого начинается пополнение.
+        batch_size: Количество пользователей в одной партии.
+        interval: Пауза между проверками остатка, в секундах.
+    """
+
+    def __init__(
+            self,
+            result: SeedsResult,
+            build: Callable[[int], Sequence[SeedUserResult]],
+            low_water: int,
+            batch_size: int,
+            interval: float
+    ):
+        self.result = result
+        self.build = build
+        self.low_water = low_water
+        self.batch_size = batch_size
+        self.interval = interval
+        self.replenished = 0
+        self.greenlet: Greenlet | None = None
+
+    def replenish(self) -> None:
+        """
+        Досоздаёт одну партию пользователей и дописывает её в результат.
+        """
+        logger.info(
+            f"{self.result.remaining} seeded users remaining (low-water mark {self.low_water}), "
+            f"replenishing {self.batch_size} users"
+        )
+        users = self.build(self.batch_size)
+        self.result.extend(users)
+        self.replenished += len(users)
+
+    def run(self) -> None:
+        while True:
+            if self.result.remaining < self.low_water:
+                try:
+                    self.replenish()
+                except Exception as error:
+                    # Ошибка одной партии не должна останавливать пополнение до конца теста
+                    logger.error(f"Failed to replenish seeded users: {error!r}")
+
+            gevent.sleep(self.interval)
+
+    def start(self) -> None:
+        """
+        Запускает пополнение в фоновом greenlet'е.
+        """
+        if self.greenlet is None:
+            self.greenlet = gevent.spawn(self.run)
+
+    def stop(self) -> None:
+        """
+        Останавливает пополнение. Недостроенная партия отбрасывается.
+        """
+        if self.greenlet is not None:
+            self.greenlet.kill(block=False)
+            self.greenlet = None
+            logger.info(f"Replenisher stopped, {self.replenished} users replenished in total")
@@ -0,0 +1,180 @@
+import math
+import random
+from abc import ABC, abstractmethod
+from array import array
+from collections.abc import Sequence
+
+from config import settings
+from tools.config.seeds import SeedsSamplerConfig, SeedsSamplerKind
+
+
+class AliasTable:
+    """
+    Таблица псевдонимов (метод Уолкера–Воуза) для выбора индекса с заданными весами за O(1).
+
+    Строится один раз за O(n); каждая выборка — одно случайное число для ячейки и одно для монетки.
+
+    Attributes:
+        probability (array): Вероятность остаться в ячейке, а не перейти к псевдониму.
+        alias (array): Индекс-псевдоним для каждой ячейки.
+    """
+
+    def __init__(self, weights: Sequence[float]):
+        size = len(weights)
+        total = math.fsum(weights)
+        if size == 0 or total <= 0:
+            raise ValueError("Alias table requires at least one positive weight")
+
+        scaled = [weight * size / total for weight in weights]
+        self.probability = array("d", [1.0]) * size
+        self.alias = array("q", range(size))
+
+        small = [index for index, value in enumerate(scaled) if value < 1.0]
+        large = [index for index, value in enumerate(scaled) if value >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.probability[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] += scaled[less] - 1.0
+            (small if scaled[more] < 1.0 else large).append(more)
+
+        # Оставшиеся ячейки из-за погрешности округления заполнены целиком (probability = 1.0)
+        self.size = size
+
+    def sample(self, rng: random.Random | None = None) -> int:
+        """
+        Возвращает случайный индекс с вероятностью, пропорциональной его весу.
+
+        :param rng: Генератор случайных чисел (по умолчанию общий генератор модуля random).
+        """
+        value = (rng or random).random() * self.size
+        index = int(value)
+        # Дробная часть того же числа служит монеткой: равномерна и независима от выбора ячейки
+        return index if value - index < self.probability[index] else self.alias[index]
+
+
+class SeedsSampler(ABC):
+    """
+    Стратегия выбора случайного пользователя из результата сидинга.
+
+    Веса вычисляются по количеству пользователей и один раз превращаются в таблицу псевдонимов,
+    поэтому выборка в on_start стоит O(1). Таблица пересчитывается, только если число пользователей
+    изменилось (например, после досоздания).
+    """
+
+    def __init__(self):
+        self.table: AliasTable | None = None
+
+    @abstractmethod
+    def weights(self, size: int) -> Sequence[float]:
+        """
+        Возвращает веса пользователей с индексами 0..size-1.
+        """
+        ...
+
+    def sample(self, size: int, rng: random.Random | None = None) -> int:
+        """
+        Выбирает индекс пользователя среди size пользователей.
+
+        :param size: Количество пользователей.
+        :param rng: Генератор случайных чисел.
+        :return: Индекс выбранного пользователя.
+        """
+        if self.table is None or self.table.size != size:
+            self.table = AliasTable(self.weights(size))
+
+        return self.table.sample(rng)
+
+
+class UniformSeedsSampler(SeedsSampler):
+    """
+    Равномерный выбор — таблица не нужна.
+    """
+
+    def weights(self, size: int) -> Sequence[float]:
+        return [1.0] * size
+
+    def sample(self, size: int, rng: random.Random | None = None) -> int:
+        return int((rng or random).random() * size)
+
+
+class ZipfSeedsSampler(SeedsSampler):
+    """
+    Распределение Ципфа: вес пользователя с номером k (с единицы) равен 1 / k^exponent.
+
+    Attributes:
+        exponent (float): Показатель степени; чем больше, тем сильнее трафик сосредоточен на первых пользователях.
+    """
+
+    def __init__(self, exponent: float = 1.0):
+        super().__init__()
+        self.exponent = exponent
+
+    def weights(self, size: int) -> Sequence[float]:
+        return [1.0 / rank ** self.exponent for rank in range(1, size + 1)]
+
+
+class HotSetSeedsSampler(SeedsSampler):
+    """
+    «Горячее множество»: первые hot_fraction пользователей получают hot_traffic всего трафика.
+
+    Attributes:
+        hot_fraction (float): Доля горячих пользователей (от 0 до 1).
+        hot_traffic (float): Доля трафика, которая приходится на горячих пользователей (от 0 до 1).
+    """
+
+    def __init__(self, hot_fraction: float = 0.2, hot_traffic: float = 0.8):
+        super().__init__()
+        self.hot_fraction = hot_fraction
+        self.hot_traffic = hot_traffic
+
+    def weights(self, size: int) -> Sequence[float]:
+        hot = min(max(1, math.ceil(size * self.hot_fraction)), size)
+        cold = size - hot
+        if cold == 0:
+            return [1.0] * size
+
+        return [self.hot_traffic / hot] * hot + [(1.0 - self.hot_traffic) / cold] * cold
+
+
+class FileSeedsSampler(SeedsSampler):
+    """
+    Веса из файла: по одному числу на строку, в порядке пользователей дампа.
+
+    Пользователи без веса в файле не выбираются, лишние веса игнорируются.
+
+    Attributes:
+        path (str): Путь к файлу с весами.
+    """
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        with open(path, "r", encoding="utf-8") as file:
+            self.file_weights = [float(line) for line in file if line.strip()]
+
+    def weights(self, size: int) -> Sequence[float]:
+        return self.file_weights[:size] + [0.0] * max(size - len(self.file_weights), 0)
+
+
+def build_seeds_sampler(config: SeedsSamplerConfig = settings.seeds.sampler) -> SeedsSampler:
+    """
+    Создаёт стратегию выбора пользователей по настройкам SEEDS.SAMPLER.*.
+
+    Стратегию стоит создавать один раз на сценарий (например, атрибутом TaskSet),
+    чтобы таблица псевдонимов строилась однократно для всех виртуальных пользователей процесса.
+
+    :param config: Настройки стратегии выбора.
+    :return: Экземпляр SeedsSampler.
+    """
+    if config.kind == SeedsSamplerKind.ZIPF:
+        return ZipfSeedsSampler(exponent=config.exponent)
+    if config.kind == SeedsSamplerKind.HOT_SET:
+        return HotSetSeedsSampler(hot_fraction=config.hot_fraction, hot_traffic=config.hot_traffic)
+    if config.kind == SeedsSamplerKind.FILE:
+        if config.weights_file is None:
+            raise ValueError("SEEDS.SAMPLER.WEIGHTS_FILE is required for the file sampler")
+
+        return FileSeedsSampler(path=config.weights_file)
+
+    return UniformSeedsSampler()
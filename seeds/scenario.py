@@ -1,9 +1,27 @@
+import time
 from abc import ABC, abstractmethod
 
-from seeds.builder import build_grpc_seeds_builder
-from seeds.dumps import save_seeds_result, load_seeds_result
+from config import settings
+from seeds.builder import SeedsBuilder, SplitSeedsBuilder, build_gateway_seeds_builder
+from seeds.dumps import (
+    SeedsDumpMeta,
+    save_seeds_meta,
+    save_seeds_stats,
+    load_seeds_result,
+    save_seeds_result,
+    remove_seeds_meta,
+    build_seeds_plan_hash,
+    is_seeds_result_actual
+)
+from seeds.journal import build_seeds_journal
+from seeds.replenisher import SeedsReplenisher
 from seeds.schema.plan import SeedsPlan
-from seeds.schema.result import SeedsResult
+from seeds.schema.result import SeedsResult, SeedUserResult
+from seeds.shared import attach_seeds_result
+from seeds.sharding import build_sharded_seeds, merge_seeds_results, shard_seeds_result
+from seeds.stats import SeedsStats
+from seeds.verifier import build_grpc_seeds_verifier, build_http_seeds_verifier, drop_stale_seeds
+from tools.config.seeds import SeedsEngine, SeedsProtocol, SeedsExhaustionPolicy, SeedsVerifyMode
 from tools.logger import get_logger
 
 # Инициализируем логгер с именем SEEDS_SCENARIO
@@ -16,12 +34,21 @@ class SeedsScenario(ABC):
     Этот класс инкапсулирует общую логику генерации, сохранения и загрузки данных для тестов.
     """
 
-    def __init__(self):
+    def __init__(self, protocol: SeedsProtocol = settings.seeds.protocol):
         """
         Инициализация класса SeedsScenario.
-        Создаёт экземпляр билдера для генерации сидинговых данных через gRPC.
+        Создаёт экземпляр билдера для генерации сидинговых данных через выбранный протокол gateway.
+        :param protocol: Протокол gateway (grpc, http или split), по умолчанию из настройки SEEDS.PROTOCOL.
         """
-        self.builder = build_grpc_seeds_builder()
+        self.use_protocol(protocol)
+
+    def use_protocol(self, protocol: SeedsProtocol) -> None:
+        """
+        Переключает сценарий на создание данных через другой протокол gateway.
+        :param protocol: Протокол gateway (grpc, http или split).
+        """
+        self.protocol = protocol
+        self.builder = build_gateway_seeds_builder(protocol=protocol)
 
     @property
     @abstractmethod
@@ -41,6 +68,22 @@ class SeedsScenario(ABC):
         """
         ...
 
+    @property
+    def meta(self) -> SeedsDumpMeta:
+        """
+        Метаданные дампа для текущего плана: хэш плана и адреса gateway, в которых создаются данные.
+        """
+        targets = {
+            SeedsProtocol.GRPC: [settings.gateway_grpc_client.client_url],
+            SeedsProtocol.HTTP: [settings.gateway_http_client.client_url],
+            SeedsProtocol.SPLIT: [settings.gateway_grpc_client.client_url, settings.gateway_http_client.client_url]
+        }
+        return SeedsDumpMeta(
+            plan_hash=build_seeds_plan_hash(self.plan),
+            target=" ".join(targets[self.protocol]),
+            dump_format=settings.seeds.dump_format
+        )
+
     def save(self, result: SeedsResult) -> None:
         """
         Сохраняет результат сидинга в файл.
@@ -52,29 +95,164 @@ class SeedsScenario(ABC):
         # Логируем успешное завершение
         logger.info(f"[{self.scenario}] Seeding result saved successfully.")
 
-    def load(self) -> SeedsResult:
+    def load(self, users: range | None = None, shared_memory: str | None = None) -> SeedsResult:
         """
-        Загружает результаты сидинга из файла.
+        Загружает результаты сидинга из файла или из разделяемой памяти мастера.
+        :param users: Диапазон индексов пользователей, который нужно оставить (для воркеров Locust).
+                      По умолчанию загружаются все пользователи.
+        :param shared_memory: Имя сегмента разделяемой памяти с опубликованным результатом.
         :return: Объект SeedsResult, содержащий данные, загруженные из файла.
         """
-        # Логируем начало загрузки
-        logger.info(f"[{self.scenario}] Loading seeding result from file.")
-        result = load_seeds_result(scenario=self.scenario)
+        result = None
+        if shared_memory:
+            try:
+                logger.info(f"[{self.scenario}] Attaching seeding result from shared memory {shared_memory}.")
+                result = attach_seeds_result(name=shared_memory)
+            except FileNotFoundError:
+                # Воркер запущен на другой машине — читаем свою копию дампа
+                logger.warning(f"[{self.scenario}] Shared memory {shared_memory} is not available.")
+
+        if result is None:
+            # Логируем начало загрузки
+            logger.info(f"[{self.scenario}] Loading seeding result from file.")
+            result = load_seeds_result(scenario=self.scenario)
+        if users is not None:
+            logger.info(f"[{self.scenario}] Keeping {len(users)} seeded users starting at index {users.start}.")
+            result = shard_seeds_result(result=result, users=users)
+        # Настраиваем, что делать, когда get_next_user выдаст всех пользователей
+        result.set_exhaustion_policy(
+            policy=settings.seeds.exhaustion_policy,
+            refill=self.refill if settings.seeds.exhaustion_policy == SeedsExhaustionPolicy.REFILL else None
+        )
         # Логируем успешную загрузку
         logger.info(f"[{self.scenario}] Seeding result loaded successfully.")
         return result
 
-    def build(self) -> None:
+    def refill(self) -> list[SeedUserResult]:
+        """
+        Досоздаёт партию пользователей по плану сценария, когда загруженные пользователи закончились.
+        Размер партии задаётся настройкой SEEDS.REFILL_SIZE.
+        :return: Список новых пользователей.
+        """
+        logger.info(f"[{self.scenario}] Seeded users are exhausted, refilling {settings.seeds.refill_size} users.")
+        return self.build_users(count=settings.seeds.refill_size)
+
+    def build_users(self, count: int, builder: SeedsBuilder | SplitSeedsBuilder | None = None) -> list[SeedUserResult]:
+        """
+        Создаёт заданное количество пользователей по плану сценария.
+        :param count: Количество пользователей.
+        :param builder: Билдер для создания; по умолчанию билдер сценария.
+        :return: Список новых пользователей.
+        """
+        plan = self.plan.model_copy(deep=True)
+        plan.users.count = count
+        return (builder or self.builder).build(plan).users
+
+    def replenisher(self, result: SeedsResult) -> SeedsReplenisher:
+        """
+        Создаёт фоновое пополнение пользователей для загруженного результата.
+        Пополнение идёт отдельным билдером с лимитом SEEDS.REPLENISH.CONCURRENCY,
+        остальные параметры задаются настройками SEEDS.REPLENISH.*.
+        :param result: Результат сидинга, из которого сценарий берёт пользователей.
+        :return: Незапущенный SeedsReplenisher.
+        """
+        config = settings.seeds.replenish
+        builder = build_gateway_seeds_builder(
+            protocol=self.protocol,
+            concurrency=config.concurrency,
+            engine=SeedsEngine.GEVENT
+        )
+        return SeedsReplenisher(
+            result=result,
+            build=lambda count: self.build_users(count=count, builder=builder),
+            low_water=config.low_water,
+            batch_size=config.batch_size,
+            interval=config.interval
+        )
+
+    def verify(self) -> bool:
+        """
+        Проверяет переиспользуемый дамп на сущности, которых больше нет в gateway (например, после сброса стенда).
+        Найденные устаревшие пользователи удаляются из дампа.
+        Режим и параметры проверки задаются настройками SEEDS.VERIFY.*.
+        :return: False, если доля устаревших пользователей достигла порога и дамп нужно пересоздать.
+        """
+        config = settings.seeds.verify
+        if config.mode == SeedsVerifyMode.NONE:
+            return True
+
+        result = load_seeds_result(scenario=self.scenario)
+        verifier = build_http_seeds_verifier() if self.protocol == SeedsProtocol.HTTP else build_grpc_seeds_verifier()
+        report = verifier.verify(
+            result=result,
+            sample=config.sample if config.mode == SeedsVerifyMode.SAMPLE else None,
+            operations=config.operations
+        )
+        if report.checked and report.stale_fraction >= config.rebuild_threshold:
+            return False
+
+        if report.stale_user_ids:
+            logger.info(f"[{self.scenario}] Dropping {len(report.stale_user_ids)} stale users from the dump.")
+            self.save(drop_stale_seeds(result=result, report=report))
+
+        return True
+
+    def build(self, force: bool = settings.seeds.force) -> None:
         """
         Генерирует данные с помощью билдера, используя план сидинга, и сохраняет результат.
+        Если дамп уже построен по тому же плану для того же gateway, генерация пропускается.
+
+        :param force: Пересоздать данные, даже если актуальный дамп уже есть.
         """
+        meta = self.meta
+        if not force and is_seeds_result_actual(meta=meta, scenario=self.scenario):
+            logger.info(f"[{self.scenario}] Seeding result is up to date with the plan, skipping generation.")
+            if self.verify():
+                return
+            logger.info(f"[{self.scenario}] Most of the seeded data is stale, rebuilding.")
+
+        # Дамп перестраивается: до сохранения нового результата старый не считается актуальным
+        remove_seeds_meta(scenario=self.scenario)
         # Преобразуем план сидинга в JSON для логов (без значений по умолчанию)
         plan_json = self.plan.model_dump_json(indent=2, exclude_defaults=True)
         # Логируем начало генерации
         logger.info(f"[{self.scenario}] Starting seeding data generation for plan: {plan_json}")
-        # Запускаем генерацию
-        result = self.builder.build(self.plan)
-        # Логируем завершение генерации
-        logger.info(f"[{self.scenario}] Seeding data generation completed.")
-        # Сохраняем результат
+        # Поднимаем пользователей, уже созданных прерванным запуском
+        journal = build_seeds_journal(scenario=self.scenario)
+        done = journal.load(self.plan) if settings.seeds.resume else []
+        if done:
+            logger.info(f"[{self.scenario}] Resuming seeding: {len(done)} of {self.plan.users.count} users restored")
+        else:
+            journal.start(self.plan)
+        # Досоздаём только недостающих пользователей
+        plan = self.plan.model_copy(deep=True)
+        plan.users.count = max(self.plan.users.count - len(done), 0)
+        # Запускаем генерацию: в текущем процессе или в нескольких процессах-воркерах
+        processes = settings.seeds.processes
+        stats = SeedsStats()
+        started = time.perf_counter()
+        if plan.users.count == 0:
+            result = SeedsResult()
+        elif processes > 1 or settings.seeds.engine == SeedsEngine.ASYNCIO:
+            result = build_sharded_seeds(
+                plan=plan,
+                processes=processes,
+                engine=settings.seeds.engine,
+                protocol=self.protocol,
+                concurrency=settings.seeds.concurrency,
+                journal=journal,
+                stats=stats
+            )
+        else:
+            self.builder.stats = stats
+            result = self.builder.build(plan, journal=journal)
+        stats.elapsed = time.perf_counter() - started
+        journal.close()
+        result = merge_seeds_results([SeedsResult(users=done), result])
+        # Логируем завершение генерации и сводку по вызовам gateway
+        logger.info(f"[{self.scenario}] Seeding data generation completed.\n{stats.summary()}")
+        save_seeds_stats(stats=stats, scenario=self.scenario)
+        # Сохраняем результат; журнал после этого больше не нужен
         self.save(result)
+        save_seeds_meta(meta=meta, scenario=self.scenario)
+        journal.remove()
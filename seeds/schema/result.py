@@ -1,6 +1,17 @@
 import random
+from bisect import bisect_right
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Callable
 
-from pydantic import BaseModel, Field
+from gevent.lock import Semaphore
+from pydantic import BaseModel, Field, PrivateAttr
+
+from tools.config.seeds import SeedsExhaustionPolicy
+
+if TYPE_CHECKING:
+    # Только для аннотаций: seeds.samplers читает settings при импорте,
+    # а схема результата должна загружаться без окружения GATEWAY_*
+    from seeds.samplers import SeedsSampler
 
 
 class SeedCardResult(BaseModel):
@@ -60,35 +71,177 @@ class SeedUserResult(BaseModel):
     credit_card_accounts: list[SeedAccountResult] = Field(default_factory=list)
 
 
+class SeedsExhaustedError(IndexError):
+    """
+    Все пользователи из результата сидинга уже выданы, и политика исчерпания не позволяет продолжить.
+    """
+
+
+class SeedUsersChain(Sequence[SeedUserResult]):
+    """
+    Последовательность пользователей, склеенная из нескольких частей без копирования.
+
+    Нужна, чтобы дописывать пользователей к ленивому дампу, не декодируя его целиком.
+
+    Attributes:
+        parts (list[Sequence[SeedUserResult]]): Части последовательности.
+        offsets (list[int]): Индекс первого пользователя каждой части в общей последовательности.
+    """
+
+    def __init__(self, parts: list[Sequence[SeedUserResult]]):
+        self.parts = []
+        self.offsets = []
+        self.length = 0
+        for part in parts:
+            self.append(part)
+
+    def append(self, part: Sequence[SeedUserResult]) -> None:
+        self.parts.append(part)
+        self.offsets.append(self.length)
+        self.length += len(part)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(self.length))]
+
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("seed users index out of range")
+
+        part = bisect_right(self.offsets, index) - 1
+        return self.parts[part][index - self.offsets[part]]
+
+
 class SeedsResult(BaseModel):
     """
     Главная модель результата сидинга — агрегирует всех созданных пользователей.
 
     Attributes:
         users (list[SeedUserResult]): Список сгенерированных пользователей.
+            После загрузки JSONL-дампа это ленивая последовательность (см. seeds.formats).
     """
 
     users: list[SeedUserResult] = Field(default_factory=list)
 
+    # Индекс следующего пользователя для get_next_user
+    _cursor: int = PrivateAttr(default=0)
+    # Поведение get_next_user после выдачи всех пользователей
+    _exhaustion_policy: SeedsExhaustionPolicy = PrivateAttr(default=SeedsExhaustionPolicy.RAISE)
+    # Функция, досоздающая пользователей для политики REFILL
+    _refill: Callable[[], Sequence[SeedUserResult]] | None = PrivateAttr(default=None)
+    # Не даём нескольким виртуальным пользователям досоздавать данные одновременно
+    _refill_lock: Semaphore = PrivateAttr(default_factory=Semaphore)
+
+    @property
+    def remaining(self) -> int:
+        """
+        Количество пользователей, которые get_next_user ещё не выдал.
+        """
+        return len(self.users) - self._cursor
+
+    def set_exhaustion_policy(
+            self,
+            policy: SeedsExhaustionPolicy,
+            refill: Callable[[], Sequence[SeedUserResult]] | None = None
+    ) -> None:
+        """
+        Настраивает поведение get_next_user после выдачи всех пользователей.
+
+        Args:
+            policy: Политика исчерпания: raise, wrap или refill.
+            refill: Функция, возвращающая новую партию пользователей. Обязательна для политики refill.
+        """
+        if policy == SeedsExhaustionPolicy.REFILL and refill is None:
+            raise ValueError("refill exhaustion policy requires a refill function")
+
+        self._exhaustion_policy = policy
+        self._refill = refill
+
+    def extend(self, users: Sequence[SeedUserResult]) -> None:
+        """
+        Дописывает пользователей в конец раздачи.
+
+        Ленивые последовательности из дампов не копируются, а склеиваются с новой частью.
+
+        Args:
+            users: Новые пользователи.
+        """
+        if isinstance(self.users, list) and isinstance(users, list):
+            self.users.extend(users)
+        elif isinstance(self.users, SeedUsersChain):
+            self.users.append(users)
+        else:
+            self.users = SeedUsersChain([self.users, users])
+
     def get_next_user(self) -> SeedUserResult:
         """
-        Возвращает и удаляет первого пользователя из списка.
+        Возвращает следующего ещё не выданного пользователя за O(1).
 
         Используется в случае, когда на каждый виртуальный юзер нужен новый тестовый пользователь.
         Удобно при строго последовательной раздаче пользователей в тестовых сценариях.
+        Когда пользователи заканчиваются, действует политика исчерпания (см. set_exhaustion_policy).
 
         Returns:
             SeedUserResult: Следующий пользователь из списка.
+
+        Raises:
+            SeedsExhaustedError: Если все пользователи выданы и политика не позволяет продолжить.
         """
-        return self.users.pop(0)
+        cursor = self._cursor
+        if cursor >= len(self.users):
+            self.handle_exhaustion()
+            cursor = self._cursor
+
+        self._cursor = cursor + 1
+        return self.users[cursor]
 
-    def get_random_user(self) -> SeedUserResult:
+    def handle_exhaustion(self) -> None:
+        """
+        Применяет политику исчерпания: сбрасывает курсор или досоздаёт пользователей.
+        """
+        if self._exhaustion_policy == SeedsExhaustionPolicy.WRAP and len(self.users) > 0:
+            self._cursor = 0
+            return
+
+        if self._exhaustion_policy == SeedsExhaustionPolicy.REFILL:
+            with self._refill_lock:
+                # Пока ждали блокировку, партию мог досоздать другой виртуальный пользователь
+                if self._cursor < len(self.users):
+                    return
+
+                self.extend(self._refill())
+                if self._cursor < len(self.users):
+                    return
+
+        raise SeedsExhaustedError(
+            f"All {len(self.users)} seeded users have already been handed out "
+            f"(exhaustion policy: {self._exhaustion_policy})"
+        )
+
+    def get_random_user(
+            self,
+            sampler: "SeedsSampler | None" = None,
+            rng: random.Random | None = None
+    ) -> SeedUserResult:
         """
         Возвращает случайного пользователя из списка без удаления.
 
         Используется в ситуациях, когда порядок не имеет значения, и пользователь выбирается случайно.
 
+        Args:
+            sampler: Стратегия выбора (см. seeds.samplers), например Ципф или «горячее множество».
+                По умолчанию пользователь выбирается равновероятно.
+            rng: Генератор случайных чисел, например генератор виртуального пользователя
+                для воспроизводимых прогонов. По умолчанию общий генератор модуля random.
+
         Returns:
             SeedUserResult: Случайный пользователь.
         """
-        return random.choice(self.users)
+        if sampler is None:
+            return (rng or random).choice(self.users)
+
+        return self.users[sampler.sample(len(self.users), rng)]
@@ -0,0 +1,234 @@
+import os
+import subprocess
+import sys
+import tempfile
+from collections.abc import Iterable, Sequence
+
+import gevent
+
+from seeds.journal import SeedsJournal
+from seeds.schema.plan import SeedsPlan
+from seeds.schema.result import SeedsResult
+from seeds.stats import SeedsStats
+from tools.config.seeds import SeedsEngine, SeedsProtocol
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_SHARDING")
+
+
+def shard_seeds_plan(plan: SeedsPlan, shards: int) -> list[SeedsPlan]:
+    """
+    Делит план на shards частей по количеству пользователей.
+
+    Остаток от деления распределяется по первым частям, пустые части не создаются.
+
+    :param plan: Исходный план сидинга.
+    :param shards: Желаемое количество частей.
+    :return: Список планов, сумма пользователей которых равна plan.users.count.
+    """
+    count = plan.users.count
+    shards = max(1, min(shards, count))
+    base, remainder = divmod(count, shards)
+
+    return [
+        plan.model_copy(update={"users": plan.users.model_copy(update={"count": base + (index < remainder)})})
+        for index in range(shards)
+    ]
+
+
+def shard_seeds_range(size: int, index: int, count: int) -> range:
+    """
+    Возвращает индексы index-й из count непрерывных частей последовательности длины size.
+
+    Остаток от деления достаётся первым частям.
+
+    :param size: Длина делимой последовательности.
+    :param index: Номер части (с нуля).
+    :param count: Общее количество частей.
+    :return: Диапазон индексов части.
+    """
+    base, remainder = divmod(size, count)
+    start = index * base + min(index, remainder)
+    return range(start, start + base + (index < remainder))
+
+
+def shard_seeds_result(result: SeedsResult, users: range) -> SeedsResult:
+    """
+    Возвращает результат сидинга только с пользователями из заданного диапазона индексов.
+
+    Для ленивых дампов срез не декодирует пользователей.
+
+    :param result: Полный результат сидинга.
+    :param users: Диапазон индексов пользователей (см. shard_seeds_range и SeedsShardAllocator).
+    :return: SeedsResult только с пользователями этой части.
+    """
+    return SeedsResult.model_construct(users=result.users[users.start:users.stop])
+
+
+class SeedsShardAllocator:
+    """
+    Раздаёт воркерам Locust непересекающиеся диапазоны пользователей дампа.
+
+    При старте теста пользователи делятся между подключёнными воркерами, а доля reserve откладывается.
+    Воркер, подключившийся во время теста, получает половину самого большого свободного диапазона,
+    поэтому ни один пользователь не выдаётся двум работающим воркерам одновременно,
+    а уже работающие воркеры сохраняют свои диапазоны и позиции в них.
+
+    Диапазоны отключившихся воркеров возвращаются в свободные и отдаются новым воркерам,
+    только когда нетронутый резерв закончился: часть их пользователей уже была выдана.
+
+    Attributes:
+        total: Количество пользователей в дампе.
+        reserve: Доля пользователей, откладываемая для воркеров, подключающихся во время теста.
+        assigned: Диапазон пользователей каждого воркера.
+    """
+
+    def __init__(self, total: int, reserve: float):
+        self.total = total
+        self.reserve = reserve
+        self.assigned: dict[str, range] = {}
+        self.free: list[range] = []
+        self.released: list[range] = []
+
+    def partition(self, workers: Sequence[str]) -> dict[str, range]:
+        """
+        Заново делит всех пользователей между воркерами, откладывая резерв.
+
+        :param workers: Идентификаторы воркеров в порядке их номеров.
+        :return: Диапазон пользователей каждого воркера.
+        """
+        shared = self.total - int(self.total * self.reserve) if workers else 0
+        self.assigned = {
+            worker: shard_seeds_range(shared, index, len(workers))
+            for index, worker in enumerate(workers)
+        }
+        self.free = [range(shared, self.total)] if shared < self.total else []
+        self.released = []
+        return dict(self.assigned)
+
+    def assign(self, worker: str, connected: Iterable[str]) -> range:
+        """
+        Выделяет диапазон воркеру, подключившемуся во время теста.
+
+        :param worker: Идентификатор подключившегося воркера.
+        :param connected: Идентификаторы остальных подключённых воркеров; диапазоны отсутствующих освобождаются.
+        :return: Диапазон пользователей воркера; пустой, если свободных пользователей не осталось.
+        """
+        connected = set(connected)
+        for gone in [worker_id for worker_id in self.assigned if worker_id not in connected]:
+            self.released.append(self.assigned.pop(gone))
+
+        ranges = self.free if self.free else self.released
+        largest = max(ranges, key=len, default=range(0))
+        if largest:
+            ranges.remove(largest)
+            middle = largest.start + (len(largest) + 1) // 2
+            if middle < largest.stop:
+                ranges.append(range(middle, largest.stop))
+            largest = range(largest.start, middle)
+
+        self.assigned[worker] = largest
+        return largest
+
+
+def merge_seeds_results(results: Iterable[SeedsResult]) -> SeedsResult:
+    """
+    Объединяет частичные результаты сидинга в один, сохраняя порядок частей.
+
+    :param results: Результаты отдельных воркеров.
+    :return: Общий SeedsResult.
+    """
+    return SeedsResult(users=[user for result in results for user in result.users])
+
+
+def run_seeds_worker(
+        plan: SeedsPlan,
+        engine: SeedsEngine,
+        protocol: SeedsProtocol,
+        concurrency: int,
+        journal: SeedsJournal | None = None,
+        stats: SeedsStats | None = None
+) -> SeedsResult:
+    """
+    Выполняет план в отдельном процессе `python -m seeds.worker`.
+
+    Для движка asyncio процесс запускается с LOCUST_SKIP_MONKEY_PATCH=1,
+    так как grpc.aio несовместим с monkey-patching gevent.
+    Если передан журнал, воркер сам дописывает в него готовых пользователей.
+    Если передан stats, в него добавляется телеметрия воркера.
+
+    :return: Результат сидинга, прочитанный из stdout воркера.
+    """
+    env = {**os.environ}
+    if engine == SeedsEngine.ASYNCIO:
+        env["LOCUST_SKIP_MONKEY_PATCH"] = "1"
+
+    args = [
+        sys.executable, "-m", "seeds.worker",
+        "--engine", engine,
+        "--protocol", protocol,
+        "--concurrency", str(concurrency)
+    ]
+    if journal is not None:
+        args += ["--journal", journal.path]
+
+    with tempfile.TemporaryDirectory() as directory:
+        stats_file = os.path.join(directory, "stats.json")
+        process = subprocess.run(
+            [*args, "--stats", stats_file],
+            env=env,
+            input=plan.model_dump_json().encode(),
+            stdout=subprocess.PIPE,
+            check=True
+        )
+        if stats is not None:
+            with open(stats_file, "r", encoding="utf-8") as file:
+                stats.merge(SeedsStats.model_validate_json(file.read()))
+
+    return SeedsResult.model_validate_json(process.stdout)
+
+
+def build_sharded_seeds(
+        plan: SeedsPlan,
+        processes: int,
+        engine: SeedsEngine,
+        protocol: SeedsProtocol,
+        concurrency: int,
+        journal: SeedsJournal | None = None,
+        stats: SeedsStats | None = None
+) -> SeedsResult:
+    """
+    Делит план между processes процессами-воркерами, запускает их одновременно и объединяет результаты.
+
+    Лимит concurrency делится между воркерами (каждому не меньше одного запроса),
+    поэтому общее количество одновременных запросов к gateway не растёт с числом процессов.
+
+    :param plan: Полный план сидинга.
+    :param processes: Количество процессов-воркеров.
+    :param engine: Движок сидинга в воркерах.
+    :param protocol: Протокол gateway; в режиме split воркеры чередуют gRPC и HTTP.
+    :param concurrency: Общий лимит одновременных запросов всех воркеров.
+    :param journal: Общий журнал сидинга, который дописывают все воркеры.
+    :param stats: Телеметрия, в которую сводятся вызовы всех воркеров.
+    :return: Объединённый SeedsResult.
+    """
+    # В режиме split воркеры поочерёдно получают gRPC и HTTP gateway, поэтому их нужно не меньше двух
+    shards = shard_seeds_plan(plan, max(processes, 2) if protocol == SeedsProtocol.SPLIT else processes)
+    protocols = [SeedsProtocol.GRPC, SeedsProtocol.HTTP] if protocol == SeedsProtocol.SPLIT else [protocol]
+    logger.info(f"Seeding {plan.users.count} users in {len(shards)} worker processes")
+
+    greenlets = [
+        gevent.spawn(
+            run_seeds_worker,
+            plan=shard,
+            engine=engine,
+            protocol=protocols[index % len(protocols)],
+            concurrency=max(1, len(shard_seeds_range(concurrency, index, len(shards)))),
+            journal=journal,
+            stats=stats
+        )
+        for index, shard in enumerate(shards)
+    ]
+    gevent.joinall(greenlets, raise_error=True)
+
+    return merge_seeds_results(greenlet.value for greenlet in greenlets)
@@ -0,0 +1,67 @@
+import io
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+from seeds.formats.binary import BinarySeedUsers, write_binary_seeds_users
+from seeds.schema.result import SeedsResult
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_SHARED")
+
+
+def publish_seeds_result(result: SeedsResult) -> SharedMemory | None:
+    """
+    Публикует пользователей в разделяемую память в бинарном колоночном формате.
+
+    Используется мастером Locust при запуске с --processes: воркеры на той же машине подключаются
+    к сегменту по имени и читают пользователей без собственной копии дампа.
+
+    :param result: Результат сидинга.
+    :return: Сегмент разделяемой памяти или None, если опубликовать не удалось
+             (идентификаторы не UUID или не хватает места в /dev/shm).
+    """
+    buffer = io.BytesIO()
+    try:
+        write_binary_seeds_users(users=result.users, file=buffer)
+    except ValueError as error:
+        logger.warning(f"Seeding result can't be published to shared memory: {error}")
+        return None
+
+    data = buffer.getbuffer()
+    try:
+        memory = SharedMemory(create=True, size=max(len(data), 1))
+    except OSError as error:
+        logger.warning(f"Failed to allocate {len(data)} bytes of shared memory for seeding result: {error}")
+        return None
+
+    memory.buf[:len(data)] = data
+    logger.info(f"Seeding result published to shared memory {memory.name} ({len(data)} bytes)")
+    return memory
+
+
+def attach_seeds_result(name: str) -> SeedsResult:
+    """
+    Подключается к опубликованному мастером сегменту и возвращает пользователей только для чтения.
+
+    :param name: Имя сегмента разделяемой памяти.
+    :return: SeedsResult с ленивым списком пользователей поверх разделяемой памяти.
+    :raises FileNotFoundError: Если сегмента нет (например, воркер запущен на другой машине).
+    """
+    memory = SharedMemory(name=name)
+    # В Python < 3.13 подключение регистрирует сегмент в resource_tracker воркера,
+    # и тот удаляет его при выходе воркера. Сегментом владеет мастер, поэтому снимаем регистрацию.
+    resource_tracker.unregister(memory._name, "shared_memory")
+
+    users = BinarySeedUsers(data=memory.buf.toreadonly(), source=memory)
+    return SeedsResult.model_construct(users=users)
+
+
+def release_seeds_result(memory: SharedMemory) -> None:
+    """
+    Закрывает и удаляет сегмент разделяемой памяти, опубликованный мастером.
+
+    :param memory: Сегмент разделяемой памяти.
+    """
+    memory.close()
+    memory.unlink()
+    logger.info(f"Shared memory {memory.name} with seeding result released")
@@ -0,0 +1,147 @@
+from pydantic import BaseModel, Field
+
+# Перцентили, которые выводятся в сводке сидинга
+PERCENTILES = (0.5, 0.95, 0.99)
+
+
+def round_response_time(response_time: float) -> int:
+    """
+    Округляет время ответа для гистограммы так же, как это делает Locust:
+    до 1 мс ниже 100 мс, до 10 мс ниже 1 с и до 100 мс выше.
+    Гистограмма остаётся компактной при любом количестве вызовов.
+
+    :param response_time: Время ответа, в миллисекундах.
+    :return: Округлённое значение — ключ гистограммы.
+    """
+    if response_time < 100:
+        return round(response_time)
+    if response_time < 1000:
+        return int(round(response_time, -1))
+    return int(round(response_time, -2))
+
+
+class SeedsMethodStats(BaseModel):
+    """
+    Статистика вызовов одного метода gateway во время сидинга.
+
+    Attributes:
+        calls (int): Количество вызовов.
+        errors (int): Количество вызовов, завершившихся ошибкой.
+        total_time (float): Суммарное время ответов, в миллисекундах.
+        max_time (float): Максимальное время ответа, в миллисекундах.
+        response_times (dict[int, int]): Гистограмма: округлённое время ответа → количество вызовов.
+    """
+    calls: int = 0
+    errors: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    response_times: dict[int, int] = Field(default_factory=dict)
+
+    @property
+    def avg_time(self) -> float:
+        return self.total_time / self.calls if self.calls else 0.0
+
+    def record(self, response_time: float, error: bool = False) -> None:
+        self.calls += 1
+        self.errors += error
+        self.total_time += response_time
+        self.max_time = max(self.max_time, response_time)
+
+        key = round_response_time(response_time)
+        self.response_times[key] = self.response_times.get(key, 0) + 1
+
+    def percentile(self, percent: float) -> int:
+        """
+        Возвращает время ответа, в которое укладывается заданная доля вызовов.
+
+        :param percent: Доля от 0 до 1 (например, 0.95).
+        :return: Время ответа, в миллисекундах (с точностью гистограммы).
+        """
+        if not self.calls:
+            return 0
+
+        threshold = self.calls * percent
+        processed = 0
+        for response_time in sorted(self.response_times):
+            processed += self.response_times[response_time]
+            if processed >= threshold:
+                return response_time
+
+        return max(self.response_times)
+
+    def merge(self, other: "SeedsMethodStats") -> None:
+        self.calls += other.calls
+        self.errors += other.errors
+        self.total_time += other.total_time
+        self.max_time = max(self.max_time, other.max_time)
+        for response_time, count in other.response_times.items():
+            self.response_times[response_time] = self.response_times.get(response_time, 0) + count
+
+
+class SeedsStats(BaseModel):
+    """
+    Телеметрия сидинга: статистика по каждому методу gateway и общая длительность.
+
+    Attributes:
+        methods (dict[str, SeedsMethodStats]): Статистика по имени метода клиента (например, create_user).
+        elapsed (float): Длительность сидинга, в секундах.
+    """
+    methods: dict[str, SeedsMethodStats] = Field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def calls(self) -> int:
+        return sum(method.calls for method in self.methods.values())
+
+    @property
+    def entities(self) -> int:
+        """
+        Количество созданных сущностей: каждый успешный вызов создаёт пользователя, счёт, карту или операцию.
+        """
+        return sum(method.calls - method.errors for method in self.methods.values())
+
+    def record(self, method: str, response_time: float, error: bool = False) -> None:
+        """
+        Учитывает один вызов метода gateway.
+
+        :param method: Имя метода клиента.
+        :param response_time: Время ответа, в миллисекундах.
+        :param error: Завершился ли вызов ошибкой.
+        """
+        stats = self.methods.get(method)
+        if stats is None:
+            stats = self.methods[method] = SeedsMethodStats()
+
+        stats.record(response_time, error)
+
+    def merge(self, other: "SeedsStats") -> None:
+        """
+        Добавляет статистику другого билдера (например, процесса-воркера). Длительность не суммируется:
+        воркеры работают одновременно, общую длительность задаёт вызывающая сторона.
+        """
+        for method, stats in other.methods.items():
+            self.methods.setdefault(method, SeedsMethodStats()).merge(stats)
+
+    def summary(self) -> str:
+        """
+        Формирует сводную таблицу по методам gateway для вывода в лог.
+
+        :return: Многострочная таблица с количеством вызовов, ошибок, временами ответа и RPS.
+        """
+        header = f"{'Method':<36}{'Calls':>8}{'Errors':>8}{'Avg':>8}{'p50':>8}{'p95':>8}{'p99':>8}{'Max':>8}{'RPS':>9}"
+        lines = [header, "-" * len(header)]
+        for name, method in sorted(self.methods.items()):
+            rps = method.calls / self.elapsed if self.elapsed else 0.0
+            percentiles = "".join(f"{method.percentile(percent):>8}" for percent in PERCENTILES)
+            lines.append(
+                f"{name:<36}{method.calls:>8}{method.errors:>8}{method.avg_time:>8.0f}"
+                f"{percentiles}{method.max_time:>8.0f}{rps:>9.1f}"
+            )
+
+        lines.append("-" * len(header))
+        entities_per_second = self.entities / self.elapsed if self.elapsed else 0.0
+        lines.append(
+            f"Total: {self.calls} calls, {self.entities} entities in {self.elapsed:.1f}s "
+            f"({entities_per_second:.1f} entities/s). Times in ms."
+        )
+        return "\n".join(lines)
@@ -0,0 +1,251 @@
+import random
+from abc import ABC, abstractmethod
+
+import grpc
+from gevent.pool import Pool
+from pydantic import BaseModel, Field
+
+from clients.grpc.gateway.accounts.client import AccountsGatewayGRPCClient, build_accounts_gateway_grpc_client
+from clients.grpc.gateway.operations.client import OperationsGatewayGRPCClient, build_operations_gateway_grpc_client
+from clients.grpc.gateway.users.client import UsersGatewayGRPCClient, build_users_gateway_grpc_client
+from clients.http.gateway.accounts.client import AccountsGatewayHTTPClient, build_accounts_gateway_http_client
+from clients.http.gateway.accounts.schema import GetAccountsQuerySchema, GetAccountsResponseSchema
+from clients.http.gateway.operations.client import OperationsGatewayHTTPClient, build_operations_gateway_http_client
+from clients.http.gateway.users.client import UsersGatewayHTTPClient, build_users_gateway_http_client
+from config import settings
+from seeds.schema.result import SeedsResult, SeedUserResult
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_VERIFIER")
+
+# Виды счетов пользователя в результате сидинга
+ACCOUNT_KINDS = ("deposit_accounts", "savings_accounts", "debit_card_accounts", "credit_card_accounts")
+# Виды операций счёта в результате сидинга
+OPERATION_KINDS = ("top_up_operations", "purchase_operations", "transfer_operations", "cash_withdrawal_operations")
+
+
+class SeedsVerificationReport(BaseModel):
+    """
+    Результат проверки дампа сидинга на актуальность.
+
+    Attributes:
+        total (int): Количество пользователей в дампе.
+        checked (int): Количество проверенных пользователей.
+        stale_user_ids (list[str]): Пользователи, которых (или чьих счетов и операций) больше нет в gateway.
+    """
+    total: int = 0
+    checked: int = 0
+    stale_user_ids: list[str] = Field(default_factory=list)
+
+    @property
+    def stale_fraction(self) -> float:
+        """
+        Доля устаревших пользователей среди проверенных.
+        """
+        return len(self.stale_user_ids) / self.checked if self.checked else 0.0
+
+
+class SeedsVerifier(ABC):
+    """
+    Проверяет, что пользователи, счета и операции из дампа ещё существуют в gateway.
+
+    Пользователь считается устаревшим, если не найден он сам, какой-либо из его счетов
+    (проверяется одним запросом get_accounts) или какая-либо из операций.
+    Прочие ошибки gateway пробрасываются: проверку на недоступном стенде нельзя считать пройденной.
+
+    Attributes:
+        concurrency: Количество одновременных проверок
+    """
+
+    def __init__(self, concurrency: int):
+        self.concurrency = concurrency
+
+    @abstractmethod
+    def user_exists(self, user_id: str) -> bool:
+        ...
+
+    @abstractmethod
+    def get_account_ids(self, user_id: str) -> set[str] | None:
+        """
+        Возвращает идентификаторы счетов пользователя или None, если пользователь не найден.
+        """
+        ...
+
+    @abstractmethod
+    def operation_exists(self, operation_id: str) -> bool:
+        ...
+
+    def is_user_actual(self, user: SeedUserResult, operations: bool) -> bool:
+        """
+        Проверяет пользователя, его счета и (если нужно) операции.
+
+        :param user: Пользователь из дампа.
+        :param operations: Проверять ли каждую операцию (отдельный запрос на операцию).
+        :return: True, если все сущности пользователя существуют.
+        """
+        if not self.user_exists(user.user_id):
+            return False
+
+        accounts = [account for kind in ACCOUNT_KINDS for account in getattr(user, kind)]
+        if accounts:
+            account_ids = self.get_account_ids(user.user_id)
+            if account_ids is None or any(account.account_id not in account_ids for account in accounts):
+                return False
+
+        if operations:
+            for account in accounts:
+                for kind in OPERATION_KINDS:
+                    for operation in getattr(account, kind):
+                        if not self.operation_exists(operation.operation_id):
+                            return False
+
+        return True
+
+    def verify(
+            self,
+            result: SeedsResult,
+            sample: int | None = None,
+            operations: bool = True
+    ) -> SeedsVerificationReport:
+        """
+        Проверяет пользователей дампа параллельно пулом greenlet'ов.
+
+        :param result: Результат сидинга.
+        :param sample: Количество случайных пользователей для проверки; None — проверить всех.
+        :param operations: Проверять ли операции.
+        :return: Отчёт с долей устаревших пользователей.
+        """
+        total = len(result.users)
+        indexes = range(total) if sample is None or sample >= total else random.sample(range(total), sample)
+
+        def check(index: int) -> str | None:
+            user = result.users[index]
+            return None if self.is_user_actual(user, operations) else user.user_id
+
+        stale = [user_id for user_id in Pool(self.concurrency).imap_unordered(check, indexes) if user_id]
+        report = SeedsVerificationReport(total=total, checked=len(indexes), stale_user_ids=stale)
+        logger.info(
+            f"Verified {report.checked} of {report.total} seeded users: "
+            f"{len(report.stale_user_ids)} stale ({report.stale_fraction:.1%})"
+        )
+        return report
+
+
+def drop_stale_seeds(result: SeedsResult, report: SeedsVerificationReport) -> SeedsResult:
+    """
+    Возвращает результат сидинга без пользователей, отмеченных в отчёте как устаревшие.
+    """
+    stale = set(report.stale_user_ids)
+    return SeedsResult(users=[user for user in result.users if user.user_id not in stale])
+
+
+class GRPCSeedsVerifier(SeedsVerifier):
+    """
+    Проверка через gRPC gateway: отсутствующая сущность — ответ со статусом NOT_FOUND.
+    """
+
+    def __init__(
+            self,
+            users_gateway_client: UsersGatewayGRPCClient,
+            accounts_gateway_client: AccountsGatewayGRPCClient,
+            operations_gateway_client: OperationsGatewayGRPCClient,
+            concurrency: int
+    ):
+        super().__init__(concurrency=concurrency)
+        self.users_gateway_client = users_gateway_client
+        self.accounts_gateway_client = accounts_gateway_client
+        self.operations_gateway_client = operations_gateway_client
+
+    @staticmethod
+    def is_not_found(error: grpc.RpcError) -> bool:
+        return error.code() == grpc.StatusCode.NOT_FOUND
+
+    def user_exists(self, user_id: str) -> bool:
+        try:
+            self.users_gateway_client.get_user(user_id)
+        except grpc.RpcError as error:
+            if self.is_not_found(error):
+                return False
+            raise
+        return True
+
+    def get_account_ids(self, user_id: str) -> set[str] | None:
+        try:
+            response = self.accounts_gateway_client.get_accounts(user_id)
+        except grpc.RpcError as error:
+            if self.is_not_found(error):
+                return None
+            raise
+        return {account.id for account in response.accounts}
+
+    def operation_exists(self, operation_id: str) -> bool:
+        try:
+            self.operations_gateway_client.get_operation(operation_id)
+        except grpc.RpcError as error:
+            if self.is_not_found(error):
+                return False
+            raise
+        return True
+
+
+class HTTPSeedsVerifier(SeedsVerifier):
+    """
+    Проверка через HTTP gateway: отсутствующая сущность — ответ 404.
+    """
+
+    def __init__(
+            self,
+            users_gateway_client: UsersGatewayHTTPClient,
+            accounts_gateway_client: AccountsGatewayHTTPClient,
+            operations_gateway_client: OperationsGatewayHTTPClient,
+            concurrency: int
+    ):
+        super().__init__(concurrency=concurrency)
+        self.users_gateway_client = users_gateway_client
+        self.accounts_gateway_client = accounts_gateway_client
+        self.operations_gateway_client = operations_gateway_client
+
+    def user_exists(self, user_id: str) -> bool:
+        response = self.users_gateway_client.get_user_api(user_id)
+        if response.status_code == 404:
+            return False
+        response.raise_for_status()
+        return True
+
+    def get_account_ids(self, user_id: str) -> set[str] | None:
+        response = self.accounts_gateway_client.get_accounts_api(GetAccountsQuerySchema(user_id=user_id))
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return {account.id for account in GetAccountsResponseSchema.model_validate_json(response.content).accounts}
+
+    def operation_exists(self, operation_id: str) -> bool:
+        response = self.operations_gateway_client.get_operation_api(operation_id)
+        if response.status_code == 404:
+            return False
+        response.raise_for_status()
+        return True
+
+
+def build_grpc_seeds_verifier(concurrency: int = settings.seeds.verify.concurrency) -> GRPCSeedsVerifier:
+    """
+    Фабрика для создания верификатора дампов с gRPC-клиентами.
+    """
+    return GRPCSeedsVerifier(
+        users_gateway_client=build_users_gateway_grpc_client(),
+        accounts_gateway_client=build_accounts_gateway_grpc_client(),
+        operations_gateway_client=build_operations_gateway_grpc_client(),
+        concurrency=concurrency
+    )
+
+
+def build_http_seeds_verifier(concurrency: int = settings.seeds.verify.concurrency) -> HTTPSeedsVerifier:
+    """
+    Фабрика для создания верификатора дампов с HTTP-клиентами.
+    """
+    return HTTPSeedsVerifier(
+        users_gateway_client=build_users_gateway_http_client(),
+        accounts_gateway_client=build_accounts_gateway_http_client(),
+        operations_gateway_client=build_operations_gateway_http_client(),
+        concurrency=concurrency
+    )
@@ -0,0 +1,80 @@
+import argparse
+import asyncio
+import sys
+
+from seeds.async_builder import build_async
+from seeds.builder import build_gateway_seeds_builder
+from seeds.journal import SeedsJournal
+from seeds.schema.plan import SeedsPlan
+from seeds.schema.result import SeedsResult
+from seeds.stats import SeedsStats
+from tools.config.seeds import SeedsEngine, SeedsProtocol
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_WORKER")
+
+
+def build_seeds_result(
+        plan: SeedsPlan,
+        engine: SeedsEngine,
+        protocol: SeedsProtocol,
+        concurrency: int,
+        journal: SeedsJournal | None = None,
+        stats: SeedsStats | None = None
+) -> SeedsResult:
+    """
+    Выполняет план сидинга выбранным движком и протоколом в текущем процессе.
+
+    Движок asyncio требует процесса без monkey-patching gevent
+    (см. run_seeds_worker — он запускает такой процесс).
+
+    Args:
+        plan: План сидинга
+        engine: Движок сидинга (gevent, pipeline или asyncio)
+        protocol: Протокол gateway (grpc, http или split)
+        concurrency: Максимальное количество одновременных запросов к gateway
+        journal: Журнал, в который дописывается каждый готовый пользователь
+        stats: Телеметрия, в которую пишутся вызовы gateway
+
+    Returns:
+        SeedsResult: Результат сидинга
+    """
+    if engine == SeedsEngine.ASYNCIO:
+        return asyncio.run(
+            build_async(plan=plan, protocol=protocol, concurrency=concurrency, journal=journal, stats=stats)
+        )
+
+    builder = build_gateway_seeds_builder(protocol=protocol, concurrency=concurrency, engine=engine)
+    if stats is not None:
+        builder.stats = stats
+
+    return builder.build(plan, journal=journal)
+
+
+if __name__ == '__main__':
+    # Процесс-воркер: план читается из stdin, результат в JSON пишется в stdout.
+    # Логи идут в stderr, поэтому не смешиваются с результатом.
+    parser = argparse.ArgumentParser(description="Процесс-воркер сидинга")
+    parser.add_argument("--engine", type=SeedsEngine, default=SeedsEngine.GEVENT)
+    parser.add_argument("--protocol", type=SeedsProtocol, default=SeedsProtocol.GRPC)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--journal", default=None, help="Путь к журналу сидинга для дозаписи пользователей")
+    parser.add_argument("--stats", default=None, help="Путь к файлу для телеметрии вызовов gateway")
+    arguments = parser.parse_args()
+
+    seeds_plan = SeedsPlan.model_validate_json(sys.stdin.buffer.read())
+    logger.info(f"Worker started: {seeds_plan.users.count} users, engine {arguments.engine}")
+    seeds_stats = SeedsStats()
+    seeds_result = build_seeds_result(
+        plan=seeds_plan,
+        engine=arguments.engine,
+        protocol=arguments.protocol,
+        concurrency=arguments.concurrency,
+        journal=SeedsJournal(arguments.journal) if arguments.journal else None,
+        stats=seeds_stats
+    )
+    if arguments.stats:
+        with open(arguments.stats, "w", encoding="utf-8") as file:
+            file.write(seeds_stats.model_dump_json())
+    logger.info(f"Worker completed: {len(seeds_result.users)} users")
+    sys.stdout.write(seeds_result.model_dump_json())
@@ -0,0 +1,52 @@
+import os
+import uuid
+
+import pytest
+
+# Settings() требует секции окружения; тестам достаточно значений CI-стенда,
+# если они не заданы в окружении или .env
+os.environ.setdefault("LOCUST_USER.WAIT_TIME_MIN", "1")
+os.environ.setdefault("LOCUST_USER.WAIT_TIME_MAX", "3")
+os.environ.setdefault("GATEWAY_HTTP_CLIENT.URL", "http://localhost:8003")
+os.environ.setdefault("GATEWAY_HTTP_CLIENT.TIMEOUT", "100")
+os.environ.setdefault("GATEWAY_GRPC_CLIENT.HOST", "localhost")
+os.environ.setdefault("GATEWAY_GRPC_CLIENT.PORT", "9003")
+
+# Модули клиентов импортируют locust, а он при импорте патчит стандартную библиотеку gevent'ом —
+# уже после того, как pytest загрузил ssl и сокеты. Тесты переключают greenlet'ы явно через gevent.sleep
+os.environ.setdefault("LOCUST_SKIP_MONKEY_PATCH", "1")
+
+from seeds.schema.result import (  # noqa: E402 — импорт после настройки окружения
+    SeedUserResult,
+    SeedCardResult,
+    SeedAccountResult,
+    SeedOperationResult
+)
+
+
+@pytest.fixture
+def seed_users() -> list[SeedUserResult]:
+    """
+    Пользователи с UUID-идентификаторами и всеми видами вложенных сущностей, включая пустые списки.
+    """
+    def new_id() -> str:
+        return str(uuid.uuid4())
+
+    def card_account(cards: int, operations: int) -> SeedAccountResult:
+        return SeedAccountResult(
+            account_id=new_id(),
+            physical_cards=[SeedCardResult(card_id=new_id()) for _ in range(cards)],
+            virtual_cards=[SeedCardResult(card_id=new_id())],
+            top_up_operations=[SeedOperationResult(operation_id=new_id()) for _ in range(operations)],
+            purchase_operations=[SeedOperationResult(operation_id=new_id()) for _ in range(operations * 2)],
+            cash_withdrawal_operations=[SeedOperationResult(operation_id=new_id())]
+        )
+
+    return [
+        SeedUserResult(
+            user_id=new_id(),
+            savings_accounts=[SeedAccountResult(account_id=new_id()) for _ in range(index % 2)],
+            credit_card_accounts=[card_account(cards=index % 3, operations=index % 4) for _ in range(index % 3)]
+        )
+        for index in range(25)
+    ]
@@ -0,0 +1,177 @@
+import asyncio
+from collections import Counter
+from itertools import count
+from types import SimpleNamespace
+
+import gevent
+
+
+class FakeGateway:
+    """
+    Gateway в памяти для тестов билдеров: каждый вызов уступает управление gevent'у на latency секунд
+    и возвращает ответ с новыми идентификаторами. Считает вызовы и пик одновременных запросов.
+
+    Attributes:
+        latency: Время ответа, в секундах.
+        fail: Имя метода, вызов которого бросает RuntimeError.
+        calls: Количество вызовов по методам.
+        in_flight: Количество выполняющихся вызовов.
+        max_in_flight: Пик одновременных вызовов.
+    """
+
+    def __init__(self, latency: float = 0.001, fail: str | None = None):
+        self.latency = latency
+        self.fail = fail
+        self.calls: Counter[str] = Counter()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.ids = count()
+
+    def start(self, method: str) -> None:
+        self.calls[method] += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def finish(self, method: str) -> str:
+        self.in_flight -= 1
+        if method == self.fail:
+            raise RuntimeError(f"{method} failed")
+        return f"{method}-{next(self.ids)}"
+
+    def request(self, method: str) -> str:
+        self.start(method)
+        gevent.sleep(self.latency)
+        return self.finish(method)
+
+    async def async_request(self, method: str) -> str:
+        self.start(method)
+        await asyncio.sleep(self.latency)
+        return self.finish(method)
+
+    def clients(self) -> dict[str, object]:
+        """
+        Возвращает клиенты gateway в виде аргументов SeedsBuilder.
+        """
+        return {
+            "users_gateway_client": FakeUsersClient(self),
+            "cards_gateway_client": FakeCardsClient(self),
+            "accounts_gateway_client": FakeAccountsClient(self),
+            "operations_gateway_client": FakeOperationsClient(self)
+        }
+
+    def async_clients(self) -> dict[str, object]:
+        """
+        Возвращает асинхронные клиенты gateway в виде аргументов AsyncSeedsBuilder.
+        """
+        return {
+            "users_gateway_client": AsyncFakeUsersClient(self),
+            "cards_gateway_client": AsyncFakeCardsClient(self),
+            "accounts_gateway_client": AsyncFakeAccountsClient(self),
+            "operations_gateway_client": AsyncFakeOperationsClient(self)
+        }
+
+
+class FakeClient:
+    def __init__(self, gateway: FakeGateway):
+        self.gateway = gateway
+
+
+class FakeUsersClient(FakeClient):
+    def create_user(self):
+        return SimpleNamespace(user=SimpleNamespace(id=self.gateway.request("create_user")))
+
+
+class FakeAccountsClient(FakeClient):
+    def open(self, method: str):
+        account_id = self.gateway.request(method)
+        return SimpleNamespace(account=SimpleNamespace(id=account_id, cards=[SimpleNamespace(id=f"card-{account_id}")]))
+
+    def open_savings_account(self, user_id: str):
+        return self.open("open_savings_account")
+
+    def open_deposit_account(self, user_id: str):
+        return self.open("open_deposit_account")
+
+    def open_debit_card_account(self, user_id: str):
+        return self.open("open_debit_card_account")
+
+    def open_credit_card_account(self, user_id: str):
+        return self.open("open_credit_card_account")
+
+
+class FakeCardsClient(FakeClient):
+    def issue_physical_card(self, user_id: str, account_id: str):
+        return SimpleNamespace(card=SimpleNamespace(id=self.gateway.request("issue_physical_card")))
+
+    def issue_virtual_card(self, user_id: str, account_id: str):
+        return SimpleNamespace(card=SimpleNamespace(id=self.gateway.request("issue_virtual_card")))
+
+
+class FakeOperationsClient(FakeClient):
+    def operation(self, method: str):
+        return SimpleNamespace(operation=SimpleNamespace(id=self.gateway.request(method)))
+
+    def make_top_up_operation(self, card_id: str, account_id: str):
+        return self.operation("make_top_up_operation")
+
+    def make_purchase_operation(self, card_id: str, account_id: str):
+        return self.operation("make_purchase_operation")
+
+    def make_transfer_operation(self, card_id: str, account_id: str):
+        return self.operation("make_transfer_operation")
+
+    def make_cash_withdrawal_operation(self, card_id: str, account_id: str):
+        return self.operation("make_cash_withdrawal_operation")
+
+
+class AsyncFakeClient(FakeClient):
+    async def close(self) -> None:
+        pass
+
+
+class AsyncFakeUsersClient(AsyncFakeClient):
+    async def create_user(self):
+        return SimpleNamespace(user=SimpleNamespace(id=await self.gateway.async_request("create_user")))
+
+
+class AsyncFakeAccountsClient(AsyncFakeClient):
+    async def open(self, method: str):
+        account_id = await self.gateway.async_request(method)
+        return SimpleNamespace(account=SimpleNamespace(id=account_id, cards=[SimpleNamespace(id=f"card-{account_id}")]))
+
+    async def open_savings_account(self, user_id: str):
+        return await self.open("open_savings_account")
+
+    async def open_deposit_account(self, user_id: str):
+        return await self.open("open_deposit_account")
+
+    async def open_debit_card_account(self, user_id: str):
+        return await self.open("open_debit_card_account")
+
+    async def open_credit_card_account(self, user_id: str):
+        return await self.open("open_credit_card_account")
+
+
+class AsyncFakeCardsClient(AsyncFakeClient):
+    async def issue_physical_card(self, user_id: str, account_id: str):
+        return SimpleNamespace(card=SimpleNamespace(id=await self.gateway.async_request("issue_physical_card")))
+
+    async def issue_virtual_card(self, user_id: str, account_id: str):
+        return SimpleNamespace(card=SimpleNamespace(id=await self.gateway.async_request("issue_virtual_card")))
+
+
+class AsyncFakeOperationsClient(AsyncFakeClient):
+    async def operation(self, method: str):
+        return SimpleNamespace(operation=SimpleNamespace(id=await self.gateway.async_request(method)))
+
+    async def make_top_up_operation(self, card_id: str, account_id: str):
+        return await self.operation("make_top_up_operation")
+
+    async def make_purchase_operation(self, card_id: str, account_id: str):
+        return await self.operation("make_purchase_operation")
+
+    async def make_transfer_operation(self, card_id: str, account_id: str):
+        return await self.operation("make_transfer_operation")
+
+    async def make_cash_withdrawal_operation(self, card_id: str, account_id: str):
+        return await self.operation("make_cash_withdrawal_operation")
@@ -0,0 +1,115 @@
+import gevent
+from faker import Faker
+
+from tools.config.fakers import FakerConfig
+from tools.fakers import ContextFake, Fake, PooledFake, build_fake, use_fake
+
+
+def draw(value: Fake) -> list:
+    return [value.email().split(".", 1)[1], value.last_name(), value.amount(), value.category()]
+
+
+def test_derived_fake_is_reproducible_per_seed():
+    base = Fake(faker=Faker())
+
+    assert draw(base.derive(42)) == draw(base.derive(42))
+    assert draw(base.derive(42)) != draw(base.derive(43))
+
+
+def test_derived_pooled_fake_shares_pools_and_is_reproducible_per_seed():
+    base = PooledFake(faker=Faker(), size=50)
+    base.seed(1)
+
+    first, second = base.derive(7), base.derive(7)
+
+    assert first.values is base.values
+    assert [draw(first) for _ in range(60)] == [draw(second) for _ in range(60)]
+
+
+def test_context_fake_routes_calls_to_greenlet_fake_regardless_of_scheduling():
+    default = Fake(faker=Faker())
+    fake = ContextFake(default=default)
+    amount = fake.amount  # как default_factory в схемах: генератор выбирается в момент вызова
+
+    def user(seed: int, pauses: list[float]) -> list[float]:
+        use_fake(default.derive(seed))
+        values = []
+        for pause in pauses:
+            gevent.sleep(pause)
+            values.append(amount())
+        return values
+
+    first = gevent.spawn(user, 1, [0.0, 0.002, 0.0]), gevent.spawn(user, 2, [0.001, 0.0, 0.0])
+    second = gevent.spawn(user, 2, [0.0, 0.0, 0.002]), gevent.spawn(user, 1, [0.002, 0.0, 0.001])
+    gevent.joinall([*first, *second], raise_error=True)
+
+    assert first[0].value == second[1].value
+    assert first[1].value == second[0].value
+
+
+def test_pooled_fake_cycles_through_pools():
+    pooled = PooledFake(faker=Faker(), size=5)
+
+    names = [pooled.last_name() for _ in range(12)]
+
+    assert names[:5] == pooled.values["last_name"]
+    assert names[5:10] == names[:5]
+    assert names[10:] == names[:2]
+
+
+def test_pooled_fake_emails_stay_unique_across_rounds():
+    pooled = PooledFake(faker=Faker(), size=3)
+
+    emails = [pooled.email() for _ in range(30)]
+
+    assert len(set(emails)) == 30
+    assert {email.split(".", 1)[1] for email in emails} == set(pooled.values["email"])
+
+
+def test_pooled_fake_refills_pool_in_background_after_full_round():
+    pooled = PooledFake(faker=Faker(), size=20, refill=True, refill_chunk=3)
+    first_round = [pooled.amount() for _ in range(20)]
+    assert pooled.values["amount"] == first_round
+
+    # Начало второго круга запускает перегенерацию; пока она не закончилась, раздаётся прежний пул
+    assert pooled.amount() == first_round[0]
+    assert "amount" in pooled.refilling
+    gevent.sleep(0.01)
+
+    assert "amount" not in pooled.refilling
+    assert pooled.values["amount"] != first_round
+    assert len(pooled.values["amount"]) == 20
+    assert [pooled.amount() for _ in range(19)] == first_round[1:]
+    assert pooled.amount() == pooled.values["amount"][0]
+
+
+def test_pooled_fake_without_refill_keeps_pool():
+    pooled = PooledFake(faker=Faker(), size=4)
+    values = pooled.values["category"]
+
+    [pooled.category() for _ in range(9)]
+    gevent.sleep(0)
+
+    assert pooled.values["category"] is values
+    assert not pooled.refilling
+
+
+def test_seeded_pooled_fake_is_reproducible_and_disables_refill():
+    first, second = PooledFake(faker=Faker(), size=10, refill=True), PooledFake(faker=Faker(), size=10, refill=True)
+
+    first.seed(3)
+    second.seed(3)
+
+    assert not first.refill_enabled
+    assert first.values == second.values
+    assert [first.phone_number() for _ in range(25)] == [second.phone_number() for _ in range(25)]
+
+
+def test_build_fake_selects_pooled_mode():
+    assert type(build_fake(FakerConfig())) is Fake
+
+    pooled = build_fake(FakerConfig(pool=True, pool_size=7, pool_refill=True, pool_refill_chunk=2))
+
+    assert isinstance(pooled, PooledFake)
+    assert (pooled.size, pooled.refill_enabled, pooled.refill_chunk) == (7, True, 2)
+    assert all(len(values) == 7 for values in pooled.values.values())
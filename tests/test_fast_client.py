@@ -0,0 +1,131 @@
+import json
+
+import httpx
+import pytest
+from gevent.pywsgi import WSGIServer
+from geventhttpclient import HTTPClient as GeventHTTPClient
+from locust.env import Environment
+
+from clients.http.fast_client import FastHTTPSession
+from clients.http.gateway.client import (
+    build_gateway_gevent_http_pool,
+    build_gateway_http_client,
+    build_gateway_locust_http_client
+)
+from config import settings
+from tools.config.http import HTTPClientBackend
+
+
+def application(environ, start_response):
+    """
+    Отвечает JSON с параметрами запроса; статус берётся из GET-параметра status.
+    """
+    query = httpx.QueryParams(environ["QUERY_STRING"])
+    body = json.dumps({
+        "method": environ["REQUEST_METHOD"],
+        "path": environ["PATH_INFO"],
+        "query": environ["QUERY_STRING"],
+        "content_type": environ.get("CONTENT_TYPE"),
+        "body": environ["wsgi.input"].read().decode()
+    }).encode()
+    status = query.get("status", "200")
+    start_response(f"{status} Status", [("Content-Type", "application/json"), ("X-Gateway", "test")])
+    return [body]
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = WSGIServer(("127.0.0.1", 0), application, log=None)
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def requests() -> list[dict]:
+    return []
+
+
+@pytest.fixture
+def session(server, requests):
+    environment = Environment()
+    environment.events.request.add_listener(lambda **kwargs: requests.append(kwargs))
+    client = GeventHTTPClient(host="127.0.0.1", port=server.server_port, concurrency=2)
+    yield FastHTTPSession(client=client, base_url=f"http://127.0.0.1:{server.server_port}/gateway/", environment=environment)
+    client.close()
+
+
+def test_get_maps_response_to_httpx(session, server):
+    response = session.get("/api/v1/users/1", params={"page": 2, "tag": "a b"}, extensions={"route": "/api/v1/users/{id}"})
+
+    assert isinstance(response, httpx.Response)
+    assert response.status_code == 200
+    assert response.headers["x-gateway"] == "test"
+    assert response.json() == {
+        "method": "GET",
+        "path": "/gateway/api/v1/users/1",
+        "query": "page=2&tag=a+b",
+        "content_type": None,
+        "body": ""
+    }
+    assert response.request.method == "GET"
+    assert str(response.request.url) == f"http://127.0.0.1:{server.server_port}/gateway/api/v1/users/1?page=2&tag=a+b"
+    assert response.request.extensions == {"route": "/api/v1/users/{id}"}
+
+
+def test_post_serializes_json_like_httpx(session):
+    payload = {"name": "Иван", "amount": 10.5}
+
+    response = session.post("/api/v1/users", json=payload)
+
+    data = response.json()
+    assert data["content_type"] == "application/json"
+    assert data["body"] == httpx.Request("POST", "http://gateway", json=payload).read().decode()
+
+
+def test_error_status_raises_like_httpx(session):
+    response = session.get("/api/v1/users", params={"status": 404})
+
+    assert response.status_code == 404
+    with pytest.raises(httpx.HTTPStatusError):
+        response.raise_for_status()
+
+
+def test_responses_are_reported_to_locust(session, requests):
+    session.get("/api/v1/cards/7", extensions={"route": "/api/v1/cards/{card_id}"})
+    response = session.request("POST", "/api/v1/cards", params={"status": 500}, json={})
+
+    ok, failed = requests
+    assert ok["name"] == "GET /api/v1/cards/{card_id}"
+    assert ok["request_type"] == "HTTP"
+    assert ok["exception"] is None
+    assert ok["response_time"] > 0
+    assert failed["name"] == "POST /gateway/api/v1/cards"
+    assert isinstance(failed["exception"], httpx.HTTPStatusError)
+    assert failed["response"] is response
+    assert failed["response_length"] == len(response.content)
+
+
+def test_session_without_environment_does_not_report(server):
+    client = GeventHTTPClient(host="127.0.0.1", port=server.server_port)
+    try:
+        session = FastHTTPSession(client=client, base_url=f"http://127.0.0.1:{server.server_port}")
+
+        assert session.fire is None
+        assert session.get("/health").json()["path"] == "/health"
+    finally:
+        client.close()
+
+
+def test_gevent_backend_builds_fast_sessions_on_one_pool(monkeypatch):
+    config = settings.gateway_http_client.model_copy(update={"backend": HTTPClientBackend.GEVENT, "max_connections": 7})
+    monkeypatch.setattr(settings, "gateway_http_client", config)
+    build_gateway_gevent_http_pool.cache_clear()
+    try:
+        plain, locust = build_gateway_http_client(), build_gateway_locust_http_client(Environment())
+
+        assert isinstance(plain, FastHTTPSession) and isinstance(locust, FastHTTPSession)
+        assert plain.client is locust.client is build_gateway_gevent_http_pool()
+        assert plain.fire is None and locust.fire is not None
+    finally:
+        build_gateway_gevent_http_pool.cache_clear()
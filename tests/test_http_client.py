@@ -0,0 +1,82 @@
+import os
+
+import pytest
+from httpx import Limits
+from locust.env import Environment
+from pydantic import HttpUrl
+
+from clients.http.gateway.client import (
+    build_gateway_async_http_client,
+    build_gateway_http_client,
+    build_gateway_http_transport,
+    build_gateway_locust_http_client
+)
+from config import settings
+from tools.config.http import HTTPClientConfig
+
+
+def test_http_client_config_limits():
+    config = HTTPClientConfig(
+        url="http://localhost:8003",
+        max_connections=100,
+        max_keepalive_connections=20,
+        keepalive_expiry=1.5
+    )
+
+    assert config.limits == Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=1.5)
+    assert HTTPClientConfig(url="http://localhost:8003").limits == Limits(
+        max_connections=None,
+        max_keepalive_connections=None,
+        keepalive_expiry=5.0
+    )
+
+
+def test_locust_clients_share_process_transport():
+    environment = Environment()
+
+    first = build_gateway_locust_http_client(environment)
+    second = build_gateway_locust_http_client(environment)
+
+    assert first is not second
+    assert first._transport is second._transport is build_gateway_http_transport()
+
+
+def test_transport_cache_is_reset_in_forked_child():
+    build_gateway_http_transport()
+
+    read, write = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.close(read)
+            os.write(write, str(build_gateway_http_transport.cache_info().currsize).encode())
+        finally:
+            os._exit(0)
+
+    os.close(write)
+    with os.fdopen(read, "rb") as file:
+        child_cache_size = int(file.read())
+    os.waitpid(pid, 0)
+
+    assert child_cache_size == 0
+    assert build_gateway_http_transport.cache_info().currsize == 1
+
+
+@pytest.fixture
+def http2_settings(monkeypatch):
+    config = settings.gateway_http_client.model_copy(update={"http2": True, "url": HttpUrl("http://localhost:8003")})
+    monkeypatch.setattr(settings, "gateway_http_client", config)
+    build_gateway_http_transport.cache_clear()
+    yield config
+    build_gateway_http_transport.cache_clear()
+
+
+@pytest.mark.usefixtures("http2_settings")
+def test_http2_enables_h2c_in_every_builder():
+    pools = [
+        build_gateway_http_transport()._pool,
+        build_gateway_http_client()._transport._pool,
+        build_gateway_async_http_client()._transport._pool
+    ]
+
+    assert all(pool._http2 and not pool._http1 for pool in pools)
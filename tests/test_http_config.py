@@ -0,0 +1,14 @@
+import pytest
+from pydantic import ValidationError
+
+from tools.config.http import HTTPClientBackend, HTTPClientConfig
+
+
+def test_http2_is_rejected_for_geventhttpclient_backend():
+    with pytest.raises(ValidationError, match="http2"):
+        HTTPClientConfig(url="http://localhost:8003", http2=True, backend=HTTPClientBackend.GEVENT)
+
+
+def test_h2c_disables_http1_for_httpx_backend():
+    assert HTTPClientConfig(url="http://localhost:8003", http2=True).http1 is False
+    assert HTTPClientConfig(url="https://localhost:8003", http2=True).http1 is True
@@ -0,0 +1,42 @@
+import json
+
+import httpx
+
+from benchmarks.response_decoding import build_operations_payload
+from clients.http.gateway.operations.client import OperationsGatewayHTTPClient
+from clients.http.gateway.users.client import UsersGatewayHTTPClient
+
+USER = {
+    "id": "user-1",
+    "email": "ivan@example.com",
+    "lastName": "Иванов",
+    "firstName": "Иван",
+    "middleName": "Иванович",
+    "phoneNumber": "+70000000000"
+}
+
+
+def build_client(handler) -> httpx.Client:
+    return httpx.Client(base_url="http://gateway", transport=httpx.MockTransport(handler))
+
+
+def test_user_is_parsed_from_utf8_bytes():
+    # ensure_ascii=False: кириллица приходит многобайтовыми последовательностями UTF-8
+    body = json.dumps({"user": USER}, ensure_ascii=False).encode()
+    users = UsersGatewayHTTPClient(client=build_client(lambda request: httpx.Response(200, content=body)))
+
+    for user in (users.get_user("user-1").user, users.create_user().user):
+        assert user.last_name == "Иванов"
+        assert user.middle_name == "Иванович"
+
+
+def test_operations_are_parsed_from_bytes():
+    body = build_operations_payload(50)
+    operations = OperationsGatewayHTTPClient(client=build_client(lambda request: httpx.Response(200, content=body)))
+
+    response = operations.get_operations(account_id="account-1")
+
+    assert len(response.operations) == 50
+    assert [operation.id for operation in response.operations] == [
+        operation["id"] for operation in json.loads(body)["operations"]
+    ]
@@ -0,0 +1,92 @@
+import httpx
+import pytest
+from locust.env import Environment
+
+from clients.http.event_hooks.locust_event_hook import locust_request_event_hook, locust_response_event_hook
+
+
+@pytest.fixture
+def requests() -> list[dict]:
+    return []
+
+
+@pytest.fixture
+def build_client(requests):
+    def build(handler) -> httpx.Client:
+        environment = Environment()
+        environment.events.request.add_listener(lambda **kwargs: requests.append(kwargs))
+        return httpx.Client(
+            base_url="http://gateway",
+            transport=httpx.MockTransport(handler),
+            event_hooks={
+                "request": [locust_request_event_hook],
+                "response": [locust_response_event_hook(environment)]
+            }
+        )
+
+    return build
+
+
+def test_hook_reports_successful_request(build_client, requests):
+    client = build_client(lambda request: httpx.Response(200, content=b'{"users": []}'))
+
+    client.get("/api/v1/users/123", extensions={"route": "/api/v1/users/{user_id}"})
+
+    [event] = requests
+    assert event["name"] == "GET /api/v1/users/{user_id}"
+    assert event["request_type"] == "HTTP"
+    assert event["response_length"] == len(b'{"users": []}')
+    assert event["exception"] is None
+    assert event["response"].status_code == 200
+    assert event["response_time"] >= 0
+
+
+def test_hook_reports_http2_request_type(build_client, requests):
+    client = build_client(lambda request: httpx.Response(200, extensions={"http_version": b"HTTP/2"}))
+
+    client.get("/api/v1/users")
+
+    assert requests[0]["request_type"] == "HTTP/2"
+
+
+def test_hook_falls_back_to_raw_path(build_client, requests):
+    client = build_client(lambda request: httpx.Response(204))
+
+    client.post("/api/v1/cards", params={"debug": "1"})
+
+    [event] = requests
+    assert event["name"] == "POST /api/v1/cards"
+    assert event["response_length"] == 0
+
+
+@pytest.mark.parametrize("status_code", [404, 500])
+def test_hook_reports_error_status(build_client, requests, status_code):
+    client = build_client(lambda request: httpx.Response(status_code, content=b"error"))
+
+    response = client.get("/api/v1/accounts")
+
+    [event] = requests
+    assert isinstance(event["exception"], httpx.HTTPStatusError)
+    assert event["exception"].response is response
+    assert event["response_length"] == len(b"error")
+
+
+def test_hook_measures_response_time_from_request_hook(build_client, requests, monkeypatch):
+    clock = iter([1_000_000_000, 1_250_000_000])
+    monkeypatch.setattr("clients.http.event_hooks.locust_event_hook.time.perf_counter_ns", lambda: next(clock))
+    client = build_client(lambda request: httpx.Response(200))
+
+    client.get("/api/v1/operations")
+
+    assert requests[0]["response_time"] == 250.0
+
+
+def test_hook_without_start_time_reports_zero_response_time(requests):
+    environment = Environment()
+    environment.events.request.add_listener(lambda **kwargs: requests.append(kwargs))
+    response = httpx.Response(200, content=b"ok", request=httpx.Request("GET", "http://gateway/health"))
+
+    locust_response_event_hook(environment)(response)
+
+    assert requests[0]["response_time"] == 0
+    assert requests[0]["name"] == "GET /health"
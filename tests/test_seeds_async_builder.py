@@ -0,0 +1,36 @@
+import asyncio
+
+import pytest
+
+from seeds.async_builder import AsyncSeedsBuilder
+from seeds.schema.plan import SeedsPlan, SeedUsersPlan, SeedAccountsPlan, SeedOperationsPlan
+from tests.gateway import FakeGateway
+
+
+def build_plan(users: int = 8) -> SeedsPlan:
+    return SeedsPlan(
+        users=SeedUsersPlan(
+            count=users,
+            debit_card_accounts=SeedAccountsPlan(count=1, top_up_operations=SeedOperationsPlan(count=4))
+        )
+    )
+
+
+def test_async_builder_builds_plan_within_concurrency():
+    gateway = FakeGateway(latency=0.002)
+    builder = AsyncSeedsBuilder(**gateway.async_clients(), concurrency=6)
+
+    result = asyncio.run(builder.build(build_plan()))
+
+    assert len(result.users) == 8
+    assert all(len(user.debit_card_accounts[0].top_up_operations) == 4 for user in result.users)
+    assert gateway.max_in_flight == 6
+    assert builder.stats.methods["make_top_up_operation"].calls == 32
+
+
+def test_async_builder_propagates_gateway_errors():
+    gateway = FakeGateway(fail="open_debit_card_account")
+    builder = AsyncSeedsBuilder(**gateway.async_clients(), concurrency=4)
+
+    with pytest.raises(RuntimeError, match="open_debit_card_account failed"):
+        asyncio.run(builder.build(build_plan()))
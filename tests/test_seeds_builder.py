@@ -0,0 +1,73 @@
+import pytest
+
+from seeds.builder import ConcurrentSeedsBuilder, SeedsBuilder, build_seeds_builder
+from seeds.journal import SeedsJournal
+from seeds.schema.plan import SeedsPlan, SeedUsersPlan, SeedAccountsPlan, SeedOperationsPlan, SeedCardsPlan
+from tests.gateway import FakeGateway
+
+
+def build_plan(users: int = 6) -> SeedsPlan:
+    return SeedsPlan(
+        users=SeedUsersPlan(
+            count=users,
+            savings_accounts=SeedAccountsPlan(count=1),
+            credit_card_accounts=SeedAccountsPlan(
+                count=2,
+                physical_cards=SeedCardsPlan(count=1),
+                purchase_operations=SeedOperationsPlan(count=3)
+            )
+        )
+    )
+
+
+def test_build_seeds_builder_selects_implementation_by_concurrency():
+    assert type(build_seeds_builder(**FakeGateway().clients(), concurrency=1)) is SeedsBuilder
+    assert type(build_seeds_builder(**FakeGateway().clients(), concurrency=4)) is ConcurrentSeedsBuilder
+
+
+def test_concurrent_builder_builds_the_same_structure_as_sequential():
+    sequential = SeedsBuilder(**FakeGateway().clients()).build(build_plan())
+    concurrent = ConcurrentSeedsBuilder(**FakeGateway().clients(), concurrency=8).build(build_plan())
+
+    def shape(result):
+        return [
+            (
+                len(user.savings_accounts),
+                [(len(account.physical_cards), len(account.purchase_operations)) for account in user.credit_card_accounts]
+            )
+            for user in result.users
+        ]
+
+    assert shape(concurrent) == shape(sequential)
+    assert len({user.user_id for user in concurrent.users}) == 6
+
+
+def test_concurrent_builder_never_exceeds_concurrency():
+    gateway = FakeGateway(latency=0.002)
+    builder = ConcurrentSeedsBuilder(**gateway.clients(), concurrency=5)
+
+    builder.build(build_plan(users=10))
+
+    assert gateway.max_in_flight == 5
+    assert builder.stats.calls == sum(gateway.calls.values())
+
+
+def test_concurrent_builder_propagates_gateway_errors():
+    gateway = FakeGateway(fail="make_purchase_operation")
+    builder = ConcurrentSeedsBuilder(**gateway.clients(), concurrency=4)
+
+    with pytest.raises(RuntimeError, match="make_purchase_operation failed"):
+        builder.build(build_plan())
+
+    assert builder.stats.methods["make_purchase_operation"].errors > 0
+
+
+def test_concurrent_builder_journals_every_user(tmp_path):
+    plan = build_plan()
+    journal = SeedsJournal(str(tmp_path / "seeds.journal.jsonl"))
+    journal.start(plan)
+
+    result = ConcurrentSeedsBuilder(**FakeGateway().clients(), concurrency=4).build(plan, journal=journal)
+    journal.close()
+
+    assert sorted(user.user_id for user in journal.load(plan)) == sorted(user.user_id for user in result.users)
@@ -0,0 +1,56 @@
+from seeds.estimator import (
+    estimate_seeds_plan,
+    find_seeds_scenario,
+    get_effective_concurrency,
+    get_pipeline_stage_limits
+)
+from seeds.scenario import SeedsScenario
+from seeds.schema.plan import SeedsPlan, SeedUsersPlan, SeedAccountsPlan, SeedOperationsPlan
+from tools.config.seeds import SeedsConfig, SeedsEngine, SeedsProtocol
+
+
+def build_plan() -> SeedsPlan:
+    return SeedsPlan(
+        users=SeedUsersPlan(
+            count=10,
+            credit_card_accounts=SeedAccountsPlan(count=1, purchase_operations=SeedOperationsPlan(count=3))
+        )
+    )
+
+
+def test_estimate_counts_calls_and_critical_path():
+    estimate = estimate_seeds_plan(build_plan(), default_latency=10.0)
+
+    assert estimate.calls == {"create_user": 10, "open_credit_card_account": 10, "make_purchase_operation": 30}
+    assert estimate.critical_path == 30.0
+    assert estimate.duration(concurrency=10) == 0.05
+
+
+def test_effective_concurrency_follows_build_engine_and_processes():
+    assert get_effective_concurrency(SeedsConfig(concurrency=10)) == 10
+    assert get_effective_concurrency(SeedsConfig(concurrency=10, processes=4)) == 10
+    assert get_effective_concurrency(SeedsConfig(concurrency=2, processes=4)) == 4
+    assert get_effective_concurrency(SeedsConfig(concurrency=10, protocol=SeedsProtocol.SPLIT)) == 20
+    assert get_effective_concurrency(
+        SeedsConfig(concurrency=10, engine=SeedsEngine.ASYNCIO, protocol=SeedsProtocol.SPLIT)
+    ) == 10
+
+
+def test_pipeline_duration_is_bound_by_busiest_stage():
+    estimate = estimate_seeds_plan(build_plan(), default_latency=10.0)
+    stages = get_pipeline_stage_limits(SeedsConfig(engine=SeedsEngine.PIPELINE, processes=2))
+
+    assert stages == {"users": 20, "accounts": 40, "cards": 40, "operations": 100}
+    assert estimate.pipeline_duration({"users": 1, "accounts": 10, "cards": 1, "operations": 10}) == 0.1
+
+
+def test_find_seeds_scenario_does_not_build_gateway_clients(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("SeedsScenario.__init__ must not be called by the estimator")
+
+    monkeypatch.setattr(SeedsScenario, "__init__", fail)
+
+    seeds_scenario = find_seeds_scenario("existing_user_get_operations")
+
+    assert seeds_scenario.scenario == "existing_user_get_operations"
+    assert seeds_scenario.plan.users.count == 300
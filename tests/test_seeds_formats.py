@@ -0,0 +1,83 @@
+import pytest
+
+from seeds.dumps import load_seeds_result, save_seeds_result
+from seeds.formats.binary import load_binary_seeds_users, save_binary_seeds_users
+from seeds.formats.jsonl import load_jsonl_seeds_users, save_jsonl_seeds_users
+from seeds.sharding import shard_seeds_result
+from seeds.schema.result import SeedsResult, SeedUserResult
+from tools.config.seeds import SeedsDumpFormat
+
+
+def test_jsonl_dump_round_trip(tmp_path, seed_users):
+    seeds_file, index_file = str(tmp_path / "seeds.jsonl"), str(tmp_path / "seeds.jsonl.idx")
+
+    save_jsonl_seeds_users(users=seed_users, seeds_file=seeds_file, index_file=index_file)
+    users = load_jsonl_seeds_users(seeds_file=seeds_file, index_file=index_file)
+
+    assert len(users) == len(seed_users)
+    assert list(users) == seed_users
+    assert users[-1] == seed_users[-1]
+    assert list(users[3:7]) == seed_users[3:7]
+    assert users[::5] == seed_users[::5]
+
+
+def test_jsonl_dump_slices_lazily_for_shards(tmp_path, seed_users):
+    seeds_file, index_file = str(tmp_path / "seeds.jsonl"), str(tmp_path / "seeds.jsonl.idx")
+    save_jsonl_seeds_users(users=seed_users, seeds_file=seeds_file, index_file=index_file)
+
+    result = SeedsResult.model_construct(users=load_jsonl_seeds_users(seeds_file=seeds_file, index_file=index_file))
+    shard = shard_seeds_result(result, range(10, 20))
+
+    assert len(shard.users) == 10
+    assert shard.get_next_user() == seed_users[10]
+
+
+def test_empty_jsonl_dump_round_trip(tmp_path):
+    seeds_file, index_file = str(tmp_path / "seeds.jsonl"), str(tmp_path / "seeds.jsonl.idx")
+
+    save_jsonl_seeds_users(users=[], seeds_file=seeds_file, index_file=index_file)
+
+    assert len(load_jsonl_seeds_users(seeds_file=seeds_file, index_file=index_file)) == 0
+
+
+def test_jsonl_dump_through_seeds_dumps(tmp_path, monkeypatch, seed_users):
+    monkeypatch.chdir(tmp_path)
+
+    save_seeds_result(SeedsResult(users=seed_users), scenario="formats", dump_format=SeedsDumpFormat.JSONL)
+    result = load_seeds_result(scenario="formats", dump_format=SeedsDumpFormat.JSONL)
+
+    assert list(result.users) == seed_users
+
+
+def test_binary_dump_round_trip(tmp_path, seed_users):
+    seeds_file = str(tmp_path / "seeds.bin")
+
+    save_binary_seeds_users(users=seed_users, seeds_file=seeds_file)
+    users = load_binary_seeds_users(seeds_file=seeds_file)
+
+    assert len(users) == len(seed_users)
+    assert list(users) == seed_users
+    assert list(users[5:9]) == seed_users[5:9]
+    assert users[-2] == seed_users[-2]
+
+
+def test_empty_binary_dump_round_trip(tmp_path):
+    seeds_file = str(tmp_path / "seeds.bin")
+
+    save_binary_seeds_users(users=[], seeds_file=seeds_file)
+
+    assert len(load_binary_seeds_users(seeds_file=seeds_file)) == 0
+
+
+def test_binary_dump_rejects_non_uuid_identifiers(tmp_path):
+    with pytest.raises(ValueError, match="UUID"):
+        save_binary_seeds_users(users=[SeedUserResult(user_id="user-1")], seeds_file=str(tmp_path / "seeds.bin"))
+
+
+def test_binary_dump_through_seeds_dumps(tmp_path, monkeypatch, seed_users):
+    monkeypatch.chdir(tmp_path)
+
+    save_seeds_result(SeedsResult(users=seed_users), scenario="formats", dump_format=SeedsDumpFormat.BINARY)
+    result = load_seeds_result(scenario="formats", dump_format=SeedsDumpFormat.BINARY)
+
+    assert list(result.users) == seed_users
@@ -0,0 +1,64 @@
+import multiprocessing
+
+from seeds.journal import SeedsJournal
+from seeds.schema.plan import SeedsPlan, SeedUsersPlan
+from seeds.schema.result import SeedUserResult
+
+
+def test_resume_after_torn_record_keeps_new_records(tmp_path):
+    plan = SeedsPlan(users=SeedUsersPlan(count=3))
+    journal = SeedsJournal(str(tmp_path / "seeds.journal.jsonl"))
+    journal.start(plan)
+    journal.append(SeedUserResult(user_id="a"))
+    journal.close()
+
+    # Процесс убит посреди записи пользователя "b"
+    with open(journal.path, "a", encoding="utf-8") as file:
+        file.write(SeedUserResult(user_id="b").model_dump_json()[:10])
+
+    resumed = SeedsJournal(journal.path)
+    assert [user.user_id for user in resumed.load(plan)] == ["a"]
+    resumed.append(SeedUserResult(user_id="c"))
+    resumed.close()
+
+    assert [user.user_id for user in SeedsJournal(journal.path).load(plan)] == ["a", "c"]
+
+
+def test_load_truncates_tail_longer_than_chunk(tmp_path):
+    plan = SeedsPlan(users=SeedUsersPlan(count=1))
+    journal = SeedsJournal(str(tmp_path / "seeds.journal.jsonl"))
+    journal.start(plan)
+    journal.close()
+
+    with open(journal.path, "a", encoding="utf-8") as file:
+        file.write("x" * 100)
+
+    journal.truncate_incomplete_tail(chunk_size=16)
+
+    with open(journal.path, "r", encoding="utf-8") as file:
+        assert file.read() == plan.model_dump_json() + "\n"
+
+
+def test_concurrent_appends_from_processes_do_not_interleave(tmp_path):
+    plan = SeedsPlan(users=SeedUsersPlan(count=40))
+    path = str(tmp_path / "seeds.journal.jsonl")
+    SeedsJournal(path).start(plan)
+
+    # Записи больше буфера TextIOWrapper/BufferedWriter (8 КиБ)
+    users = [
+        SeedUserResult(user_id=f"{worker}-{index}-" + "x" * 20_000)
+        for worker in range(2) for index in range(20)
+    ]
+    with multiprocessing.get_context("fork").Pool(2) as pool:
+        pool.map(append_users, [(path, users[:20]), (path, users[20:])])
+
+    loaded = SeedsJournal(path).load(plan)
+    assert sorted(user.user_id for user in loaded) == sorted(user.user_id for user in users)
+
+
+def append_users(arguments: tuple[str, list[SeedUserResult]]) -> None:
+    path, users = arguments
+    journal = SeedsJournal(path)
+    for user in users:
+        journal.append(user)
+    journal.close()
@@ -0,0 +1,124 @@
+from collections import Counter
+
+import pytest
+
+from seeds.builder import PipelinedSeedsBuilder, build_seeds_builder
+from seeds.estimator import PIPELINE_STAGES
+from seeds.journal import SeedsJournal
+from seeds.schema.plan import SeedsPlan, SeedUsersPlan, SeedAccountsPlan, SeedOperationsPlan, SeedCardsPlan
+from tests.gateway import FakeGateway
+from tools.config.seeds import SeedsEngine, SeedsPipelineConfig
+
+
+class StagedGateway(FakeGateway):
+    """
+    FakeGateway, который дополнительно считает пик одновременных запросов каждой стадии конвейера.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.stage_in_flight: Counter[str] = Counter()
+        self.stage_max_in_flight: Counter[str] = Counter()
+
+    @staticmethod
+    def stage(method: str) -> str:
+        return next(stage for prefix, stage in PIPELINE_STAGES.items() if method.startswith(prefix))
+
+    def start(self, method: str) -> None:
+        super().start(method)
+        stage = self.stage(method)
+        self.stage_in_flight[stage] += 1
+        self.stage_max_in_flight[stage] = max(self.stage_max_in_flight[stage], self.stage_in_flight[stage])
+
+    def finish(self, method: str) -> str:
+        self.stage_in_flight[self.stage(method)] -= 1
+        return super().finish(method)
+
+
+STAGES = SeedsPipelineConfig(users=2, accounts=3, cards=1, operations=4)
+
+
+def build_plan(users: int = 8) -> SeedsPlan:
+    return SeedsPlan(
+        users=SeedUsersPlan(
+            count=users,
+            savings_accounts=SeedAccountsPlan(count=1),
+            credit_card_accounts=SeedAccountsPlan(
+                count=2,
+                physical_cards=SeedCardsPlan(count=1),
+                purchase_operations=SeedOperationsPlan(count=3)
+            )
+        )
+    )
+
+
+def test_build_seeds_builder_selects_pipeline_engine():
+    builder = build_seeds_builder(**FakeGateway().clients(), concurrency=1, engine=SeedsEngine.PIPELINE)
+
+    assert isinstance(builder, PipelinedSeedsBuilder)
+
+
+def test_pipeline_builds_every_planned_entity():
+    result = PipelinedSeedsBuilder(**FakeGateway().clients(), stages=STAGES).build(build_plan())
+
+    assert len(result.users) == 8
+    assert len({user.user_id for user in result.users}) == 8
+    for user in result.users:
+        assert len(user.savings_accounts) == 1
+        assert len(user.credit_card_accounts) == 2
+        for account in user.credit_card_accounts:
+            assert len(account.physical_cards) == 1
+            assert len(account.purchase_operations) == 3
+
+
+def test_pipeline_respects_stage_limits():
+    gateway = StagedGateway(latency=0.002)
+    builder = PipelinedSeedsBuilder(**gateway.clients(), stages=STAGES)
+
+    builder.build(build_plan(users=12))
+
+    limits = STAGES.model_dump()
+    assert all(gateway.stage_max_in_flight[stage] <= limit for stage, limit in limits.items())
+    assert gateway.stage_max_in_flight["operations"] == limits["operations"]
+    assert gateway.max_in_flight <= sum(limits.values())
+
+
+def test_pipeline_reports_stage_metrics():
+    builder = PipelinedSeedsBuilder(**FakeGateway().clients(), stages=STAGES)
+
+    builder.build(build_plan(users=5))
+
+    processed = {name: metrics.processed for name, metrics in builder.metrics.items()}
+    assert processed == {"users": 5, "accounts": 15, "cards": 10, "operations": 30}
+    assert {name: metrics.concurrency for name, metrics in builder.metrics.items()} == STAGES.model_dump()
+    assert all(metrics.errors == 0 for metrics in builder.metrics.values())
+
+
+def test_pipeline_propagates_gateway_errors():
+    gateway = FakeGateway(fail="issue_physical_card")
+    builder = PipelinedSeedsBuilder(**gateway.clients(), stages=STAGES)
+
+    with pytest.raises(RuntimeError, match="issue_physical_card failed"):
+        builder.build(build_plan())
+
+    assert builder.metrics["cards"].errors == 1
+
+
+def test_pipeline_with_empty_plan():
+    gateway = FakeGateway()
+
+    result = PipelinedSeedsBuilder(**gateway.clients(), stages=STAGES).build(build_plan(users=0))
+
+    assert result.users == []
+    assert not gateway.calls
+
+
+def test_pipeline_journals_every_user(tmp_path):
+    plan = build_plan()
+    journal = SeedsJournal(str(tmp_path / "seeds.journal.jsonl"))
+    journal.start(plan)
+
+    result = PipelinedSeedsBuilder(**FakeGateway().clients(), stages=STAGES).build(plan, journal=journal)
+    journal.close()
+
+    assert sorted(user.user_id for user in journal.load(plan)) == sorted(user.user_id for user in result.users)
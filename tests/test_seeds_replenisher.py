@@ -0,0 +1,105 @@
+import gevent
+
+from config import settings
+from seeds import scenario as seeds_scenario_module
+from seeds.builder import SeedsBuilder
+from seeds.replenisher import SeedsReplenisher
+from seeds.schema.result import SeedsResult, SeedUserResult
+from tests.gateway import FakeGateway
+from tests.test_seeds_scenario import FakeSeedsScenario
+from tools.config.seeds import SeedsEngine, SeedsReplenishConfig
+
+
+def new_users(prefix: str, count: int) -> list[SeedUserResult]:
+    return [SeedUserResult(user_id=f"{prefix}-{index}") for index in range(count)]
+
+
+def test_replenisher_tops_up_below_low_water():
+    result = SeedsResult(users=new_users("seeded", 5))
+    batches: list[int] = []
+
+    def build(count: int) -> list[SeedUserResult]:
+        batches.append(count)
+        return new_users(f"batch{len(batches)}", count)
+
+    replenisher = SeedsReplenisher(result=result, build=build, low_water=3, batch_size=4, interval=0.01)
+    replenisher.start()
+    try:
+        gevent.sleep(0.03)
+        assert batches == []
+
+        handed = [result.get_next_user().user_id for _ in range(3)]
+        gevent.sleep(0.03)
+    finally:
+        replenisher.stop()
+
+    assert handed == ["seeded-0", "seeded-1", "seeded-2"]
+    assert batches == [4]
+    assert replenisher.replenished == 4
+    assert result.remaining == 6
+    assert [result.get_next_user().user_id for _ in range(6)][2:] == [f"batch1-{index}" for index in range(4)]
+
+
+def test_replenisher_survives_failed_batches():
+    result = SeedsResult(users=[])
+    attempts: list[int] = []
+
+    def build(count: int) -> list[SeedUserResult]:
+        attempts.append(count)
+        if len(attempts) == 1:
+            raise RuntimeError("gateway is unavailable")
+        return new_users("retry", count)
+
+    replenisher = SeedsReplenisher(result=result, build=build, low_water=1, batch_size=2, interval=0.01)
+    replenisher.start()
+    gevent.sleep(0.035)
+    replenisher.stop()
+
+    assert len(attempts) >= 2
+    assert replenisher.replenished == 2
+    assert result.remaining == 2
+
+
+def test_replenisher_stop_is_idempotent():
+    replenisher = SeedsReplenisher(
+        result=SeedsResult(users=[]),
+        build=lambda count: [],
+        low_water=0,
+        batch_size=1,
+        interval=0.01
+    )
+
+    replenisher.start()
+    greenlet = replenisher.greenlet
+    replenisher.start()
+    assert replenisher.greenlet is greenlet
+
+    replenisher.stop()
+    replenisher.stop()
+    gevent.sleep(0)
+    assert greenlet.dead
+    assert replenisher.greenlet is None
+
+
+def test_scenario_replenisher_uses_a_separate_limited_builder(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(settings.seeds, "replenish", SeedsReplenishConfig(concurrency=2, low_water=7, batch_size=3))
+    scenario_gateway, replenish_gateway = FakeGateway(), FakeGateway()
+    requested: dict = {}
+
+    def build_gateway_seeds_builder(**kwargs) -> SeedsBuilder:
+        requested.update(kwargs)
+        return SeedsBuilder(**replenish_gateway.clients())
+
+    monkeypatch.setattr(seeds_scenario_module, "build_gateway_seeds_builder", build_gateway_seeds_builder)
+    seeds_scenario = FakeSeedsScenario(scenario_gateway, users=2)
+
+    replenisher = seeds_scenario.replenisher(SeedsResult(users=[]))
+    replenisher.replenish()
+
+    assert requested == {"protocol": seeds_scenario.protocol, "concurrency": 2, "engine": SeedsEngine.GEVENT}
+    assert (replenisher.low_water, replenisher.batch_size) == (7, 3)
+    assert replenisher.result.remaining == 3
+    assert all(len(user.savings_accounts) == 1 for user in replenisher.result.users)
+    assert replenish_gateway.calls["create_user"] == 3
+    assert not scenario_gateway.calls
@@ -0,0 +1,80 @@
+import gevent
+import pytest
+
+from seeds.formats.jsonl import load_jsonl_seeds_users, save_jsonl_seeds_users
+from seeds.schema.result import SeedsExhaustedError, SeedsResult, SeedUserResult, SeedUsersChain
+from tools.config.seeds import SeedsExhaustionPolicy
+
+
+def build_users(prefix: str, count: int) -> list[SeedUserResult]:
+    return [SeedUserResult(user_id=f"{prefix}-{index}") for index in range(count)]
+
+
+def test_get_next_user_hands_out_users_in_order_and_raises_when_exhausted():
+    result = SeedsResult(users=build_users("a", 3))
+
+    assert [result.get_next_user().user_id for _ in range(3)] == ["a-0", "a-1", "a-2"]
+    assert result.remaining == 0
+    with pytest.raises(SeedsExhaustedError):
+        result.get_next_user()
+
+
+def test_wrap_policy_restarts_from_the_first_user():
+    result = SeedsResult(users=build_users("a", 2))
+    result.set_exhaustion_policy(SeedsExhaustionPolicy.WRAP)
+
+    assert [result.get_next_user().user_id for _ in range(5)] == ["a-0", "a-1", "a-0", "a-1", "a-0"]
+
+
+def test_wrap_policy_still_raises_for_empty_result():
+    result = SeedsResult()
+    result.set_exhaustion_policy(SeedsExhaustionPolicy.WRAP)
+
+    with pytest.raises(SeedsExhaustedError):
+        result.get_next_user()
+
+
+def test_refill_policy_requires_refill_function():
+    with pytest.raises(ValueError):
+        SeedsResult().set_exhaustion_policy(SeedsExhaustionPolicy.REFILL)
+
+
+def test_refill_policy_refills_once_for_concurrent_consumers():
+    batches = iter(["b", "c", "d"])
+    refills = []
+
+    def refill() -> list[SeedUserResult]:
+        refills.append(1)
+        gevent.sleep(0.01)
+        return build_users(next(batches), 3)
+
+    result = SeedsResult(users=build_users("a", 1))
+    result.set_exhaustion_policy(SeedsExhaustionPolicy.REFILL, refill=refill)
+    result.get_next_user()
+
+    greenlets = [gevent.spawn(result.get_next_user) for _ in range(3)]
+    gevent.joinall(greenlets, raise_error=True)
+
+    assert len(refills) == 1
+    assert sorted(greenlet.value.user_id for greenlet in greenlets) == ["b-0", "b-1", "b-2"]
+
+
+def test_refill_policy_raises_when_refill_returns_nothing():
+    result = SeedsResult()
+    result.set_exhaustion_policy(SeedsExhaustionPolicy.REFILL, refill=lambda: [])
+
+    with pytest.raises(SeedsExhaustedError):
+        result.get_next_user()
+
+
+def test_extend_chains_lazy_dump_without_decoding_it(tmp_path):
+    seeds_file, index_file = str(tmp_path / "seeds.jsonl"), str(tmp_path / "seeds.jsonl.idx")
+    save_jsonl_seeds_users(users=build_users("a", 3), seeds_file=seeds_file, index_file=index_file)
+    result = SeedsResult.model_construct(users=load_jsonl_seeds_users(seeds_file=seeds_file, index_file=index_file))
+
+    result.extend(build_users("b", 2))
+    result.extend(build_users("c", 1))
+
+    assert isinstance(result.users, SeedUsersChain)
+    assert [user.user_id for user in result.users] == ["a-0", "a-1", "a-2", "b-0", "b-1", "c-0"]
+    assert result.users[-2].user_id == "b-1"
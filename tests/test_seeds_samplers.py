@@ -0,0 +1,130 @@
+import random
+from collections import Counter
+
+import pytest
+
+from seeds.samplers import (
+    AliasTable,
+    FileSeedsSampler,
+    HotSetSeedsSampler,
+    UniformSeedsSampler,
+    ZipfSeedsSampler,
+    build_seeds_sampler
+)
+from seeds.schema.result import SeedsResult
+from tools.config.seeds import SeedsSamplerConfig, SeedsSamplerKind
+
+SAMPLES = 200_000
+
+
+def frequencies(sample, size: int, seed: int = 42) -> list[float]:
+    rng = random.Random(seed)
+    counts = Counter(sample(rng) for _ in range(SAMPLES))
+    assert set(counts) <= set(range(size))
+    return [counts[index] / SAMPLES for index in range(size)]
+
+
+def normalize(weights) -> list[float]:
+    total = sum(weights)
+    return [weight / total for weight in weights]
+
+
+@pytest.mark.parametrize("weights", [[1.0], [1.0, 1.0, 1.0], [5.0, 1.0, 0.0, 3.0, 1.0], [0.1] * 7 + [10.0]])
+def test_alias_table_samples_proportionally_to_weights(weights):
+    table = AliasTable(weights)
+
+    observed = frequencies(table.sample, len(weights))
+
+    assert observed == pytest.approx(normalize(weights), abs=0.01)
+
+
+def test_alias_table_never_picks_zero_weight():
+    table = AliasTable([0.0, 1.0, 0.0, 2.0])
+
+    assert {table.sample(random.Random(seed)) for seed in range(2000)} == {1, 3}
+
+
+@pytest.mark.parametrize("weights", [[], [0.0, 0.0]])
+def test_alias_table_rejects_weights_without_positive_value(weights):
+    with pytest.raises(ValueError):
+        AliasTable(weights)
+
+
+def test_alias_table_is_reproducible_with_seeded_rng():
+    table = AliasTable([3.0, 2.0, 1.0])
+    rng_a, rng_b = random.Random(11), random.Random(11)
+
+    assert [table.sample(rng_a) for _ in range(100)] == [table.sample(rng_b) for _ in range(100)]
+
+
+def test_uniform_sampler():
+    sampler = UniformSeedsSampler()
+
+    assert frequencies(lambda rng: sampler.sample(10, rng), 10) == pytest.approx([0.1] * 10, abs=0.01)
+
+
+def test_zipf_sampler_follows_rank_weights():
+    sampler = ZipfSeedsSampler(exponent=1.0)
+
+    observed = frequencies(lambda rng: sampler.sample(5, rng), 5)
+
+    assert observed == pytest.approx(normalize([1 / rank for rank in range(1, 6)]), abs=0.01)
+
+
+def test_hot_set_sampler_sends_hot_traffic_to_hot_users():
+    sampler = HotSetSeedsSampler(hot_fraction=0.2, hot_traffic=0.8)
+
+    observed = frequencies(lambda rng: sampler.sample(10, rng), 10)
+
+    assert sum(observed[:2]) == pytest.approx(0.8, abs=0.01)
+    assert sum(observed[2:]) == pytest.approx(0.2, abs=0.01)
+
+
+def test_hot_set_sampler_with_only_hot_users():
+    assert HotSetSeedsSampler(hot_fraction=1.0).weights(3) == [1.0, 1.0, 1.0]
+
+
+def test_file_sampler_pads_and_trims_weights(tmp_path):
+    path = tmp_path / "weights.txt"
+    path.write_text("1\n\n3\n0\n5\n", encoding="utf-8")
+
+    sampler = FileSeedsSampler(path=str(path))
+
+    assert sampler.weights(3) == [1.0, 3.0, 0.0]
+    assert sampler.weights(6) == [1.0, 3.0, 0.0, 5.0, 0.0, 0.0]
+
+
+def test_sampler_rebuilds_table_when_size_changes():
+    sampler = ZipfSeedsSampler()
+
+    sampler.sample(5)
+    table = sampler.table
+    sampler.sample(5)
+    assert sampler.table is table
+
+    sampler.sample(8)
+    assert sampler.table is not table
+    assert sampler.table.size == 8
+
+
+def test_build_seeds_sampler(tmp_path):
+    path = tmp_path / "weights.txt"
+    path.write_text("1\n", encoding="utf-8")
+
+    assert isinstance(build_seeds_sampler(SeedsSamplerConfig()), UniformSeedsSampler)
+    assert build_seeds_sampler(SeedsSamplerConfig(kind=SeedsSamplerKind.ZIPF, exponent=1.5)).exponent == 1.5
+    assert isinstance(build_seeds_sampler(SeedsSamplerConfig(kind=SeedsSamplerKind.HOT_SET)), HotSetSeedsSampler)
+    assert build_seeds_sampler(SeedsSamplerConfig(kind=SeedsSamplerKind.FILE, weights_file=str(path))).path == str(path)
+
+    with pytest.raises(ValueError):
+        build_seeds_sampler(SeedsSamplerConfig(kind=SeedsSamplerKind.FILE))
+
+
+def test_get_random_user_uses_sampler(tmp_path, seed_users):
+    path = tmp_path / "weights.txt"
+    path.write_text("0\n" * 24 + "1\n", encoding="utf-8")
+
+    result = SeedsResult(users=seed_users)
+    sampler = FileSeedsSampler(path=str(path))
+
+    assert {result.get_random_user(sampler=sampler).user_id for _ in range(50)} == {seed_users[-1].user_id}
@@ -0,0 +1,80 @@
+import pytest
+
+from seeds.builder import SeedsBuilder
+from seeds.dumps import get_seeds_file, is_seeds_result_actual
+from seeds.scenario import SeedsScenario
+from seeds.schema.plan import SeedsPlan, SeedUsersPlan, SeedAccountsPlan
+from tests.gateway import FakeGateway
+from tools.config.seeds import SeedsDumpFormat, SeedsProtocol
+
+
+class FakeSeedsScenario(SeedsScenario):
+    def __init__(self, gateway: FakeGateway, users: int = 3):
+        super().__init__()
+        self.users = users
+        self.builder = SeedsBuilder(**gateway.clients())
+
+    @property
+    def plan(self) -> SeedsPlan:
+        return SeedsPlan(users=SeedUsersPlan(count=self.users, savings_accounts=SeedAccountsPlan(count=1)))
+
+    @property
+    def scenario(self) -> str:
+        return "fake_scenario"
+
+
+@pytest.fixture(autouse=True)
+def dumps_directory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+
+def test_build_skips_generation_when_dump_matches_plan_and_gateway():
+    gateway = FakeGateway()
+    FakeSeedsScenario(gateway).build()
+    calls = gateway.calls.total()
+
+    FakeSeedsScenario(gateway).build()
+
+    assert calls == 6
+    assert gateway.calls.total() == calls
+    assert len(FakeSeedsScenario(gateway).load().users) == 3
+
+
+def test_build_regenerates_when_plan_changes_or_forced():
+    gateway = FakeGateway()
+    FakeSeedsScenario(gateway).build()
+
+    FakeSeedsScenario(gateway, users=4).build()
+    assert gateway.calls["create_user"] == 7
+
+    FakeSeedsScenario(gateway, users=4).build(force=True)
+    assert gateway.calls["create_user"] == 11
+
+
+def test_dump_is_not_actual_without_dump_file_or_with_corrupted_meta():
+    seeds_scenario = FakeSeedsScenario(FakeGateway())
+    seeds_scenario.build()
+    meta = seeds_scenario.meta
+    assert is_seeds_result_actual(meta=meta, scenario=seeds_scenario.scenario)
+
+    with open(f"./dumps/{seeds_scenario.scenario}_seeds.meta.json", "w", encoding="utf-8") as file:
+        file.write("{")
+    assert not is_seeds_result_actual(meta=meta, scenario=seeds_scenario.scenario)
+
+    seeds_scenario.build()
+    assert is_seeds_result_actual(meta=meta, scenario=seeds_scenario.scenario)
+
+    other_format = meta.model_copy(update={"dump_format": SeedsDumpFormat.JSONL})
+    assert not is_seeds_result_actual(meta=other_format, scenario=seeds_scenario.scenario)
+    assert get_seeds_file(seeds_scenario.scenario, SeedsDumpFormat.JSON).endswith("fake_scenario_seeds.json")
+
+
+def test_dump_built_for_another_gateway_is_not_actual():
+    gateway = FakeGateway()
+    seeds_scenario = FakeSeedsScenario(gateway)
+    seeds_scenario.build()
+
+    seeds_scenario.use_protocol(SeedsProtocol.HTTP)
+
+    assert seeds_scenario.meta.target != FakeSeedsScenario(gateway).meta.target
+    assert not is_seeds_result_actual(meta=seeds_scenario.meta, scenario=seeds_scenario.scenario)
@@ -0,0 +1,92 @@
+from seeds import sharding
+from seeds.schema.plan import SeedsPlan, SeedUsersPlan
+from seeds.schema.result import SeedsResult, SeedUserResult
+from seeds.sharding import (
+    SeedsShardAllocator,
+    build_sharded_seeds,
+    merge_seeds_results,
+    shard_seeds_plan,
+    shard_seeds_range,
+    shard_seeds_result
+)
+from tools.config.seeds import SeedsEngine, SeedsProtocol
+
+
+def test_allocator_partition_keeps_reserve_for_joining_workers():
+    allocator = SeedsShardAllocator(total=100, reserve=0.1)
+
+    shards = allocator.partition(["w1", "w2", "w3"])
+
+    assert shards == {"w1": range(0, 30), "w2": range(30, 60), "w3": range(60, 90)}
+    assert allocator.free == [range(90, 100)]
+
+
+def test_allocator_gives_joining_worker_only_unassigned_users():
+    allocator = SeedsShardAllocator(total=100, reserve=0.1)
+    shards = allocator.partition(["w1", "w2"])
+
+    joined = allocator.assign("w3", connected=["w1", "w2"])
+    later = allocator.assign("w4", connected=["w1", "w2", "w3"])
+
+    assert joined == range(90, 95)
+    assert later == range(95, 98)
+    # Диапазоны работающих воркеров не меняются и не пересекаются с новыми
+    assert allocator.assigned["w1"] == shards["w1"] and allocator.assigned["w2"] == shards["w2"]
+    used = [index for users in allocator.assigned.values() for index in users]
+    assert len(used) == len(set(used))
+
+
+def test_allocator_reuses_departed_worker_range_after_reserve():
+    allocator = SeedsShardAllocator(total=10, reserve=0.0)
+    allocator.partition(["w1", "w2"])
+
+    # Резерва нет, w2 отключился: новый воркер получает часть его диапазона, а не чужого работающего
+    joined = allocator.assign("w3", connected=["w1"])
+
+    assert joined == range(5, 8)
+    assert "w2" not in allocator.assigned
+    assert allocator.released == [range(8, 10)]
+
+
+def test_allocator_returns_empty_range_when_nothing_is_left():
+    allocator = SeedsShardAllocator(total=4, reserve=0.0)
+    allocator.partition(["w1", "w2"])
+
+    assert allocator.assign("w3", connected=["w1", "w2"]) == range(0)
+
+
+def test_shard_seeds_plan_splits_users_without_empty_shards():
+    plan = SeedsPlan(users=SeedUsersPlan(count=10))
+
+    assert [shard.users.count for shard in shard_seeds_plan(plan, 3)] == [4, 3, 3]
+    assert [shard.users.count for shard in shard_seeds_plan(plan, 20)] == [1] * 10
+
+
+def test_shard_seeds_result_and_merge_round_trip():
+    result = SeedsResult(users=[SeedUserResult(user_id=str(index)) for index in range(7)])
+
+    shards = [shard_seeds_result(result, shard_seeds_range(len(result.users), index, 3)) for index in range(3)]
+
+    assert [len(shard.users) for shard in shards] == [3, 2, 2]
+    assert merge_seeds_results(shards).users == result.users
+
+
+def test_build_sharded_seeds_splits_concurrency_across_processes(monkeypatch):
+    calls = []
+
+    def run_seeds_worker(plan, concurrency, **kwargs):
+        calls.append(concurrency)
+        return SeedsResult(users=[SeedUserResult(user_id=f"{concurrency}-{index}") for index in range(plan.users.count)])
+
+    monkeypatch.setattr(sharding, "run_seeds_worker", run_seeds_worker)
+
+    result = build_sharded_seeds(
+        plan=SeedsPlan(users=SeedUsersPlan(count=9)),
+        processes=3,
+        engine=SeedsEngine.GEVENT,
+        protocol=SeedsProtocol.GRPC,
+        concurrency=10
+    )
+
+    assert calls == [4, 3, 3]
+    assert len(result.users) == 9
@@ -0,0 +1,60 @@
+import gc
+from collections.abc import Callable
+from multiprocessing import resource_tracker
+from typing import TypeVar
+
+from seeds.schema.result import SeedsResult, SeedUserResult
+from seeds.shared import attach_seeds_result, publish_seeds_result, release_seeds_result
+
+T = TypeVar("T")
+
+
+def read_attached(name: str, read: Callable[[SeedsResult], T]) -> T:
+    """
+    Подключается к сегменту как воркер, читает из него и отключается.
+
+    В тесте мастер и воркер — один процесс, поэтому возвращаем регистрацию в resource_tracker,
+    которую снимает attach_seeds_result, а перед закрытием сегмента отпускаем все представления его памяти.
+    """
+    result = attach_seeds_result(name)
+    resource_tracker.register(f"/{name}", "shared_memory")
+
+    value = read(result)
+    memory = result.users.source
+    del result
+    gc.collect()
+    memory.close()
+    return value
+
+
+def test_shared_memory_round_trip(seed_users):
+    memory = publish_seeds_result(SeedsResult(users=seed_users))
+    assert memory is not None
+
+    try:
+        users, shard, first = read_attached(
+            memory.name,
+            lambda result: (list(result.users), list(result.users[10:15]), result.get_next_user())
+        )
+    finally:
+        release_seeds_result(memory)
+
+    assert users == seed_users
+    assert shard == seed_users[10:15]
+    assert first == seed_users[0]
+
+
+def test_shared_memory_publishes_empty_result():
+    memory = publish_seeds_result(SeedsResult(users=[]))
+    assert memory is not None
+
+    try:
+        assert read_attached(memory.name, lambda result: len(result.users)) == 0
+    finally:
+        release_seeds_result(memory)
+
+
+def test_shared_memory_skips_non_uuid_identifiers():
+    result = SeedsResult(users=[SeedUserResult(user_id="not-a-uuid")])
+
+    assert publish_seeds_result(result) is None
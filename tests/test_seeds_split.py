@@ -0,0 +1,86 @@
+import pytest
+
+from config import settings
+from seeds.builder import ConcurrentSeedsBuilder, SeedsBuilder, SplitSeedsBuilder, build_gateway_seeds_builder
+from seeds.schema.plan import SeedsPlan, SeedUsersPlan, SeedAccountsPlan
+from seeds.stats import SeedsStats
+from tests.gateway import FakeGateway
+from tests.test_seeds_scenario import FakeSeedsScenario
+from tools.config.seeds import SeedsProtocol
+
+
+def build_plan(users: int) -> SeedsPlan:
+    return SeedsPlan(users=SeedUsersPlan(count=users, savings_accounts=SeedAccountsPlan(count=1)))
+
+
+def test_split_builder_divides_plan_between_gateways():
+    grpc, http = FakeGateway(), FakeGateway()
+    builder = SplitSeedsBuilder(builders=[SeedsBuilder(**grpc.clients()), SeedsBuilder(**http.clients())])
+
+    result = builder.build(build_plan(users=7))
+
+    assert len(result.users) == 7
+    assert (grpc.calls["create_user"], http.calls["create_user"]) == (4, 3)
+    assert (grpc.calls["open_savings_account"], http.calls["open_savings_account"]) == (4, 3)
+    assert all(len(user.savings_accounts) == 1 for user in result.users)
+
+
+def test_split_builder_builds_parts_concurrently():
+    grpc, http = FakeGateway(latency=0.005), FakeGateway(latency=0.005)
+    builder = SplitSeedsBuilder(builders=[SeedsBuilder(**grpc.clients()), SeedsBuilder(**http.clients())])
+    in_flight: list[int] = []
+
+    original = grpc.start
+
+    def start(method: str) -> None:
+        original(method)
+        in_flight.append(grpc.in_flight + http.in_flight)
+
+    grpc.start = start
+    builder.build(build_plan(users=4))
+
+    assert max(in_flight) == 2
+
+
+def test_split_builder_shares_stats_between_builders():
+    grpc, http = FakeGateway(), FakeGateway()
+    builder = SplitSeedsBuilder(builders=[SeedsBuilder(**grpc.clients()), SeedsBuilder(**http.clients())])
+
+    builder.build(build_plan(users=4))
+    assert builder.stats.calls == grpc.calls.total() + http.calls.total()
+
+    stats = SeedsStats()
+    builder.stats = stats
+    assert all(part.stats is stats for part in builder.builders)
+
+
+def test_split_builder_propagates_errors_of_any_part():
+    grpc, http = FakeGateway(), FakeGateway(fail="create_user")
+    builder = SplitSeedsBuilder(builders=[SeedsBuilder(**grpc.clients()), SeedsBuilder(**http.clients())])
+
+    with pytest.raises(RuntimeError, match="create_user failed"):
+        builder.build(build_plan(users=4))
+
+
+def test_build_gateway_seeds_builder_for_split_protocol():
+    builder = build_gateway_seeds_builder(protocol=SeedsProtocol.SPLIT, concurrency=4)
+
+    assert isinstance(builder, SplitSeedsBuilder)
+    assert [type(part) for part in builder.builders] == [ConcurrentSeedsBuilder, ConcurrentSeedsBuilder]
+    assert [type(part.users_gateway_client).__name__ for part in builder.builders] == [
+        "UsersGatewayGRPCClient",
+        "UsersGatewayHTTPClient"
+    ]
+
+
+def test_split_dump_targets_both_gateways():
+    seeds_scenario = FakeSeedsScenario(FakeGateway())
+
+    seeds_scenario.protocol = SeedsProtocol.SPLIT
+    split = seeds_scenario.meta
+    seeds_scenario.protocol = SeedsProtocol.GRPC
+    grpc = seeds_scenario.meta
+
+    assert split.target == f"{settings.gateway_grpc_client.client_url} {settings.gateway_http_client.client_url}"
+    assert grpc.target == settings.gateway_grpc_client.client_url
+    assert split.plan_hash == grpc.plan_hash
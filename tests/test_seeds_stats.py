@@ -0,0 +1,22 @@
+import warnings
+
+from seeds.stats import SeedsMethodStats, round_response_time
+
+
+def test_round_response_time_returns_int_keys():
+    assert round_response_time(42.4) == 42
+    assert round_response_time(147.0) == 150
+    assert round_response_time(1249.0) == 1200
+    assert all(type(round_response_time(value)) is int for value in (42.4, 147.0, 1249.0))
+
+
+def test_method_stats_dump_without_serialization_warnings():
+    stats = SeedsMethodStats()
+    for response_time in (12.0, 147.0, 1249.0):
+        stats.record(response_time)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        dumped = stats.model_dump_json()
+
+    assert SeedsMethodStats.model_validate_json(dumped).response_times == {12: 1, 150: 1, 1200: 1}
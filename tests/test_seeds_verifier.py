@@ -0,0 +1,134 @@
+import pytest
+
+from config import settings
+from seeds import scenario as seeds_scenario_module
+from seeds.schema.result import SeedsResult, SeedUserResult
+from seeds.verifier import SeedsVerificationReport, SeedsVerifier, drop_stale_seeds
+from tests.gateway import FakeGateway
+from tests.test_seeds_scenario import FakeSeedsScenario
+from tools.config.seeds import SeedsVerifyConfig, SeedsVerifyMode
+
+
+class MemorySeedsVerifier(SeedsVerifier):
+    """
+    Проверяет дамп по множествам существующих сущностей вместо gateway.
+    """
+
+    def __init__(self, users: set[str], accounts: set[str], operations: set[str], concurrency: int = 4):
+        super().__init__(concurrency=concurrency)
+        self.users = users
+        self.accounts = accounts
+        self.operations = operations
+        self.checks: list[str] = []
+
+    def user_exists(self, user_id: str) -> bool:
+        self.checks.append(user_id)
+        return user_id in self.users
+
+    def get_account_ids(self, user_id: str) -> set[str] | None:
+        return self.accounts if user_id in self.users else None
+
+    def operation_exists(self, operation_id: str) -> bool:
+        return operation_id in self.operations
+
+
+def collect(seed_users: list[SeedUserResult]) -> tuple[set[str], set[str], set[str]]:
+    accounts = [
+        account
+        for user in seed_users
+        for account in user.savings_accounts + user.credit_card_accounts
+    ]
+    operations = {
+        operation.operation_id
+        for account in accounts
+        for operation in account.top_up_operations + account.purchase_operations + account.cash_withdrawal_operations
+    }
+    return {user.user_id for user in seed_users}, {account.account_id for account in accounts}, operations
+
+
+def test_verify_reports_nothing_for_actual_dump(seed_users):
+    verifier = MemorySeedsVerifier(*collect(seed_users))
+
+    report = verifier.verify(SeedsResult(users=seed_users))
+
+    assert report == SeedsVerificationReport(total=25, checked=25, stale_user_ids=[])
+    assert report.stale_fraction == 0.0
+
+
+def test_verify_finds_missing_users_accounts_and_operations(seed_users):
+    users, accounts, operations = collect(seed_users)
+    # Пользователь 1 удалён, у пользователя 2 пропал счёт, у пользователя 5 — операция
+    users.discard(seed_users[1].user_id)
+    accounts.discard(seed_users[2].credit_card_accounts[0].account_id)
+    operations.discard(seed_users[5].credit_card_accounts[0].purchase_operations[0].operation_id)
+    verifier = MemorySeedsVerifier(users, accounts, operations)
+
+    report = verifier.verify(SeedsResult(users=seed_users))
+
+    expected = {seed_users[index].user_id for index in (1, 2, 5)}
+    assert set(report.stale_user_ids) == expected
+    assert report.stale_fraction == pytest.approx(3 / 25)
+
+    without_operations = verifier.verify(SeedsResult(users=seed_users), operations=False)
+    assert set(without_operations.stale_user_ids) == expected - {seed_users[5].user_id}
+
+
+def test_verify_checks_only_sample(seed_users):
+    verifier = MemorySeedsVerifier(*collect(seed_users))
+
+    report = verifier.verify(SeedsResult(users=seed_users), sample=7)
+
+    assert (report.total, report.checked) == (25, 7)
+    assert len(set(verifier.checks)) == 7
+
+
+def test_drop_stale_seeds_keeps_order(seed_users):
+    report = SeedsVerificationReport(total=25, checked=25, stale_user_ids=[seed_users[0].user_id, seed_users[3].user_id])
+
+    result = drop_stale_seeds(SeedsResult(users=seed_users), report)
+
+    assert result.users == seed_users[1:3] + seed_users[4:]
+
+
+@pytest.fixture
+def verify_settings(monkeypatch):
+    def configure(**kwargs) -> None:
+        monkeypatch.setattr(settings.seeds, "verify", SeedsVerifyConfig(mode=SeedsVerifyMode.FULL, **kwargs))
+
+    return configure
+
+
+def test_scenario_drops_stale_users_from_reused_dump(tmp_path, monkeypatch, verify_settings):
+    monkeypatch.chdir(tmp_path)
+    verify_settings(rebuild_threshold=0.5)
+    gateway = FakeGateway()
+    FakeSeedsScenario(gateway, users=4).build()
+    seeded = FakeSeedsScenario(gateway, users=4).load().users
+
+    users, accounts, operations = collect(list(seeded))
+    users.discard(seeded[0].user_id)
+    verifier = MemorySeedsVerifier(users, accounts, operations)
+    monkeypatch.setattr(seeds_scenario_module, "build_grpc_seeds_verifier", lambda: verifier)
+    monkeypatch.setattr(seeds_scenario_module, "build_http_seeds_verifier", lambda: verifier)
+
+    FakeSeedsScenario(gateway, users=4).build()
+
+    assert gateway.calls["create_user"] == 4
+    assert [user.user_id for user in FakeSeedsScenario(gateway, users=4).load().users] == [
+        user.user_id for user in seeded[1:]
+    ]
+
+
+def test_scenario_rebuilds_mostly_stale_dump(tmp_path, monkeypatch, verify_settings):
+    monkeypatch.chdir(tmp_path)
+    verify_settings(rebuild_threshold=0.5)
+    gateway = FakeGateway()
+    FakeSeedsScenario(gateway, users=4).build()
+
+    verifier = MemorySeedsVerifier(users=set(), accounts=set(), operations=set())
+    monkeypatch.setattr(seeds_scenario_module, "build_grpc_seeds_verifier", lambda: verifier)
+    monkeypatch.setattr(seeds_scenario_module, "build_http_seeds_verifier", lambda: verifier)
+
+    FakeSeedsScenario(gateway, users=4).build()
+
+    assert gateway.calls["create_user"] == 8
@@ -0,0 +1,67 @@
+import os
+
+import gevent
+
+from tools.unique import ALPHABET, UniqueIdGenerator, to_base36
+
+
+def test_to_base36():
+    assert to_base36(0) == "0"
+    assert to_base36(35) == "z"
+    assert to_base36(36) == "10"
+    assert int(to_base36(2 ** 128 - 1), 36) == 2 ** 128 - 1
+    assert set(to_base36(123456789)) <= set(ALPHABET)
+
+
+def test_ids_are_unique_within_process():
+    generator = UniqueIdGenerator()
+
+    ids = [generator.next_id() for _ in range(10_000)]
+
+    assert len(set(ids)) == 10_000
+    assert {value.rsplit("-", 1)[0] for value in ids} == {generator.token}
+
+
+def test_ids_are_unique_across_greenlets():
+    generator = UniqueIdGenerator()
+
+    def draw() -> list[str]:
+        values = []
+        for _ in range(500):
+            values.append(generator.next_id())
+            gevent.sleep(0)
+        return values
+
+    greenlets = [gevent.spawn(draw) for _ in range(10)]
+    gevent.joinall(greenlets, raise_error=True)
+
+    ids = [value for greenlet in greenlets for value in greenlet.value]
+    assert len(set(ids)) == 5000
+
+
+def test_generators_get_distinct_tokens():
+    assert len({UniqueIdGenerator().token for _ in range(100)}) == 100
+
+
+def test_ids_are_unique_across_fork():
+    generator = UniqueIdGenerator()
+    parent = [generator.next_id() for _ in range(100)]
+
+    read, write = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.close(read)
+            os.write(write, "\n".join(generator.next_id() for _ in range(100)).encode())
+        finally:
+            os._exit(0)
+
+    os.close(write)
+    with os.fdopen(read, "rb") as file:
+        child = file.read().decode().split("\n")
+    os.waitpid(pid, 0)
+    parent += [generator.next_id() for _ in range(100)]
+
+    assert len(child) == 100
+    assert len(set(parent) | set(child)) == 300
+    assert child[0].rsplit("-", 1)[1] == "0"
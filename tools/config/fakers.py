@@ -0,0 +1,16 @@
+from pydantic import BaseModel
+
+
+class FakerConfig(BaseModel):
+    # Режим пулов: значения полей генерируются заранее и раздаются по кругу,
+    # вместо обращения к провайдерам Faker на каждый запрос
+    pool: bool = False
+
+    # Количество заранее сгенерированных значений каждого поля
+    pool_size: int = 10_000
+
+    # Перегенерировать пул поля в фоне после каждого полного круга, чтобы значения не повторялись бесконечно
+    pool_refill: bool = False
+
+    # Сколько значений генерируется между переключениями greenlet'ов при фоновой перегенерации
+    pool_refill_chunk: int = 500
@@ -1,10 +1,56 @@
-from pydantic import BaseModel, HttpUrl
+from enum import StrEnum
+from typing import Self
+
+from httpx import Limits
+from pydantic import BaseModel, HttpUrl, model_validator
+
+
+class HTTPClientBackend(StrEnum):
+    # httpx.Client: HTTP/2, хуки, полный стек httpcore
+    HTTPX = "httpx"
+    # geventhttpclient (как FastHttpUser в Locust): в разы меньше CPU на запрос, только HTTP/1.1
+    GEVENT = "geventhttpclient"
+
+
+# Размер пула geventhttpclient, когда max_connections не ограничен: пул требует конечного значения
+MAX_GEVENT_CONNECTIONS = 10_000
 
 
 class HTTPClientConfig(BaseModel):
     url: HttpUrl
     timeout: float = 100.0
 
+    # Реализация HTTP-клиента для синхронных клиентов gateway (Locust и сидинг)
+    backend: HTTPClientBackend = HTTPClientBackend.HTTPX
+
+    # HTTP/2: по http:// — h2c без TLS (prior knowledge), по https:// — согласование через ALPN.
+    # Все запросы процесса мультиплексируются в нескольких соединениях. Требует пакет h2
+    http2: bool = False
+
+    # Максимум соединений в пуле (None — без ограничения).
+    # Для geventhttpclient без ограничения берётся MAX_GEVENT_CONNECTIONS.
+    # При исчерпании запрос ждёт свободное соединение, и это ожидание попадает во время ответа,
+    # поэтому ограничивайте только с запасом
+    max_connections: int | None = None
+
+    # Сколько простаивающих соединений держать открытыми для повторного использования (None — все).
+    # httpcore сравнивает лимит с общим числом соединений пула, а не только простаивающих,
+    # поэтому значение меньше пикового числа одновременных запросов приводит к постоянному переоткрытию соединений
+    max_keepalive_connections: int | None = None
+
+    # Через сколько секунд простоя keep-alive соединение закрывается
+    keepalive_expiry: float | None = 5.0
+
+    @model_validator(mode="after")
+    def check_backend_http2(self) -> Self:
+        """
+        geventhttpclient говорит только на HTTP/1.1: не даём молча проигнорировать http2.
+        """
+        if self.http2 and self.backend == HTTPClientBackend.GEVENT:
+            raise ValueError("http2 is not supported by the geventhttpclient backend, use backend=httpx")
+
+        return self
+
     @property
     def client_url(self) -> str:
         """
@@ -16,3 +62,22 @@ class HTTPClientConfig(BaseModel):
         - Если передать HttpUrl напрямую, будет ошибка типов.
         """
         return str(self.url)
+
+    @property
+    def http1(self) -> bool:
+        """
+        Разрешён ли HTTP/1.1. Для h2c (HTTP/2 по http://) его нужно отключить:
+        без TLS httpx не согласовывает протокол и иначе всегда говорит на HTTP/1.1.
+        """
+        return not (self.http2 and self.url.scheme == "http")
+
+    @property
+    def limits(self) -> Limits:
+        """
+        Возвращает лимиты пула соединений в виде httpx.Limits.
+        """
+        return Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry
+        )
@@ -0,0 +1,168 @@
+from enum import StrEnum
+
+from pydantic import BaseModel, Field, PositiveInt
+
+
+class SeedsEngine(StrEnum):
+    # Синхронные клиенты + greenlet'ы gevent (работает внутри процесса Locust)
+    GEVENT = "gevent"
+    # grpc.aio / httpx.AsyncClient в отдельном процессе без monkey-patching
+    ASYNCIO = "asyncio"
+    # Конвейер стадий на gevent: пользователи, счета, карты и операции строятся независимыми стадиями
+    PIPELINE = "pipeline"
+
+
+class SeedsProtocol(StrEnum):
+    GRPC = "grpc"
+    HTTP = "http"
+    # Пользователи делятся поровну между gRPC и HTTP gateway и создаются через оба одновременно
+    SPLIT = "split"
+
+
+class SeedsDumpFormat(StrEnum):
+    # Один JSON-документ, целиком читается и валидируется при загрузке
+    JSON = "json"
+    # Строка на пользователя + индекс смещений, пользователи разбираются лениво при выдаче
+    JSONL = "jsonl"
+    # Колоночный бинарный формат с 16-байтовыми UUID, читается через mmap лениво
+    BINARY = "bin"
+
+
+class SeedsExhaustionPolicy(StrEnum):
+    # Бросить SeedsExhaustedError, когда все пользователи выданы
+    RAISE = "raise"
+    # Начать раздачу пользователей сначала
+    WRAP = "wrap"
+    # Досоздать новую партию пользователей через билдер
+    REFILL = "refill"
+
+
+class SeedsSamplerKind(StrEnum):
+    # Все пользователи выбираются с равной вероятностью
+    UNIFORM = "uniform"
+    # Вероятность пользователя убывает по закону Ципфа от его номера
+    ZIPF = "zipf"
+    # Небольшая доля «горячих» пользователей получает большую часть трафика
+    HOT_SET = "hot_set"
+    # Веса пользователей читаются из файла
+    FILE = "file"
+
+
+class SeedsSamplerConfig(BaseModel):
+    # Распределение, по которому get_random_user выбирает пользователей
+    kind: SeedsSamplerKind = SeedsSamplerKind.UNIFORM
+
+    # Показатель степени распределения Ципфа (вес пользователя с номером k равен 1 / k^exponent)
+    exponent: float = 1.0
+
+    # Доля «горячих» пользователей и доля трафика, которая на них приходится
+    hot_fraction: float = 0.2
+    hot_traffic: float = 0.8
+
+    # Файл с весами пользователей: по одному числу на строку, в порядке пользователей дампа
+    weights_file: str | None = None
+
+
+class SeedsPipelineConfig(BaseModel):
+    # Количество одновременных запросов на каждой стадии конвейерного сидинга.
+    # Стадия без воркеров никогда не опустеет, поэтому лимит должен быть не меньше 1
+    users: PositiveInt = 10
+    accounts: PositiveInt = 20
+    cards: PositiveInt = 20
+    operations: PositiveInt = 50
+
+
+class SeedsVerifyMode(StrEnum):
+    # Дамп не проверяется
+    NONE = "none"
+    # Проверяется случайная выборка пользователей
+    SAMPLE = "sample"
+    # Проверяются все пользователи
+    FULL = "full"
+
+
+class SeedsVerifyConfig(BaseModel):
+    # Проверять ли переиспользуемый дамп на устаревшие сущности перед запуском теста
+    mode: SeedsVerifyMode = SeedsVerifyMode.NONE
+
+    # Размер выборки для режима sample
+    sample: int = 100
+
+    # Количество одновременных проверочных запросов к gateway
+    concurrency: int = 20
+
+    # Проверять каждую операцию (дороже) или только пользователей и их счета
+    operations: bool = True
+
+    # При доле устаревших пользователей не ниже порога дамп пересоздаётся целиком,
+    # иначе из него удаляются только найденные устаревшие пользователи
+    rebuild_threshold: float = 0.5
+
+
+class SeedsReplenishConfig(BaseModel):
+    # Досоздавать пользователей в фоне во время теста, пока get_next_user их расходует
+    enabled: bool = False
+
+    # Пополнение начинается, когда невыданных пользователей остаётся меньше этого порога
+    low_water: int = 50
+
+    # Сколько пользователей досоздаётся за одну партию
+    batch_size: int = 50
+
+    # Лимит одновременных запросов фонового сидинга; держите небольшим, чтобы не искажать нагрузку
+    concurrency: int = 1
+
+    # Пауза между проверками остатка и между партиями, в секундах
+    interval: float = 1.0
+
+
+class SeedsConfig(BaseModel):
+    # Максимальное количество одновременных запросов к gateway во время сидинга.
+    # Значение 1 оставляет последовательный сидинг (один запрос за раз).
+    concurrency: int = 1
+
+    # Протокол gateway, через который создаются данные (можно переопределить опцией Locust --seeds-protocol).
+    protocol: SeedsProtocol = SeedsProtocol.GRPC
+
+    # Движок сидинга. Для asyncio разумны значения concurrency в сотни и тысячи запросов.
+    engine: SeedsEngine = SeedsEngine.GEVENT
+
+    # Количество процессов-воркеров, между которыми делится план. При 1 сидинг идёт в текущем процессе.
+    # Лимит concurrency общий: он делится между процессами, а не действует в каждом.
+    processes: PositiveInt = 1
+
+    # Продолжать прерванный сидинг с журнала ./dumps/<scenario>_seeds.journal.jsonl,
+    # а не генерировать всех пользователей заново.
+    resume: bool = True
+
+    # Пересоздавать данные, даже если дамп уже построен по тому же плану для того же gateway.
+    force: bool = False
+
+    # Формат дампа сидинга. Для многомиллионных наборов данных используйте jsonl или bin.
+    dump_format: SeedsDumpFormat = SeedsDumpFormat.JSON
+
+    # Что делает get_next_user, когда все пользователи из дампа уже выданы.
+    exhaustion_policy: SeedsExhaustionPolicy = SeedsExhaustionPolicy.RAISE
+
+    # Сколько пользователей досоздаётся за раз при политике refill.
+    refill_size: int = 100
+
+    # Публиковать дамп в разделяемую память, чтобы воркеры Locust на той же машине (--processes)
+    # читали одну копию пользователей вместо собственной.
+    shared_memory: bool = True
+
+    # Доля пользователей, которую мастер Locust откладывает при старте теста для воркеров,
+    # подключающихся во время теста. Без резерва такие воркеры получат только пользователей отключившихся.
+    shard_reserve: float = Field(default=0.1, ge=0, lt=1)
+
+    # Распределение выбора случайного пользователя в сценариях.
+    sampler: SeedsSamplerConfig = Field(default_factory=SeedsSamplerConfig)
+
+    # Лимиты стадий для движка pipeline; общий лимит запросов равен их сумме.
+    pipeline: SeedsPipelineConfig = Field(default_factory=SeedsPipelineConfig)
+
+    # Проверка переиспользуемого дампа на устаревшие данные.
+    verify: SeedsVerifyConfig = Field(default_factory=SeedsVerifyConfig)
+
+    # Фоновое пополнение пользователей в долгих тестах.
+    replenish: SeedsReplenishConfig = Field(default_factory=SeedsReplenishConfig)
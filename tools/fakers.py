@@ -1,20 +1,51 @@
-import time
+import copy
+import random
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator
 
+import gevent
 from faker import Faker
 from faker.providers.python import TEnum
 from google.protobuf.internal.enum_type_wrapper import EnumTypeWrapper
 
+from config import settings
+from tools.config.fakers import FakerConfig
+from tools.unique import UniqueIdGenerator, unique_ids
+
 
 class Fake:
     """
     Класс для генерации случайных тестовых данных с использованием библиотеки Faker.
     """
 
-    def __init__(self, faker: Faker):
+    def __init__(self, faker: Faker, ids: UniqueIdGenerator = unique_ids):
         """
         :param faker: Экземпляр класса Faker, который будет использоваться для генерации данных.
+        :param ids: Генератор уникальных идентификаторов для полей, которые не должны повторяться.
         """
         self.faker = faker
+        self.ids = ids
+
+    def seed(self, seed: int | str) -> None:
+        """
+        Засевает генератор, чтобы последовательность данных повторялась от прогона к прогону.
+        Уникальные идентификаторы (unique_id) не засеваются: они должны различаться между прогонами.
+
+        :param seed: Зерно генератора.
+        """
+        self.faker.seed_instance(seed)
+
+    def derive(self, seed: int | str) -> "Fake":
+        """
+        Создаёт независимый генератор с собственным зерном, например для одного виртуального пользователя.
+        Генератор уникальных идентификаторов остаётся общим.
+
+        :param seed: Зерно нового генератора.
+        :return: Новый экземпляр Fake.
+        """
+        faker = Faker()
+        faker.seed_instance(seed)
+        return Fake(faker=faker, ids=self.ids)
 
     def enum(self, value: type[TEnum]) -> TEnum:
         """
@@ -34,14 +65,22 @@ class Fake:
         """
         return self.faker.random_element(value.values())
 
+    def unique_id(self) -> str:
+        """
+        Генерирует идентификатор, уникальный среди всех процессов и воркеров Locust.
+
+        :return: Уникальная строка из латинских букв, цифр и дефиса.
+        """
+        return self.ids.next_id()
+
     def email(self) -> str:
         """
-        Генерирует случайный email.
+        Генерирует случайный уникальный email.
 
         Если не указан, будет использован случайный домен.
-        :return: Случайный email.
+        :return: Случайный email с уникальным префиксом (см. unique_id).
         """
-        return f"{time.time()}.{self.faker.email()}"
+        return f"{self.ids.next_id()}.{self.faker.email()}"
 
     def category(self) -> str:
         """
@@ -123,4 +162,181 @@ class Fake:
         return self.float(1, 1000)
 
 
-fake = Fake(faker=Faker())
+class PooledFake(Fake):
+    """
+    Fake в режиме пулов: значения полей генерируются заранее большими массивами
+    и раздаются по кругу, поэтому стоимость вызова сводится к переходу к следующему элементу.
+
+    После каждого полного круга пул поля может перегенерироваться в фоновом greenlet'е
+    (см. refill): до готовности нового массива раздаётся прежний.
+    Уникальный префикс email добавляется при каждом вызове, поэтому повтор пула не даёт дублей.
+    """
+
+    def __init__(self, faker: Faker, size: int, refill: bool = False, refill_chunk: int = 500):
+        """
+        :param faker: Экземпляр класса Faker, который будет использоваться для генерации данных.
+        :param size: Количество значений в пуле каждого поля.
+        :param refill: Перегенерировать пул поля в фоне после каждого полного круга.
+        :param refill_chunk: Сколько значений генерируется между переключениями greenlet'ов при перегенерации.
+        """
+        super().__init__(faker=faker)
+        self.size = size
+        self.refill_enabled = refill
+        self.refill_chunk = refill_chunk
+        self.generators: dict[str, Callable[[], str | float]] = {
+            "email": self.faker.email,
+            "category": super().category,
+            "last_name": self.faker.last_name,
+            "first_name": self.faker.first_name,
+            "middle_name": self.faker.first_name,
+            "phone_number": self.faker.phone_number,
+            "amount": super().amount,
+        }
+        self.values = {name: [generate() for _ in range(size)] for name, generate in self.generators.items()}
+        self.refilling: set[str] = set()
+        self.rings = {name: self.ring(name) for name in self.generators}
+
+    def seed(self, seed: int | str) -> None:
+        """
+        Засевает генератор и перегенерирует пулы, чтобы раздаваемые значения повторялись от прогона к прогону.
+
+        Фоновая перегенерация отключается: момент подмены пула зависит от порядка запросов,
+        и последовательности данных перестали бы повторяться.
+
+        :param seed: Зерно генератора.
+        """
+        super().seed(seed)
+        self.refill_enabled = False
+        self.values = {name: [generate() for _ in range(self.size)] for name, generate in self.generators.items()}
+        self.rings = {name: self.ring(name) for name in self.generators}
+
+    def derive(self, seed: int | str) -> "PooledFake":
+        """
+        Создаёт генератор с собственным зерном, раздающий значения из тех же пулов.
+
+        Пулы не копируются: новый генератор проходит их своими кругами, начиная с позиций,
+        выбранных по зерну. Значения вне пулов (enum, proto_enum, float) берутся из собственного Faker.
+
+        :param seed: Зерно нового генератора.
+        :return: Новый экземпляр PooledFake.
+        """
+        derived = copy.copy(self)
+        derived.faker = Faker()
+        derived.faker.seed_instance(seed)
+        offsets = random.Random(seed)
+        derived.rings = {name: derived.ring(name, start=offsets.randrange(self.size)) for name in self.generators}
+        return derived
+
+    def ring(self, name: str, start: int = 0) -> Iterator[str | float]:
+        """
+        Бесконечно раздаёт значения пула поля по кругу.
+
+        :param name: Имя поля.
+        :param start: Позиция в пуле, с которой начинается первый круг.
+        """
+        while True:
+            values = self.values[name]
+            for index in range(start, len(values)):
+                yield values[index]
+            start = 0
+            if self.refill_enabled and name not in self.refilling:
+                self.refilling.add(name)
+                gevent.spawn(self.refill, name)
+
+    def refill(self, name: str) -> None:
+        """
+        Перегенерирует пул поля частями, уступая управление между частями,
+        чтобы генерация не задерживала запросы виртуальных пользователей.
+
+        :param name: Имя поля.
+        """
+        try:
+            generate = self.generators[name]
+            values = []
+            while len(values) < self.size:
+                values.extend(generate() for _ in range(min(self.refill_chunk, self.size - len(values))))
+                gevent.sleep(0)
+            self.values[name] = values
+        finally:
+            self.refilling.discard(name)
+
+    def email(self) -> str:
+        return f"{self.ids.next_id()}.{next(self.rings['email'])}"
+
+    def category(self) -> str:
+        return next(self.rings["category"])
+
+    def last_name(self) -> str:
+        return next(self.rings["last_name"])
+
+    def first_name(self) -> str:
+        return next(self.rings["first_name"])
+
+    def middle_name(self) -> str:
+        return next(self.rings["middle_name"])
+
+    def phone_number(self) -> str:
+        return next(self.rings["phone_number"])
+
+    def amount(self) -> float:
+        return next(self.rings["amount"])
+
+
+def build_fake(config: FakerConfig = settings.faker) -> Fake:
+    """
+    Фабрика для создания генератора тестовых данных.
+
+    :param config: Настройки генерации: при включённом FAKER.POOL создаётся PooledFake.
+    :return: Экземпляр Fake.
+    """
+    if config.pool:
+        return PooledFake(
+            faker=Faker(),
+            size=config.pool_size,
+            refill=config.pool_refill,
+            refill_chunk=config.pool_refill_chunk
+        )
+
+    return Fake(faker=Faker())
+
+
+# Генератор тестовых данных, привязанный к текущему greenlet'у (см. use_fake)
+current_fake: ContextVar[Fake] = ContextVar("current_fake")
+
+
+def use_fake(value: Fake) -> None:
+    """
+    Привязывает генератор тестовых данных к текущему greenlet'у: вызовы fake в нём уходят в value.
+    Новые greenlet'ы начинают с пустого контекста и используют общий генератор процесса.
+
+    :param value: Генератор, например собственный генератор виртуального пользователя.
+    """
+    current_fake.set(value)
+
+
+class ContextFake:
+    """
+    Точка доступа к генератору тестовых данных текущего контекста.
+
+    Вызов метода уходит в генератор, привязанный к greenlet'у через use_fake
+    (у каждого виртуального пользователя Locust при заданном RUN_SEED — свой),
+    а вне таких greenlet'ов — в общий генератор процесса default.
+    Генератор выбирается в момент вызова, поэтому методы можно передавать как default_factory.
+
+    Attributes:
+        default: Общий генератор процесса.
+    """
+
+    def __init__(self, default: Fake):
+        self.default = default
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        def call(*args: Any, **kwargs: Any) -> Any:
+            return getattr(current_fake.get(self.default), name)(*args, **kwargs)
+
+        # Функция кэшируется в экземпляре, следующие обращения не доходят до __getattr__
+        setattr(self, name, call)
+        return call
+
+
+fake = ContextFake(default=build_fake())
@@ -1,16 +1,82 @@
-from locust import User, between
+import random
+from itertools import count
+from typing import Any
+
+from locust import User, events
+from locust.env import Environment
 
 from config import settings
+from tools.fakers import Fake, fake, use_fake
+
+# Порядковые номера виртуальных пользователей процесса; вместе с номером воркера задают зерно пользователя
+user_indexes = count()
+
+
+def get_worker_index(environment: Environment) -> int:
+    """
+    Номер воркера Locust; 0 для локального запуска и мастера.
+    """
+    return max(getattr(environment.runner, "worker_index", 0), 0)
+
+
+def build_run_random(*parts: Any) -> random.Random:
+    """
+    Создаёт генератор случайных чисел, воспроизводимый между прогонами.
+
+    Зерно складывается из настройки RUN_SEED и переданных частей (номер воркера, номер пользователя),
+    поэтому у разных виртуальных пользователей последовательности разные, но одинаковые от прогона к прогону.
+    Без RUN_SEED генератор инициализируется случайно.
+
+    :param parts: Части зерна.
+    :return: Экземпляр random.Random.
+    """
+    if settings.run_seed is None:
+        return random.Random()
+
+    return random.Random(":".join(map(str, (settings.run_seed, *parts))))
+
+
+@events.test_start.add_listener
+def seed_run(environment: Environment, **kwargs: Any) -> None:
+    """
+    При старте теста сбрасывает нумерацию виртуальных пользователей и, если задан RUN_SEED,
+    засевает общий генератор тестовых данных процесса зерном прогона и номером воркера.
+    Виртуальные пользователи получают собственные генераторы (см. LocustBaseUser.fake).
+    """
+    global user_indexes
+    user_indexes = count()
+    if settings.run_seed is not None:
+        fake.default.seed(f"{settings.run_seed}:{get_worker_index(environment)}")
 
 
 class LocustBaseUser(User):
     """
     Базовый виртуальный пользователь Locust, от которого наследуются все сценарии.
     Содержит общие настройки, которые могут быть переопределены при необходимости.
+
+    Каждый пользователь получает собственный генератор self.random (см. build_run_random):
+    через него выбираются задачи, паузы между ними и пользователи из сидинга.
+    При заданном RUN_SEED у пользователя есть и собственный генератор тестовых данных self.fake,
+    засеянный из self.random, поэтому прогоны воспроизводимы для каждого пользователя
+    независимо от того, в каком порядке greenlet'ы обращаются к генераторам.
     """
     host: str = "localhost"
     abstract = True
-    wait_time = between(
-        min_wait=settings.locust_user.wait_time_min,
-        max_wait=settings.locust_user.wait_time_max
-    )
+
+    def __init__(self, environment: Environment):
+        super().__init__(environment)
+        self.random = build_run_random(get_worker_index(environment), next(user_indexes))
+        self.fake: Fake = fake.default
+        if settings.run_seed is not None:
+            self.fake = fake.default.derive(self.random.getrandbits(64))
+
+    def run(self) -> None:
+        # Пользователь работает в собственном greenlet'е: вызовы fake в его задачах уходят в self.fake
+        use_fake(self.fake)
+        super().run()
+
+    def wait_time(self) -> float:
+        """
+        Пауза между задачами от LOCUST_USER.WAIT_TIME_MIN до LOCUST_USER.WAIT_TIME_MAX секунд.
+        """
+        return self.random.uniform(settings.locust_user.wait_time_min, settings.locust_user.wait_time_max)
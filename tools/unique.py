@@ -0,0 +1,53 @@
+import os
+import uuid
+from itertools import count
+
+# Алфавит для компактной записи токена процесса
+ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+
+def to_base36(value: int) -> str:
+    """
+    Записывает неотрицательное число в системе счисления с основанием 36.
+    """
+    digits = []
+    while True:
+        value, digit = divmod(value, 36)
+        digits.append(ALPHABET[digit])
+        if value == 0:
+            return "".join(reversed(digits))
+
+
+class UniqueIdGenerator:
+    """
+    Генератор уникальных идентификаторов для полей тестовых данных (email и т.п.).
+
+    Идентификатор — токен процесса и номер вызова в этом процессе. Токен строится из uuid1
+    (MAC-адрес машины, время с точностью до 100 нс и случайная clock sequence), поэтому
+    процессы на разных машинах и воркеры Locust на одной машине получают разные токены
+    без какой-либо координации. Номер вызова — счётчик itertools.count, так что вызов
+    стоит одного инкремента и форматирования строки.
+
+    После fork (воркеры Locust с --processes) токен и счётчик пересоздаются в дочернем
+    процессе, иначе дочерние процессы продолжили бы ту же последовательность.
+    """
+
+    def __init__(self):
+        self.reset()
+        os.register_at_fork(after_in_child=self.reset)
+
+    def reset(self) -> None:
+        """
+        Выпускает новый токен процесса и начинает счётчик заново.
+        """
+        self.token = to_base36(uuid.uuid1().int)
+        self.counter = count()
+
+    def next_id(self) -> str:
+        """
+        Возвращает следующий уникальный идентификатор, например "3ks0e1xq9x2b7kzv8a5w1o6c4-1f".
+        """
+        return f"{self.token}-{next(self.counter):x}"
+
+
+unique_ids = UniqueIdGenerator()